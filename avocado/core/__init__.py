@@ -251,6 +251,33 @@ def register_core_options():
         help_msg=help_msg,
     )
 
+    help_msg = (
+        "Number of processes used to resolve test references in "
+        "parallel. 1 (the default) resolves them in the main process, "
+        "and 0 uses one process per CPU."
+    )
+    stgs.register_option(
+        section="resolver",
+        key="parallel",
+        key_type=int,
+        default=1,
+        help_msg=help_msg,
+    )
+
+    help_msg = (
+        "Whether to keep the tests found on Python modules in a cache, "
+        "under the data directory, so that they're not searched for again "
+        'until the modules change.  It can be cleared with "avocado cache '
+        'clear safeloader".'
+    )
+    stgs.register_option(
+        section="resolver",
+        key="safeloader_cache",
+        key_type=bool,
+        default=True,
+        help_msg=help_msg,
+    )
+
     help_msg = (
         "Selects the runner implementation from one of the "
         "installed and active implementations.  You can run "
@@ -18,6 +18,7 @@ Test requirements module.
 
 import os
 import sqlite3
+import threading
 
 from avocado.core.data_dir import get_datafile_path
 
@@ -62,34 +63,124 @@ SCHEMA = [
 ]
 
 
-def _create_requirement_cache_db():
-    os.makedirs(os.path.dirname(CACHE_DATABASE_PATH), exist_ok=True)
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        for entry in SCHEMA:
-            _ = cursor.execute(entry)
-        conn.commit()
+class _Database:
+    """A long lived connection to the cache database.
+
+    Besides the connection, it keeps in memory the requirements that are
+    known to be saved, so that checking them again doesn't need to touch
+    the database.  Only the saved ones are kept, because the others are
+    the ones whose state may be changed by other Avocado processes while
+    this one waits for them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(
+            path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False
+        )
+        # let other processes read the cache while this one writes to it
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            for entry in SCHEMA:
+                self.connection.execute(entry)
+        #: (environment_type, environment, requirement_type, requirement)
+        #: of the requirements known to be saved
+        self.saved = set()
+        #: (environment_type, environment) whose saved requirements were
+        #: all loaded into :attr:`saved`
+        self.loaded_environments = set()
+
+    def load_environment(self, environment_type, environment):
+        """Loads all the saved requirements of an environment at once."""
+        if (environment_type, environment) in self.loaded_environments:
+            return
+        sql = (
+            "SELECT requirement_type, requirement FROM requirement WHERE ("
+            "environment_type = ? AND "
+            "environment = ? AND "
+            "saved = 1)"
+        )
+        for requirement_type, requirement in self.connection.execute(
+            sql, (environment_type, environment)
+        ):
+            self.saved.add(
+                (environment_type, environment, requirement_type, requirement)
+            )
+        self.loaded_environments.add((environment_type, environment))
+
+    def forget(self):
+        """Drops what's kept in memory."""
+        self.saved.clear()
+        self.loaded_environments.clear()
+
+    def close(self):
+        self.connection.close()
+
+
+_DATABASE = None
+_DATABASE_LOCK = threading.Lock()
+
+
+def _get_database(create=True):
+    """Returns the database at :data:`CACHE_DATABASE_PATH`.
+
+    :param create: whether to create the database if it doesn't exist
+    :type create: bool
+    :rtype: :class:`_Database` or None if it doesn't exist and should
+            not be created
+    """
+    global _DATABASE  # pylint: disable=W0603
+    with _DATABASE_LOCK:
+        if _DATABASE is not None and _DATABASE.path == CACHE_DATABASE_PATH:
+            return _DATABASE
+        if not create and not os.path.exists(CACHE_DATABASE_PATH):
+            return None
+        if _DATABASE is not None:
+            _DATABASE.close()
+        os.makedirs(os.path.dirname(CACHE_DATABASE_PATH), exist_ok=True)
+        _DATABASE = _Database(CACHE_DATABASE_PATH)
+        return _DATABASE
+
+
+def close():
+    """Closes the connection to the cache database, if one is open."""
+    global _DATABASE  # pylint: disable=W0603
+    with _DATABASE_LOCK:
+        if _DATABASE is not None:
+            _DATABASE.close()
+            _DATABASE = None
+
+
+def delete_database():
+    """Closes and removes the cache database, including WAL files."""
+    close()
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(f"{CACHE_DATABASE_PATH}{suffix}")
+        except FileNotFoundError:
+            pass
 
 
 def set_requirement(
     environment_type, environment, requirement_type, requirement, saved=True
 ):
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        _create_requirement_cache_db()
-
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
+    database = _get_database()
+    with database.lock, database.connection as conn:
         sql = "INSERT OR IGNORE INTO environment_type VALUES (?)"
-        cursor.execute(sql, (environment_type,))
+        conn.execute(sql, (environment_type,))
         sql = "INSERT OR IGNORE INTO environment VALUES (?, ?)"
-        cursor.execute(sql, (environment_type, environment))
+        conn.execute(sql, (environment_type, environment))
         sql = "INSERT OR IGNORE INTO requirement_type VALUES (?)"
-        cursor.execute(sql, (requirement_type,))
+        conn.execute(sql, (requirement_type,))
         sql = "INSERT OR IGNORE INTO requirement VALUES (?, ?, ?, ?, ?)"
-        cursor.execute(
+        inserted = conn.execute(
             sql, (environment_type, environment, requirement_type, requirement, saved)
+        ).rowcount
+    if inserted and saved:
+        database.saved.add(
+            (environment_type, environment, requirement_type, requirement)
         )
-        conn.commit()
 
 
 def is_requirement_in_cache(
@@ -97,38 +188,44 @@ def is_requirement_in_cache(
 ):
     """Checks if requirement is in cache.
 
+    All the saved requirements of the environment are looked up at once,
+    the first time one of them is checked, and remembered afterwards.
+
     :rtype: True if requirement is in cache
             False if requirement is not in cache
             None if requirement is in cache but it is not saved yet.
     """
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return False
 
-    sql = (
-        "SELECT r.saved FROM requirement r WHERE ("
-        "environment_type = ? AND "
-        "environment = ? AND "
-        "requirement_type = ? AND "
-        "requirement = ?)"
-    )
+    key = (environment_type, environment, requirement_type, requirement)
+    with database.lock:
+        database.load_environment(environment_type, environment)
+        if key in database.saved:
+            return True
 
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(
-            sql, (environment_type, environment, requirement_type, requirement)
+        sql = (
+            "SELECT r.saved FROM requirement r WHERE ("
+            "environment_type = ? AND "
+            "environment = ? AND "
+            "requirement_type = ? AND "
+            "requirement = ?)"
         )
-        row = result.fetchone()
-        if row is not None:
-            if row[0]:
-                return True
-            return None
+        row = database.connection.execute(sql, key).fetchone()
+    if row is not None:
+        if row[0]:
+            database.saved.add(key)
+            return True
+        return None
     return False
 
 
 def is_environment_prepared(environment):
     """Checks if environment has all requirements saved."""
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return False
 
     sql = (
@@ -138,15 +235,10 @@ def is_environment_prepared(environment):
         "r.saved = 0)"
     )
 
-    with sqlite3.connect(
-        CACHE_DATABASE_PATH, detect_types=sqlite3.PARSE_DECLTYPES
-    ) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(sql, (environment,))
-
-        row = result.fetchone()
-        if row is not None:
-            return row[0] == 0
+    with database.lock:
+        row = database.connection.execute(sql, (environment,)).fetchone()
+    if row is not None:
+        return row[0] == 0
     return False
 
 
@@ -163,13 +255,13 @@ def update_environment(environment_type, old_environment, new_environment):
                             old one.
     :type environment: str
     """
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return False
 
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
+    with database.lock, database.connection as conn:
         sql = "INSERT OR IGNORE INTO environment VALUES (?, ?)"
-        cursor.execute(sql, (environment_type, new_environment))
+        conn.execute(sql, (environment_type, new_environment))
 
         sql = (
             "UPDATE requirement SET environment = ? WHERE ("
@@ -177,7 +269,7 @@ def update_environment(environment_type, old_environment, new_environment):
             "environment = ? )"
         )
 
-        cursor.execute(sql, (new_environment, environment_type, old_environment))
+        conn.execute(sql, (new_environment, environment_type, old_environment))
 
         sql = (
             "DELETE FROM environment WHERE ("
@@ -185,8 +277,8 @@ def update_environment(environment_type, old_environment, new_environment):
             "environment = ? )"
         )
 
-        cursor.execute(sql, (environment_type, old_environment))
-        conn.commit()
+        conn.execute(sql, (environment_type, old_environment))
+        database.forget()
 
 
 def update_requirement_status(
@@ -208,7 +300,8 @@ def update_requirement_status(
     :type new_status: bool
     """
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return False
 
     sql = (
@@ -219,13 +312,13 @@ def update_requirement_status(
         "requirement = ?)"
     )
 
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            sql,
-            (new_status, environment_type, environment, requirement_type, requirement),
-        )
-        conn.commit()
+    key = (environment_type, environment, requirement_type, requirement)
+    with database.lock, database.connection as conn:
+        updated = conn.execute(sql, (new_status,) + key).rowcount
+        if new_status and updated:
+            database.saved.add(key)
+        else:
+            database.saved.discard(key)
 
     return True
 
@@ -239,24 +332,24 @@ def delete_environment(environment_type, environment):
     :type environment: str
     """
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return False
 
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
+    with database.lock, database.connection as conn:
         sql = (
             "DELETE FROM requirement WHERE ("
             "environment_type = ? AND "
             "environment = ? )"
         )
-        cursor = conn.cursor()
-        cursor.execute(sql, (environment_type, environment))
+        conn.execute(sql, (environment_type, environment))
         sql = (
             "DELETE FROM environment WHERE ("
             "environment_type = ? AND "
             "environment = ? )"
         )
-        cursor.execute(sql, (environment_type, environment))
-        conn.commit()
+        conn.execute(sql, (environment_type, environment))
+        database.forget()
 
 
 def delete_requirement(environment_type, environment, requirement_type, requirement):
@@ -272,10 +365,12 @@ def delete_requirement(environment_type, environment, requirement_type, requirem
     :type requirement: str
     """
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return False
 
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
+    key = (environment_type, environment, requirement_type, requirement)
+    with database.lock, database.connection as conn:
         sql = (
             "DELETE FROM requirement WHERE ("
             "environment_type = ? AND "
@@ -283,11 +378,8 @@ def delete_requirement(environment_type, environment, requirement_type, requirem
             "requirement_type = ? AND "
             "requirement = ?)"
         )
-        cursor = conn.cursor()
-        cursor.execute(
-            sql, (environment_type, environment, requirement_type, requirement)
-        )
-        conn.commit()
+        conn.execute(sql, key)
+        database.saved.discard(key)
 
 
 def get_all_environments_with_requirement(
@@ -305,7 +397,8 @@ def get_all_environments_with_requirement(
 
     """
     requirements = {}
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return requirements
 
     environment_select = (
@@ -321,13 +414,12 @@ def get_all_environments_with_requirement(
         f"WHERE r.environment = e.environment"
     )
 
-    with sqlite3.connect(
-        CACHE_DATABASE_PATH, detect_types=sqlite3.PARSE_DECLTYPES
-    ) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(sql, (environment_type, requirement_type, requirement))
+    with database.lock:
+        rows = database.connection.execute(
+            sql, (environment_type, requirement_type, requirement)
+        ).fetchall()
 
-        for row in result.fetchall():
+        for row in rows:
             if row[0] in requirements:
                 requirements[row[0]].append((row[1], row[2]))
             else:
@@ -342,18 +434,16 @@ def get_all_requirements():
 
     """
     requirements = {}
-    if not os.path.exists(CACHE_DATABASE_PATH):
+    database = _get_database(create=False)
+    if database is None:
         return requirements
 
     sql = "SELECT * FROM requirement"
 
-    with sqlite3.connect(
-        CACHE_DATABASE_PATH, detect_types=sqlite3.PARSE_DECLTYPES
-    ) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(sql)
+    with database.lock:
+        rows = database.connection.execute(sql).fetchall()
 
-        for row in result.fetchall():
+        for row in rows:
             environment_type = row[0]
             if environment_type not in requirements:
                 requirements[environment_type] = []
@@ -73,6 +73,20 @@ class JobTestSuiteReferenceResolutionError(JobTestSuiteError):
 
     status = "ERROR"
 
+    def __init__(self, msg, diagnostics=None):
+        """
+        :param msg: the error message
+        :type msg: str
+        :param diagnostics: what each resolver found, for each reference
+                            that could not be resolved, as given by
+                            :meth:`avocado.core.resolver.ReferenceResolution.get_diagnostics`
+        :type diagnostics: dict
+        """
+        super().__init__(msg)
+        if diagnostics is None:
+            diagnostics = {}
+        self.diagnostics = diagnostics
+
 
 class OptionValidationError(Exception):
 
@@ -42,6 +42,7 @@ from avocado.core import (
 )
 from avocado.core.job_id import create_unique_job_id
 from avocado.core.output import LOG_JOB, LOG_UI, STD_OUTPUT
+from avocado.core.safeloader import store as safeloader_store
 from avocado.core.settings import settings
 from avocado.core.suite import TestSuite, TestSuiteError
 from avocado.core.utils.version import get_avocado_git_version
@@ -479,6 +480,7 @@ class Job:
         """
         output.del_last_configuration()
         self.__stop_job_logging()
+        safeloader_store.clear()
         if not self.__keep_tmpdir and os.path.exists(self.tmpdir):
             shutil.rmtree(self.tmpdir)
             shutil.rmtree(self._base_tmpdir)
@@ -33,6 +33,7 @@ TEST_REFERENCES_FILENAME = "test_references"
 PWD_FILENAME = "pwd"
 JOB_CONFIG_FILENAME = "args.json"
 CMDLINE_FILENAME = "cmdline"
+RESOLUTION_PROFILE_FILENAME = "resolution_profile.json"
 
 
 def json_bad_variants_obj(item):
@@ -50,6 +51,22 @@ def record_suite_variant(path_variants, suite):
         os.fsync(variants_file)
 
 
+def record_resolution_profile(path_profile, suites):
+    profiles = []
+    for suite in suites:
+        if getattr(suite, "profile", None) is None:
+            continue
+        profile = suite.profile.to_dict()
+        profile["suite"] = suite.name
+        profiles.append(profile)
+    if not profiles:
+        return
+    with open(path_profile, "w", encoding="utf-8") as profile_file:
+        json.dump(profiles, profile_file)
+        profile_file.flush()
+        os.fsync(profile_file)
+
+
 def record(job, cmdline=None):
     """
     Records all required job information.
@@ -60,6 +77,7 @@ def record(job, cmdline=None):
     path_pwd = os.path.join(base_dir, PWD_FILENAME)
     path_job_config = os.path.join(base_dir, JOB_CONFIG_FILENAME)
     path_cmdline = os.path.join(base_dir, CMDLINE_FILENAME)
+    path_profile = os.path.join(base_dir, RESOLUTION_PROFILE_FILENAME)
 
     references = job.config.get("resolver.references")
     if references:
@@ -82,6 +100,8 @@ def record(job, cmdline=None):
         path_suite_variant = os.path.join(base_dir, suite_var_name)
         record_suite_variant(path_suite_variant, suite)
 
+    record_resolution_profile(path_profile, job.test_suites)
+
     with open(path_pwd, "w", encoding="utf-8") as pwd_file:
         pwd_file.write(f"{os.getcwd()}")
         pwd_file.flush()
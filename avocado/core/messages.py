@@ -12,6 +12,8 @@
 # Copyright: Red Hat Inc. 2021
 # Authors: Jan Richter <jarichte@redhat.com>
 
+import collections
+import locale
 import logging
 import os
 import time
@@ -22,6 +24,59 @@ from avocado.core.test_id import TestID
 
 DEFAULT_LOG_FILE = "debug.log"
 
+#: The maximum number of files kept open by a :class:`FileHandlePool`
+FILE_HANDLE_POOL_SIZE = 128
+
+
+class FileHandlePool:
+    """
+    Keeps the files written to by message handlers open, up to a limit.
+
+    Runners send lots of messages that end up appended to the same few
+    files of a task, so instead of opening and closing a file for each
+    message, the most recently used files are kept open.  They're closed,
+    and thus flushed, when their task finishes, or when they're the
+    least recently used ones and room is needed for others.
+    """
+
+    def __init__(self, max_size=FILE_HANDLE_POOL_SIZE):
+        self._max_size = max_size
+        self._handles = collections.OrderedDict()
+
+    def write(self, task_path, filename, data):
+        """
+        Appends data to a file in a task directory.
+
+        :param task_path: the task directory
+        :type task_path: str
+        :param filename: path of the file, relative to the task directory
+        :type filename: str
+        :param data: data to be appended
+        :type data: bytes
+        """
+        key = (task_path, filename)
+        handle = self._handles.get(key)
+        if handle is None:
+            if len(self._handles) >= self._max_size:
+                _, evicted = self._handles.popitem(last=False)
+                evicted.close()
+            handle = open(os.path.join(task_path, filename), "ab")
+            self._handles[key] = handle
+        else:
+            self._handles.move_to_end(key)
+        handle.write(data)
+
+    def close_task(self, task_path):
+        """Closes all files of a task directory."""
+        for key in [key for key in self._handles if key[0] == task_path]:
+            self._handles.pop(key).close()
+
+    def close(self):
+        """Closes all files."""
+        while self._handles:
+            _, handle = self._handles.popitem()
+            handle.close()
+
 
 class BaseMessageHandler:
     """
@@ -60,28 +115,35 @@ class MessageHandler(BaseMessageHandler):
     """Entry point for handling messages."""
 
     def __init__(self):
+        self._file_pool = FileHandlePool()
         self._handlers = {
             "started": [StartMessageHandler()],
-            "finished": [FinishMessageHandler()],
-            "running": [RunningMessageHandler()],
+            "finished": [FinishMessageHandler(self._file_pool)],
+            "running": [RunningMessageHandler(self._file_pool)],
         }
 
     def process_message(self, message, task, job):
         for handler in self._handlers.get(message.get("status"), []):
             handler.process_message(message, task, job)
 
+    def close(self):
+        """Closes all the files kept open while handling messages."""
+        self._file_pool.close()
+
 
 class RunningMessageHandler(BaseMessageHandler):
     """Entry point for handling running messages."""
 
-    def __init__(self):
+    def __init__(self, file_pool=None):
+        if file_pool is None:
+            file_pool = FileHandlePool()
         self._handlers = {
-            "log": [LogMessageHandler()],
-            "stdout": [StdoutMessageHandler()],
-            "stderr": [StderrMessageHandler()],
-            "whiteboard": [WhiteboardMessageHandler()],
-            "output": [OutputMessageHandler()],
-            "file": [FileMessageHandler()],
+            "log": [LogMessageHandler(file_pool)],
+            "stdout": [StdoutMessageHandler(file_pool)],
+            "stderr": [StderrMessageHandler(file_pool)],
+            "whiteboard": [WhiteboardMessageHandler(file_pool)],
+            "output": [OutputMessageHandler(file_pool)],
+            "file": [FileMessageHandler(file_pool)],
         }
 
     def process_message(self, message, task, job):
@@ -173,11 +235,17 @@ class FinishMessageHandler(BaseMessageHandler):
     example: {'status': 'finished', 'result': 'pass', 'time': 16444.819830573}
     """
 
+    def __init__(self, file_pool=None):
+        self._file_pool = file_pool
+
     def handle(self, message, task, job):
         if not task.metadata:
             task.metadata.update(
                 StartMessageHandler.prepare_metadata(task, job, message["time"])
             )
+        elif self._file_pool is not None:
+            # the task files must be complete before results are reported
+            self._file_pool.close_task(task.metadata["task_path"])
         message.update(task.metadata)
         message["name"] = TestID.from_identifier(task.identifier)
         message["status"] = message.get("result").upper()
@@ -202,8 +270,11 @@ class BaseRunningMessageHandler(BaseMessageHandler):
 
     _tag = b""
 
-    def __init__(self):
+    def __init__(self, file_pool=None):
         self.line_buffer = b""
+        if file_pool is None:
+            file_pool = FileHandlePool()
+        self._file_pool = file_pool
 
     def _split_complete_lines(self, data):
         """
@@ -273,15 +344,14 @@ class BaseRunningMessageHandler(BaseMessageHandler):
             message = f"{message}\n"
         return message
 
-    @staticmethod
-    def _save_message_to_file(filename, buff, task, encoding=None):
+    def _save_message_to_file(self, filename, buff, task, encoding=None):
         """
         Method for saving messages into the file
 
         It can decode and save messages.The message will be decoded when
         encoding is not None. When the decoded message doesn't end with a new
         line the new line will be added. Every message is saved in the append
-        mode.
+        mode, through a pool of files that are kept open.
 
         :param filename: name of the file
         :type filename: str
@@ -293,16 +363,11 @@ class BaseRunningMessageHandler(BaseMessageHandler):
         :type encoding: str
         """
 
-        def _save_to_file(file_name, mode):
-            with open(file_name, mode) as fp:  # pylint: disable=W1514
-                fp.write(buff)
-
-        file = os.path.join(task.metadata["task_path"], filename)
         if encoding:
             buff = BaseRunningMessageHandler._message_to_line(buff, encoding)
-            _save_to_file(file, "a")
-        else:
-            _save_to_file(file, "ab")
+            # the same encoding a file opened in text mode would use
+            buff = buff.encode(locale.getpreferredencoding(False))
+        self._file_pool.write(task.metadata["task_path"], filename, buff)
 
 
 class LogMessageHandler(BaseRunningMessageHandler):
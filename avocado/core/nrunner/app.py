@@ -9,6 +9,8 @@ import pkg_resources
 
 from avocado.core.nrunner.runnable import Runnable
 from avocado.core.nrunner.task import TASK_DEFAULT_CATEGORY, Task
+from avocado.core.nrunner.zygote import Zygote
+from avocado.core.status.utils import STATUS_PROTOCOL_JSON_LINES, STATUS_PROTOCOLS
 
 
 def _get_kind_options_from_executable_name():
@@ -116,6 +118,19 @@ class BaseRunnerApp:
                 "help": "Identifier of Job this task belongs to",
             },
         ),
+        (
+            ("--status-protocol",),
+            {
+                "type": str,
+                "required": False,
+                "default": STATUS_PROTOCOL_JSON_LINES,
+                "choices": STATUS_PROTOCOLS,
+                "help": (
+                    "Protocol used to report to status services. Defaults "
+                    "to %(default)s"
+                ),
+            },
+        ),
     )
     CMD_TASK_RUN_ARGS += CMD_RUNNABLE_RUN_ARGS
 
@@ -127,6 +142,10 @@ class BaseRunnerApp:
         (("uri",), {"type": str, "help": "URI to bind a status server to"}),
     )
 
+    CMD_ZYGOTE_ARGS = (
+        (("socket",), {"type": str, "help": "Path of the UNIX socket to listen on"}),
+    )
+
     def __init__(self, echo=print, prog=None, description=None):
         self.echo = echo
         self.parser = None
@@ -168,11 +187,15 @@ class BaseRunnerApp:
                 help_message = docstring_lines[0]
         return help_message
 
-    def run(self):
+    def run(self, argv=None):
         """
         Runs the application by finding a suitable command method to call
+
+        :param argv: the command line arguments, defaults to the ones given
+                     to the current process
+        :type argv: list of str
         """
-        args = vars(self.parser.parse_args())
+        args = vars(self.parser.parse_args(argv))
         subcommand = args.get("subcommand")
         kallable = self._class_commands_method.get(subcommand, None)
         if kallable is not None:
@@ -205,6 +228,7 @@ class BaseRunnerApp:
             "runnables": self.RUNNABLE_KINDS_CAPABLE,
             "commands": self.get_commands(),
             "configuration_used": self.get_configuration_used_by_runners(),
+            "status_protocols": list(STATUS_PROTOCOLS),
         }
 
     def get_runner_from_runnable(self, runnable):
@@ -289,6 +313,7 @@ class BaseRunnerApp:
             args.get("status_uri", []),
             category=args.get("category", TASK_DEFAULT_CATEGORY),
             job_id=args.get("job_id"),
+            status_protocol=args.get("status_protocol", STATUS_PROTOCOL_JSON_LINES),
         )
         for status in task.run():
             self.echo(status)
@@ -303,3 +328,15 @@ class BaseRunnerApp:
         task = Task.from_recipe(args.get("recipe"))
         for status in task.run():
             self.echo(status)
+
+    def command_zygote(self, args):
+        """
+        Serves requests to run commands in processes forked from this one
+
+        The requests are received through a UNIX socket, until the
+        standard input is closed.  See :mod:`avocado.core.nrunner.zygote`.
+
+        :param args: parsed command line arguments turned into a dictionary
+        :type args: dict
+        """
+        Zygote(self, args.get("socket")).serve()
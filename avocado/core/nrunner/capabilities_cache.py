@@ -0,0 +1,126 @@
+"""
+Persistent cache of the capabilities of runner commands.
+
+Finding out the capabilities of a runner command means executing it,
+which for runners written in Python means paying for the startup of an
+interpreter, for every kind of runnable, on every Avocado execution.
+The capabilities are thus kept in a file under the data directory, and
+reused until the runner executable (or Python module) is changed, or a
+different version of Avocado is used.
+"""
+
+import importlib.util
+import os
+import shutil
+import threading
+
+from avocado.core.data_dir import get_datafile_path
+from avocado.core.utils import cache
+
+#: The name of the cache file, inside the "cache" data directory
+CACHE_FILE_NAME = "runners_capabilities.json"
+
+_LOCK = threading.Lock()
+
+
+def get_cache_path():
+    """Returns the location of the capabilities cache file."""
+    return get_datafile_path("cache", CACHE_FILE_NAME)
+
+
+def _module_path(module_name):
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    return spec.origin
+
+
+def get_fingerprint(runner_command):
+    """Identifies the files a runner command is made of, and their state.
+
+    That is, the runner executable, the Python module for commands such
+    as ``python3 -m avocado.plugins.runners.exec_test``, and the base
+    runner application, which determines most of the capabilities.
+
+    :param runner_command: the runner command line
+    :type runner_command: list of str
+    :returns: the path, modification time and size of each file, or None
+              if any of them could not be found
+    :rtype: list
+    """
+    executable = shutil.which(runner_command[0])
+    if executable is None:
+        return None
+    paths = [executable]
+    if len(runner_command) > 2 and runner_command[1] == "-m":
+        module_path = _module_path(runner_command[2])
+        if module_path is None:
+            return None
+        paths.append(module_path)
+    paths.append(_module_path("avocado.core.nrunner.app"))
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        fingerprint.append([os.path.realpath(path), stat.st_mtime_ns, stat.st_size])
+    return fingerprint
+
+
+def _load(path):
+    data = cache.load(path)
+    if data is None:
+        return {}
+    runners = data.get("runners")
+    if not isinstance(runners, dict):
+        return {}
+    return runners
+
+
+def get_capabilities(runner_command):
+    """Returns the cached capabilities of a runner command.
+
+    :param runner_command: the runner command line
+    :type runner_command: list of str
+    :returns: the capabilities, or None if they're not cached or the
+              cached ones are outdated
+    :rtype: dict or None
+    """
+    fingerprint = get_fingerprint(runner_command)
+    if fingerprint is None:
+        return None
+    entry = _load(get_cache_path()).get(" ".join(runner_command))
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return None
+    return entry.get("capabilities")
+
+
+def set_capabilities(runner_command, capabilities):
+    """Saves the capabilities of a runner command in the cache.
+
+    Failures to write the cache are not fatal, as it only means the
+    runner command will be probed again.
+
+    :param runner_command: the runner command line
+    :type runner_command: list of str
+    :param capabilities: the capabilities, as reported by the runner
+    :type capabilities: dict
+    """
+    fingerprint = get_fingerprint(runner_command)
+    if fingerprint is None:
+        return
+    path = get_cache_path()
+    with _LOCK:
+        runners = _load(path)
+        runners[" ".join(runner_command)] = {
+            "fingerprint": fingerprint,
+            "capabilities": capabilities,
+        }
+        try:
+            cache.save(path, {"runners": runners})
+        except OSError:
+            pass
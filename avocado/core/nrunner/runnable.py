@@ -1,5 +1,6 @@
 import base64
 import collections
+import concurrent.futures
 import json
 import logging
 import os
@@ -8,8 +9,10 @@ import sys
 
 import pkg_resources
 
+from avocado.core.nrunner import capabilities_cache
 from avocado.core.nrunner.config import ConfigDecoder, ConfigEncoder
 from avocado.core.settings import settings
+from avocado.core.status.utils import STATUS_PROTOCOL_JSON_LINES, STATUS_PROTOCOLS
 from avocado.core.utils.eggenv import get_python_path_env_if_egg
 
 LOG = logging.getLogger(__name__)
@@ -21,6 +24,12 @@ RUNNERS_REGISTRY_STANDALONE_EXECUTABLE = {}
 #: The configuration that is known to be used by standalone runners
 STANDALONE_EXECUTABLE_CONFIG_USED = {}
 
+#: The status protocols that are known to be supported by standalone runners
+STANDALONE_EXECUTABLE_STATUS_PROTOCOLS = {}
+
+#: The commands that are known to be supported by standalone runners
+STANDALONE_EXECUTABLE_COMMANDS = {}
+
 
 def _arg_decode_base64(arg):
     """
@@ -367,26 +376,37 @@ class Runnable:
 
         In case of failures, an empty capabilities dictionary is returned.
 
+        The capabilities are kept in a persistent cache (see
+        :mod:`avocado.core.nrunner.capabilities_cache`), so the runner
+        is only executed when they're not cached, or are outdated.
+
         When the capabilities are obtained, it also updates the
-        :data:`STANDALONE_EXECUTABLE_CONFIG_USED` info.
+        :data:`STANDALONE_EXECUTABLE_CONFIG_USED`,
+        :data:`STANDALONE_EXECUTABLE_STATUS_PROTOCOLS` and
+        :data:`STANDALONE_EXECUTABLE_COMMANDS` info.
         """
-        cmd = runner_command + ["capabilities"]
-        try:
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                env=env,
-            )
-        except (FileNotFoundError, PermissionError):
-            return {}
-        out, _ = process.communicate()
+        capabilities = capabilities_cache.get_capabilities(runner_command)
+        if capabilities is None:
+            cmd = runner_command + ["capabilities"]
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    env=env,
+                )
+            except (FileNotFoundError, PermissionError):
+                return {}
+            out, _ = process.communicate()
 
-        try:
-            capabilities = json.loads(out.decode())
-        except json.decoder.JSONDecodeError:
-            capabilities = {}
+            try:
+                capabilities = json.loads(out.decode())
+            except json.decoder.JSONDecodeError:
+                capabilities = {}
+            # failures are not cached, as they may be transient
+            if capabilities:
+                capabilities_cache.set_capabilities(runner_command, capabilities)
 
         # lists are not hashable, and here it'd make more sense to have
         # a command as it'd be seen in a command line anyway
@@ -395,6 +415,12 @@ class Runnable:
             STANDALONE_EXECUTABLE_CONFIG_USED[cmd] = capabilities.get(
                 "configuration_used", []
             )
+        if cmd not in STANDALONE_EXECUTABLE_STATUS_PROTOCOLS:
+            STANDALONE_EXECUTABLE_STATUS_PROTOCOLS[cmd] = capabilities.get(
+                "status_protocols", []
+            )
+        if cmd not in STANDALONE_EXECUTABLE_COMMANDS:
+            STANDALONE_EXECUTABLE_COMMANDS[cmd] = capabilities.get("commands", [])
         return capabilities
 
     @staticmethod
@@ -469,6 +495,37 @@ class Runnable:
         # future similar problems
         runners_registry[kind] = False
 
+    @staticmethod
+    def pick_runner_commands(kinds, runners_registry=None):
+        """Selects runner commands for a number of runner kinds.
+
+        It's similar to :meth:`pick_runner_command`, but the kinds that
+        are not yet in the registry are probed concurrently.
+
+        :param kinds: runners' kinds
+        :type kinds: iterable of str
+        :param runners_registry: a registry with previously found (and not
+                                 found) runners keyed by runnable kind
+        :type runners_registry: dict
+        :returns: command line arguments to execute the runner (or None),
+                  keyed by kind
+        :rtype: dict
+        """
+        if runners_registry is None:
+            runners_registry = RUNNERS_REGISTRY_STANDALONE_EXECUTABLE
+        kinds = set(kinds)
+        unknown = [kind for kind in kinds if kind not in runners_registry]
+        if len(unknown) > 1:
+            # probes spend their time waiting on runner processes
+            with concurrent.futures.ThreadPoolExecutor(len(unknown)) as executor:
+                for kind in unknown:
+                    executor.submit(
+                        Runnable.pick_runner_command, kind, runners_registry
+                    )
+        return {
+            kind: Runnable.pick_runner_command(kind, runners_registry) for kind in kinds
+        }
+
     def runner_command(self, runners_registry=None):
         """Selects a runner command based on the runner.
 
@@ -489,6 +546,50 @@ class Runnable:
         """
         return Runnable.pick_runner_command(self.kind, runners_registry)
 
+    def runner_status_protocol(self, runners_registry=None):
+        """Selects the preferred status protocol supported by the runner.
+
+        The status protocols supported by a runner are the ones it
+        advertised in its capabilities, when it was probed by
+        :meth:`runner_command`.
+
+        :param runners_registry: a registry with previously found (and not
+                                 found) runners keyed by runnable kind
+        :type runners_registry: dict
+        :returns: one of the :data:`avocado.core.status.utils.STATUS_PROTOCOLS`
+        :rtype: str
+        """
+        runner_command = self.runner_command(runners_registry)
+        if runner_command is None:
+            return STATUS_PROTOCOL_JSON_LINES
+        supported = STANDALONE_EXECUTABLE_STATUS_PROTOCOLS.get(
+            " ".join(runner_command), []
+        )
+        for protocol in STATUS_PROTOCOLS:
+            if protocol in supported:
+                return protocol
+        return STATUS_PROTOCOL_JSON_LINES
+
+    def runner_supports_command(self, command, runners_registry=None):
+        """Checks if the runner advertised support for a command.
+
+        The commands supported by a runner are the ones it advertised in
+        its capabilities, when it was probed by :meth:`runner_command`.
+
+        :param command: the name of the command, such as "task-run"
+        :type command: str
+        :param runners_registry: a registry with previously found (and not
+                                 found) runners keyed by runnable kind
+        :type runners_registry: dict
+        :rtype: bool
+        """
+        runner_command = self.runner_command(runners_registry)
+        if runner_command is None:
+            return False
+        return command in STANDALONE_EXECUTABLE_COMMANDS.get(
+            " ".join(runner_command), []
+        )
+
     @staticmethod
     def pick_runner_class_from_entry_point_kind(kind):
         """Selects a runner class from entry points based on kind.
@@ -1,6 +1,9 @@
 import time
 
-from avocado.core.nrunner.runnable import RUNNERS_REGISTRY_STANDALONE_EXECUTABLE
+from avocado.core.nrunner.runnable import (
+    RUNNERS_REGISTRY_STANDALONE_EXECUTABLE,
+    Runnable,
+)
 from avocado.core.plugin_interfaces import RunnableRunner
 
 #: The amount of time (in seconds) between each internal status check
@@ -31,8 +34,11 @@ def check_runnables_runner_requirements(runnables, runners_registry=None):
     ok = []
     missing = []
 
+    runners = Runnable.pick_runner_commands(
+        (runnable.kind for runnable in runnables), runners_registry
+    )
     for runnable in runnables:
-        runner = runnable.pick_runner_command(runnable.kind, runners_registry)
+        runner = runners[runnable.kind]
         if runner:
             ok.append(runnable)
         else:
@@ -3,6 +3,7 @@ import json
 import logging
 import socket
 import tempfile
+import threading
 import time
 from uuid import uuid1
 
@@ -10,6 +11,12 @@ from avocado.core.nrunner.runnable import (
     RUNNERS_REGISTRY_STANDALONE_EXECUTABLE,
     Runnable,
 )
+from avocado.core.status.utils import (
+    STATUS_PROTOCOL_FRAMED,
+    STATUS_PROTOCOL_FRAMED_PREAMBLE,
+    STATUS_PROTOCOL_JSON_LINES,
+    frame_encode,
+)
 
 LOG = logging.getLogger(__name__)
 
@@ -17,6 +24,14 @@ LOG = logging.getLogger(__name__)
 #: task results to be included in the job results
 TASK_DEFAULT_CATEGORY = "test"
 
+#: The maximum number of messages sent in a single frame, when using
+#: the framed status protocol
+STATUS_BATCH_MAX_MESSAGES = 64
+
+#: The maximum amount of time (in seconds) a message may be held in a
+#: batch, waiting for other messages, when using the framed status protocol
+STATUS_BATCH_MAX_DELAY = 0.1
+
 
 class StatusEncoder(json.JSONEncoder):
 
@@ -38,34 +53,97 @@ class TaskStatusService:
     TODO: make the interface generic and this just one of the implementations
     """
 
-    def __init__(self, uri):
+    def __init__(self, uri, protocol=STATUS_PROTOCOL_JSON_LINES):
+        """Instantiates a new TaskStatusService.
+
+        :param uri: either a "host:port" string or a path to a UNIX socket
+        :type uri: str
+        :param protocol: the status protocol to use, either
+                         :data:`STATUS_PROTOCOL_JSON_LINES` or
+                         :data:`STATUS_PROTOCOL_FRAMED`.  The latter should
+                         only be used if the status server is known to
+                         support it.
+        :type protocol: str
+        """
         self.uri = uri
+        self.protocol = protocol
         self.connection = None
-
-    def post(self, status):
+        self._batch = []
+        self._batch_time = None
+        # flushes the batch once it's held for too long, even if no other
+        # messages are posted, as the runner may go quiet for a long time
+        self._batch_timer = None
+        self._batch_lock = threading.Lock()
+
+    def _connect(self):
+        if self.connection is not None:
+            return
         if ":" in self.uri:
             host, port = self.uri.split(":")
             port = int(port)
-            if self.connection is None:
-                for _ in range(30):
-                    try:
-                        self.connection = socket.create_connection((host, port))
-                        break
-                    except ConnectionRefusedError as error:
-                        LOG.warning(error)
-                        time.sleep(1)
-                else:
-                    raise error
+            for _ in range(30):
+                try:
+                    self.connection = socket.create_connection((host, port))
+                    break
+                except ConnectionRefusedError as error:
+                    LOG.warning(error)
+                    time.sleep(1)
+            else:
+                raise error
         else:
-            if self.connection is None:
-                self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                self.connection.connect(self.uri)
+            self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.connection.connect(self.uri)
+        if self.protocol == STATUS_PROTOCOL_FRAMED:
+            self.connection.sendall(STATUS_PROTOCOL_FRAMED_PREAMBLE)
+
+    def _should_flush(self, status):
+        # messages that change the task status are sent right away,
+        # while messages carrying output, such as logs, may wait a bit
+        if "type" not in status or status.get("status") != "running":
+            return True
+        if len(self._batch) >= STATUS_BATCH_MAX_MESSAGES:
+            return True
+        return time.monotonic() - self._batch_time >= STATUS_BATCH_MAX_DELAY
+
+    def _flush(self):
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if not self._batch:
+            return
+        self._connect()
+        self.connection.sendall(frame_encode(self._batch))
+        self._batch = []
+        self._batch_time = None
+
+    def flush(self):
+        """Sends the messages that have been batched, if any."""
+        with self._batch_lock:
+            self._flush()
 
+    def post(self, status):
+        if self.protocol == STATUS_PROTOCOL_FRAMED:
+            with self._batch_lock:
+                if not self._batch:
+                    self._batch_time = time.monotonic()
+                self._batch.append(status)
+                if self._should_flush(status):
+                    self._flush()
+                elif self._batch_timer is None:
+                    self._batch_timer = threading.Timer(
+                        STATUS_BATCH_MAX_DELAY, self.flush
+                    )
+                    self._batch_timer.daemon = True
+                    self._batch_timer.start()
+            return
+
+        self._connect()
         data = json_dumps(status)
         self.connection.send(data.encode("ascii") + "\n".encode("ascii"))
 
     def close(self):
         if self.connection is not None:
+            self.flush()
             self.connection.close()
 
     def __repr__(self):
@@ -88,6 +166,7 @@ class Task:
         status_uris=None,
         category=TASK_DEFAULT_CATEGORY,
         job_id=None,
+        status_protocol=STATUS_PROTOCOL_JSON_LINES,
     ):
         """Instantiates a new Task.
 
@@ -110,6 +189,9 @@ class Task:
                        sent to the destination job's status server and will make
                        into the job's results.
         :type job_id: str
+        :param status_protocol: the protocol used to post status updates
+                                to the status services.
+        :type status_protocol: str
         """
         # pylint: disable=W0201
         self.runnable = runnable
@@ -124,7 +206,9 @@ class Task:
             if type(status_uris) is not list:
                 status_uris = [status_uris]
             for status_uri in status_uris:
-                self.status_services.append(TaskStatusService(status_uri))
+                self.status_services.append(
+                    TaskStatusService(status_uri, status_protocol)
+                )
         self.metadata = {}
 
     def __repr__(self):
@@ -180,13 +264,18 @@ class Task:
         category = recipe.get("category")
         return cls(runnable, identifier, status_uris, category)
 
-    def get_command_args(self):
+    def get_command_args(self, status_protocol=None):
         """
         Returns the command arguments that adhere to the runner interface
 
         This is useful for building 'task-run' commands that can be
         executed on a command line interface.
 
+        :param status_protocol: the protocol the runner should use to post
+                                status updates.  It should only be given
+                                if the runner advertises support for it
+                                in its capabilities.
+        :type status_protocol: str
         :returns: the arguments that can be used on an avocado-runner command
         :rtype: list
         """
@@ -197,6 +286,10 @@ class Task:
             args.append("-s")
             args.append(status_service.uri)
 
+        if status_protocol not in (None, STATUS_PROTOCOL_JSON_LINES):
+            args.append("--status-protocol")
+            args.append(status_protocol)
+
         return args
 
     def run(self):
@@ -212,3 +305,5 @@ class Task:
             for status_service in self.status_services:
                 status_service.post(status)
             yield status
+        for status_service in self.status_services:
+            status_service.flush()
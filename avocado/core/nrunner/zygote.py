@@ -0,0 +1,214 @@
+"""
+Warm runner processes that fork a new process for each task.
+
+A zygote is a runner application that, instead of running a single
+task and exiting, listens on a UNIX socket for requests to run tasks.
+It has already paid the price of starting the interpreter and of
+importing the runners, so each request is served by forking a child
+process, which is isolated from the zygote and from other tasks.
+
+The protocol is made of JSON lines.  A client connects and sends the
+command line arguments for the runner application::
+
+  {"args": ["task-run", "-i", "1-foo", "-k", "exec-test", ...]}
+
+The zygote replies with the process ID of the child running it::
+
+  {"pid": 1234}
+
+And, once the child process finishes, with its return code (negative
+if the child was killed by a signal), closing the connection::
+
+  {"returncode": 0}
+
+A zygote runs until its standard input is closed.
+"""
+
+import json
+import os
+import selectors
+import signal
+import socket
+import sys
+import traceback
+
+from avocado.core.nrunner.runnable import Runnable
+
+#: The message a zygote writes to its standard output when it's ready
+#: to accept requests
+READY_MESSAGE = {"status": "ready"}
+
+#: The maximum time, in seconds, a client can take to send a request
+REQUEST_TIMEOUT = 5
+
+
+def encode(message):
+    """Encodes a zygote protocol message as a line."""
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def decode(line):
+    """Decodes a zygote protocol message from a line.
+
+    :raises: ValueError if the line doesn't contain a valid message
+    """
+    message = json.loads(line.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError(f"Invalid zygote message: {line}")
+    return message
+
+
+def _returncode(wait_status):
+    if os.WIFSIGNALED(wait_status):
+        return -os.WTERMSIG(wait_status)
+    return os.WEXITSTATUS(wait_status)
+
+
+class Zygote:
+    """Serves requests to run a runner application in forked processes."""
+
+    def __init__(self, app, socket_path):
+        """
+        :param app: the runner application that will be run on requests
+        :type app: :class:`avocado.core.nrunner.app.BaseRunnerApp`
+        :param socket_path: path of the UNIX socket to listen on
+        :type socket_path: str
+        """
+        self._app = app
+        self._socket_path = socket_path
+        self._selector = None
+        self._server = None
+        self._wakeup = None
+        #: connections waiting for the return code of a child, by pid
+        self._children = {}
+
+    def _warm_up(self):
+        """Imports the runners, so that forked children don't have to."""
+        for kind in self._app.RUNNABLE_KINDS_CAPABLE:
+            Runnable.pick_runner_class_from_entry_point_kind(kind)
+
+    def _setup(self):
+        self._selector = selectors.DefaultSelector()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self._socket_path)
+        self._server.listen(socket.SOMAXCONN)
+        self._server.setblocking(False)
+        self._selector.register(self._server, selectors.EVENT_READ, self._accept)
+
+        # child processes are noticed through a SIGCHLD handler that
+        # wakes up the selector by writing to a pipe
+        self._wakeup = os.pipe()
+        for fd in self._wakeup:
+            os.set_blocking(fd, False)
+        signal.set_wakeup_fd(self._wakeup[1])
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        self._selector.register(self._wakeup[0], selectors.EVENT_READ, self._reap)
+
+        self._selector.register(sys.stdin, selectors.EVENT_READ, self._check_stdin)
+
+    def _teardown(self):
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.set_wakeup_fd(-1)
+        self._selector.close()
+        self._server.close()
+        for fd in self._wakeup:
+            os.close(fd)
+        for connection in self._children.values():
+            if connection is not None:
+                connection.close()
+        self._children = {}
+
+    def serve(self):
+        """Serves requests until the standard input is closed."""
+        self._warm_up()
+        self._setup()
+        self._app.echo(json.dumps(READY_MESSAGE))
+        sys.stdout.flush()
+        try:
+            while True:
+                for key, _ in self._selector.select():
+                    # a callback returns False when it's time to stop
+                    if key.data() is False:
+                        return
+        finally:
+            self._teardown()
+            try:
+                os.unlink(self._socket_path)
+            except FileNotFoundError:
+                pass
+
+    def _check_stdin(self):
+        return bool(os.read(sys.stdin.fileno(), 4096))
+
+    def _accept(self):
+        try:
+            connection, _ = self._server.accept()
+        except BlockingIOError:
+            return
+        connection.setblocking(True)
+        connection.settimeout(REQUEST_TIMEOUT)
+        try:
+            with connection.makefile("rb") as request:
+                args = decode(request.readline())["args"]
+        except (OSError, ValueError, KeyError):
+            connection.close()
+            return
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            self._run_child(connection, args)
+        try:
+            connection.sendall(encode({"pid": pid}))
+        except OSError:
+            connection.close()
+            connection = None
+        self._children[pid] = connection
+
+    def _reap(self):
+        try:
+            while os.read(self._wakeup[0], 4096):
+                pass
+        except BlockingIOError:
+            pass
+        while self._children:
+            try:
+                pid, wait_status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            connection = self._children.pop(pid, None)
+            if connection is None:
+                continue
+            try:
+                connection.sendall(encode({"returncode": _returncode(wait_status)}))
+            except OSError:
+                pass
+            connection.close()
+
+    def _run_child(self, connection, args):
+        status = 1
+        try:
+            connection.close()
+            self._teardown()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            os.close(devnull)
+            sys.argv = sys.argv[:1] + args
+            self._app.run(args)
+            status = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                status = 0
+            elif isinstance(exc.code, int):
+                status = exc.code
+        except BaseException:  # pylint: disable=W0703
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(status)  # pylint: disable=W0212
@@ -15,9 +15,13 @@
 Module related to test parameters
 """
 
+import functools
 import logging
 import re
 
+#: The maximum number of compiled path expressions kept
+PATH_RE_CACHE_SIZE = 1024
+
 
 class NoMatchError(KeyError):
     pass
@@ -88,12 +92,18 @@ class AvocadoParams:
         :param leaves: list of TreeNode leaves
         """
         path_re = self._greedy_path_to_re(path)
-        path_leaves = [leaf for leaf in leaves if path_re.search(leaf.path + "/")]
-        for leaf in path_leaves:
-            leaves.remove(leaf)
+        path_leaves = []
+        remaining_leaves = []
+        for leaf in leaves:
+            if path_re.search(leaf.path + "/"):
+                path_leaves.append(leaf)
+            else:
+                remaining_leaves.append(leaf)
+        leaves[:] = remaining_leaves
         return path_leaves
 
     @staticmethod
+    @functools.lru_cache(maxsize=PATH_RE_CACHE_SIZE)
     def _greedy_path_to_re(path):
         """
         Converts user-friendly path with asterisk to a regex and compiles it
@@ -186,15 +196,15 @@ class AvocadoParams:
         Iterate through all available params and yield origin, key and value
         of each unique value.
         """
-        env = []
+        env = set()
         for param in self._rel_paths:
             for path, key, value in param.iteritems():
                 if (path, key) not in env:
-                    env.append((path, key))
+                    env.add((path, key))
                     yield (path, key, value)
         for path, key, value in self._abs_path.iteritems():
             if (path, key) not in env:
-                env.append((path, key))
+                env.add((path, key))
                 yield (path, key, value)
 
 
@@ -215,9 +225,18 @@ class AvocadoParam:
         # names cache (leaf.path is quite expensive)
         self._leaf_names = [leaf.path + "/" for leaf in leaves]
         self.name = name
+        # values of each key as (leaf index, value, origin path), in the
+        # order of the leaves, built on the first lookup
+        self._index = None
+        # indexes of the leaves matching each path expression
+        self._matching_leaves = {}
 
     def __eq__(self, other):
-        if self.__dict__ == other.__dict__:
+        if (
+            self._leaves == other._leaves
+            and self._leaf_names == other._leaf_names
+            and self.name == other.name
+        ):
             return True
         else:
             return False
@@ -230,15 +249,33 @@ class AvocadoParam:
         """String with identifier and all params"""
         return f"{self.name} ({self._leaf_names})"
 
-    def _get_leaves(self, path):
+    def _get_matching_leaves(self, path):
         """
-        Get all leaves matching the path
+        Get the indexes of all leaves matching the path
         """
-        return [
-            self._leaves[i]
-            for i in range(len(self._leaf_names))
-            if path.search(self._leaf_names[i])
-        ]
+        try:
+            return self._matching_leaves[path]
+        except KeyError:
+            matching = frozenset(
+                i for i, name in enumerate(self._leaf_names) if path.search(name)
+            )
+            self._matching_leaves[path] = matching
+            return matching
+
+    def _get_index(self):
+        """
+        Get the values of all keys in all leaves, indexed by key
+        """
+        if self._index is None:
+            index = {}
+            for i, leaf in enumerate(self._leaves):
+                environment = leaf.environment
+                for key, value in environment.items():
+                    index.setdefault(key, []).append(
+                        (i, value, environment.origin[key].path)
+                    )
+            self._index = index
+        return self._index
 
     def get_or_die(self, path, key):
         """
@@ -246,11 +283,11 @@ class AvocadoParam:
         :raise NoMatchError: When no matches
         :raise KeyError: When value is not certain (multiple matches)
         """
-        leaves = self._get_leaves(path)
+        matching = self._get_matching_leaves(path)
         ret = [
-            (leaf.environment[key], leaf.environment.origin[key])
-            for leaf in leaves
-            if key in leaf.environment
+            (value, origin)
+            for i, value, origin in self._get_index().get(key, ())
+            if i in matching
         ]
         if not ret:
             raise NoMatchError(
@@ -258,7 +295,7 @@ class AvocadoParam:
                 f" {key} in {self.str_leaves_variant}"
             )
         # make sure all params come from the same origin
-        if len(set([_[1].path for _ in ret])) == 1:
+        if len(set([_[1] for _ in ret])) == 1:
             return ret[0][0]
         else:
             raise ValueError(
@@ -266,10 +303,7 @@ class AvocadoParam:
                 % (
                     path.pattern,
                     key,
-                    [
-                        "%s=>%s" % (_[1].path, _[0])  # pylint: disable=C0209
-                        for _ in ret
-                    ],
+                    ["%s=>%s" % (_[1], _[0]) for _ in ret],  # pylint: disable=C0209
                 )
             )
 
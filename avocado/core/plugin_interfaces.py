@@ -244,6 +244,12 @@ class ResolverMixin:
 class Resolver(Plugin, ResolverMixin):
     """Base plugin interface for resolving test references into resolutions."""
 
+    #: The criteria that files must match to be resolved by this resolver,
+    #: as a :class:`avocado.core.resolver.ReferenceFilter`.  When set,
+    #: files found while expanding directories that do not match it are
+    #: not given to :meth:`resolve`
+    reference_filter = None
+
     @abc.abstractmethod
     def resolve(self, reference):
         """Resolves the given reference into a reference resolution.
@@ -354,6 +360,15 @@ class Spawner(Plugin):
         :type runtime_task: :class:`avocado.core.task.runtime.RuntimeTask`
         """
 
+    async def shutdown(self):
+        """Releases the resources held by the spawner.
+
+        This is called once no more tasks are going to be spawned, and
+        the ones that were spawned are finished.  Spawners that keep
+        resources around (such as processes or environments) between
+        tasks should release them here.
+        """
+
     @staticmethod
     @abc.abstractmethod
     async def check_task_requirements(runtime_task):
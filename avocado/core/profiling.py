@@ -0,0 +1,164 @@
+"""
+Timing of the resolution of test references.
+
+While a profile is being recorded, with :func:`record_profile`, the
+time spent on each stage given to :func:`measure` (such as expanding
+directories, or parsing modules) is added to it.  Stages are measured
+only on the thread doing the recording, so when references are resolved
+on other processes, the stages inside the resolvers are not measured.
+The time each resolver took is still known, as it's kept on the
+resolutions, and can be added with :meth:`Profile.add_resolutions`.
+"""
+
+import contextlib
+import threading
+import time
+
+#: Expanding the directories given as references
+STAGE_EXPAND = "directory expansion"
+#: Resolving the references with the resolvers
+STAGE_RESOLVE = "resolution"
+#: Parsing Python modules, as part of resolving references
+STAGE_PARSE = "module parsing"
+#: Examining parent classes (in other modules) of Python based tests
+STAGE_INHERITANCE = "inheritance lookup"
+#: Transforming the resolutions into runnables (including filtering them)
+STAGE_RUNNABLES = "runnables creation"
+#: Filtering the runnables by their tags
+STAGE_TAGS = "tag filtering"
+
+_RECORDING = threading.local()
+
+
+class Profile:
+
+    """
+    The time spent on each stage of the resolution, resolver and reference.
+    """
+
+    def __init__(self):
+        #: The number of times each stage was run, and the time spent on it
+        self.stages = {}
+        #: The number of references each resolver tried, and the time spent
+        self.resolvers = {}
+        #: The time spent resolving each reference, by all resolvers
+        self.references = {}
+        self._active = set()
+
+    def add_stage(self, stage, duration, calls=1):
+        entry = self.stages.setdefault(stage, [0, 0.0])
+        entry[0] += calls
+        entry[1] += duration
+
+    @contextlib.contextmanager
+    def measure(self, stage):
+        """Measures the time spent on a stage, unless it's being measured."""
+        if stage in self._active:
+            yield
+            return
+        self._active.add(stage)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._active.discard(stage)
+            self.add_stage(stage, time.monotonic() - start)
+
+    def add_resolutions(self, resolutions):
+        """Adds the time spent by the resolvers on the given resolutions.
+
+        :type resolutions: list of
+                           :class:`avocado.core.resolver.ReferenceResolution`
+        """
+        for resolution in resolutions:
+            if resolution.duration is None:
+                continue
+            entry = self.resolvers.setdefault(resolution.origin, [0, 0.0])
+            entry[0] += 1
+            entry[1] += resolution.duration
+            self.references[resolution.reference] = (
+                self.references.get(resolution.reference, 0.0) + resolution.duration
+            )
+
+    def merge(self, other):
+        """Adds the times from another profile to this one."""
+        for stage, (calls, duration) in other.stages.items():
+            self.add_stage(stage, duration, calls)
+        for origin, (count, duration) in other.resolvers.items():
+            entry = self.resolvers.setdefault(origin, [0, 0.0])
+            entry[0] += count
+            entry[1] += duration
+        for reference, duration in other.references.items():
+            self.references[reference] = self.references.get(reference, 0.0) + duration
+
+    def get_slowest_references(self, count=None):
+        """Returns the references that took the longest to be resolved.
+
+        :param count: the maximum number of references, or None for all
+        :type count: int
+        :returns: the references and their times, the slowest first
+        :rtype: list of tuple of (str, float)
+        """
+        slowest = sorted(self.references.items(), key=lambda item: -item[1])
+        if count is not None:
+            slowest = slowest[:count]
+        return slowest
+
+    def to_dict(self):
+        """Returns the profile as data that can be serialized.
+
+        :rtype: dict
+        """
+        return {
+            "stages": [
+                {"stage": stage, "calls": calls, "duration": duration}
+                for stage, (calls, duration) in self.stages.items()
+            ],
+            "resolvers": [
+                {"resolver": origin, "references": count, "duration": duration}
+                for origin, (count, duration) in sorted(self.resolvers.items())
+            ],
+            "references": [
+                {"reference": reference, "duration": duration}
+                for reference, duration in self.get_slowest_references()
+            ],
+        }
+
+
+@contextlib.contextmanager
+def record_profile():
+    """Records the time spent on each stage measured while in the context.
+
+    Recordings can be nested, and the times recorded on the inner
+    recording are also added to the outer one.
+
+    :returns: the profile with the times recorded
+    :rtype: :class:`Profile`
+    """
+    previous = getattr(_RECORDING, "profile", None)
+    profile = Profile()
+    _RECORDING.profile = profile
+    try:
+        yield profile
+    finally:
+        _RECORDING.profile = previous
+        if previous is not None:
+            previous.merge(profile)
+
+
+@contextlib.contextmanager
+def measure(stage):
+    """Measures the time spent on a stage, if a profile is being recorded.
+
+    A stage run while the same stage is being measured (such as when
+    examining classes recursively) is not measured again.
+
+    :param stage: the name of the stage, such as :data:`STAGE_PARSE`
+    :type stage: str
+    """
+    profile = getattr(_RECORDING, "profile", None)
+    if profile is None:
+        yield
+        return
+    with profile.measure(stage):
+        yield
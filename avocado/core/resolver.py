@@ -16,11 +16,31 @@
 Test resolver module.
 """
 
+import logging
+import math
+import multiprocessing
 import os
+import re
+import stat
+import time
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 
+from avocado.core import profiling
 from avocado.core.enabled_extension_manager import EnabledExtensionManager
 from avocado.core.exceptions import JobTestSuiteReferenceResolutionError
+from avocado.core.references import reference_split
+from avocado.core.safeloader.cache import record_dependencies
+from avocado.core.safeloader.utils import clear_spec_cache
+from avocado.utils import inotify
+
+LOG = logging.getLogger(__name__)
+
+#: How many chunks of references, per process, are given to the processes
+#: resolving references in parallel
+PARALLEL_CHUNKS_PER_PROCESS = 4
+
+_WORKER_RESOLVER = None
 
 
 class ReferenceResolutionResult(Enum):
@@ -31,6 +51,10 @@ class ReferenceResolutionResult(Enum):
     #: Internal error in the resolution process
     ERROR = object()
 
+    def __reduce_ex__(self, proto):
+        # the values are unique objects, only meaningful to this process
+        return getattr, (self.__class__, self._name_)
+
 
 class ReferenceResolutionAction(Enum):
     #: Stop trying to resolve the reference
@@ -48,7 +72,9 @@ class ReferenceResolution:
     none.
     """
 
-    def __init__(self, reference, result, resolutions=None, info=None, origin=None):
+    def __init__(
+        self, reference, result, resolutions=None, info=None, origin=None, duration=None
+    ):
         """
         :param reference: a specification that can eventually be resolved
                           into a test (in the form of a
@@ -64,6 +90,8 @@ class ReferenceResolution:
         :type info: str
         :param origin: the name of the resolver that performed the resolution
         :type origin: str
+        :param duration: how long (in seconds) the resolver took
+        :type duration: float
         """
         self.reference = reference
         self.result = result
@@ -72,6 +100,23 @@ class ReferenceResolution:
         self.resolutions = resolutions
         self.info = info
         self.origin = origin
+        self.duration = duration
+
+    def get_diagnostics(self):
+        """Returns what the resolver found, as data that can be serialized.
+
+        :rtype: dict
+        """
+        info = self.info
+        if info is not None and not isinstance(info, str):
+            info = str(info)
+        return {
+            "reference": self.reference,
+            "origin": self.origin,
+            "result": self.result.name,
+            "info": info,
+            "duration": self.duration,
+        }
 
     def __repr__(self):
         fmt = (
@@ -101,20 +146,39 @@ class Resolver(EnabledExtensionManager):
     def __init__(self, config=None):
         super().__init__("avocado.plugins.resolver", invoke_kwds={"config": config})
 
-    def resolve(self, reference):
+    def resolve(self, reference, entry=None):
+        """Resolves a reference with all the resolvers, as per the policy.
+
+        :param reference: the test reference
+        :type reference: str
+        :param entry: the directory entry, when the reference is a file
+                      found while expanding a directory, allowing the
+                      resolvers' reference filters to be checked cheaply
+        :type entry: :class:`os.DirEntry`
+        :rtype: list of :class:`ReferenceResolution`
+        """
         resolution = []
         for ext in self.extensions:
-            try:
-                result = ext.obj.resolve(reference)
-                if not result.origin:
-                    result.origin = ext.name
-            except Exception as exc:  # pylint: disable=W0703
-                result = ReferenceResolution(
-                    reference,
-                    ReferenceResolutionResult.ERROR,
-                    info=exc,
-                    origin=ext.name,
-                )
+            start = time.monotonic()
+            result = True
+            reference_filter = getattr(ext.obj, "reference_filter", None)
+            if entry is not None and reference_filter is not None:
+                result = reference_filter.precheck(reference, entry)
+            if result is not True:
+                result.origin = ext.name
+            else:
+                try:
+                    result = ext.obj.resolve(reference)
+                    if not result.origin:
+                        result.origin = ext.name
+                except Exception as exc:  # pylint: disable=W0703
+                    result = ReferenceResolution(
+                        reference,
+                        ReferenceResolutionResult.ERROR,
+                        info=exc,
+                        origin=ext.name,
+                    )
+            result.duration = time.monotonic() - start
             resolution.append(result)
             action = self.DEFAULT_POLICY.get(
                 result.result, ReferenceResolutionAction.CONTINUE
@@ -189,24 +253,342 @@ def check_file(
     return True
 
 
+class ReferenceFilter:
+
+    """
+    Criteria that files must match to be resolved by a resolver.
+
+    Besides checking a file completely, with :meth:`check_file`, it can
+    also check the files found while expanding directories using only
+    what is already known about them, with :meth:`precheck`.  This allows
+    files to be given only to the resolvers that could resolve them.
+    """
+
+    def __init__(
+        self,
+        suffix=".py",
+        type_name="regular file",
+        access_check=os.R_OK,
+        access_name="readable",
+        shebang=None,
+    ):
+        """
+        :param suffix: the suffix the file name must have, if any
+        :type suffix: str
+        :param type_name: the description of the kind of file expected
+        :type type_name: str
+        :param access_check: the access to the file required, as given
+                             to :func:`os.access`
+        :type access_check: int
+        :param access_name: the description of the access required
+        :type access_name: str
+        :param shebang: the interpreter line the file must start with,
+                        such as ``#!/bin/sh``, if any
+        :type shebang: str
+        """
+        self.suffix = suffix
+        self.type_name = type_name
+        self.access_check = access_check
+        self.access_name = access_name
+        self.shebang = shebang
+
+    def _check_shebang(self, path, reference):
+        expected = self.shebang.encode()
+        try:
+            with open(path, "rb") as script:
+                found = script.read(len(expected))
+        except OSError:
+            found = None
+        if found == expected:
+            return True
+        return ReferenceResolution(
+            reference,
+            ReferenceResolutionResult.NOTFOUND,
+            info=f'File "{path}" does not start with "{self.shebang}"',
+        )
+
+    def check_file(self, path, reference):
+        """Checks whether a file matches all the criteria.
+
+        :returns: True if it does, or a resolution explaining why it does
+                  not otherwise
+        :rtype: bool or :class:`ReferenceResolution`
+        """
+        result = check_file(
+            path,
+            reference,
+            self.suffix,
+            os.path.isfile,
+            self.type_name,
+            self.access_check,
+            self.access_name,
+        )
+        if result is True and self.shebang is not None:
+            result = self._check_shebang(path, reference)
+        return result
+
+    def precheck(self, path, entry):
+        """Checks a file found while expanding a directory.
+
+        The checks are the same as the ones in :meth:`check_file` (and
+        give the same results), but only those that can be done using the
+        directory entry are done, so a file passing these checks may still
+        fail the complete ones.
+
+        :param path: the path to the file
+        :type path: str
+        :param entry: the directory entry of the file
+        :type entry: :class:`os.DirEntry`
+        :returns: True if the file may match the criteria, or a resolution
+                  explaining why it does not otherwise
+        :rtype: bool or :class:`ReferenceResolution`
+        """
+        if self.suffix is not None and not path.endswith(self.suffix):
+            return ReferenceResolution(
+                path,
+                ReferenceResolutionResult.NOTFOUND,
+                info=f'File "{path}" does not end with "{self.suffix}"',
+            )
+        try:
+            is_file = entry.is_file()
+            mode = entry.stat().st_mode if self.access_check & os.X_OK else None
+        except OSError:
+            return True
+        if not is_file:
+            return ReferenceResolution(
+                path,
+                ReferenceResolutionResult.NOTFOUND,
+                info=f'File "{path}" does not exist or is not a {self.type_name}',
+            )
+        if mode is not None and not mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+            return ReferenceResolution(
+                path,
+                ReferenceResolutionResult.NOTFOUND,
+                info=f'File "{path}" does not exist or is not {self.access_name}',
+            )
+        if self.shebang is not None:
+            return self._check_shebang(path, path)
+        return True
+
+
+#: The name of the files with patterns of paths that are not given to the
+#: resolvers when expanding directories given as references
+IGNORE_FILE_NAME = ".avocadoignore"
+
+
+def _translate_ignore_pattern(pattern):
+    regex = ""
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        index += 1
+        if char == "*":
+            if pattern[index : index + 2] == "*/":
+                # any number of directories, including none
+                regex += "(?:.*/)?"
+                index += 2
+            elif pattern[index : index + 1] == "*":
+                regex += ".*"
+                index += 1
+            else:
+                regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[" and "]" in pattern[index + 1 :]:
+            end = pattern.index("]", index + 1)
+            chars = pattern[index:end].replace("\\", "\\\\")
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            regex += f"[{chars}]"
+            index = end + 1
+        elif char == "\\" and index < len(pattern):
+            regex += re.escape(pattern[index])
+            index += 1
+        else:
+            regex += re.escape(char)
+    return regex
+
+
+def parse_ignore_patterns(lines):
+    """Parses patterns of paths to be ignored.
+
+    The patterns follow the format of ".gitignore" files: "#" starts a
+    comment, "!" negates a pattern, a trailing "/" matches directories
+    only, patterns containing a "/" are relative to the directory of
+    the file, and others match names at any level below it.  "*", "?",
+    "[]" and "**" are wildcards.
+
+    :param lines: the lines with patterns
+    :type lines: iterable of str
+    :returns: the compiled pattern, whether it's negated, and whether it
+              matches directories only, for each pattern
+    :rtype: list of tuple
+    """
+    patterns = []
+    for line in lines:
+        line = line.rstrip("\n").rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        regex = _translate_ignore_pattern(line.lstrip("/"))
+        if "/" not in line:
+            regex = "(?:.*/)?" + regex
+        patterns.append((re.compile(f"{regex}$"), negated, dir_only))
+    return patterns
+
+
+class _IgnoreRules:
+    """The ignore patterns in effect on a directory."""
+
+    def __init__(self, rules=()):
+        self._rules = rules
+
+    def extend(self, directory):
+        """Returns the rules with the patterns from a directory's ignore file."""
+        try:
+            with open(
+                os.path.join(directory, IGNORE_FILE_NAME), encoding="utf-8"
+            ) as ignore_file:
+                patterns = parse_ignore_patterns(ignore_file)
+        except OSError:
+            return self
+        prefix = os.path.join(directory, "")
+        return _IgnoreRules(
+            self._rules + tuple((prefix, *pattern) for pattern in patterns)
+        )
+
+    def is_ignored(self, path, is_dir):
+        ignored = False
+        for prefix, regex, negated, dir_only in self._rules:
+            if dir_only and not is_dir:
+                continue
+            relative_path = path[len(prefix) :].replace(os.sep, "/")
+            if regex.match(relative_path):
+                ignored = not negated
+        return ignored
+
+
+def _get_ignore_rules(directory, path):
+    """Returns the ignore rules in effect on a path inside a directory.
+
+    :returns: the rules from the ignore files in the directory, and in
+              the ones between it and the path (excluding the path itself)
+    """
+    rules = _IgnoreRules().extend(directory)
+    components = os.path.relpath(path, directory).split(os.sep)[:-1]
+    for component in components:
+        directory = os.path.join(directory, component)
+        rules = rules.extend(directory)
+    return rules
+
+
+def _scan_directory(path, rules=None):
+    """Lists the files in a directory, and in its subdirectories.
+
+    Hidden files, and the ones matching the patterns in the ignore files
+    found along the way, are not listed.  Directories are listed before
+    their subdirectories, both sorted by name, and symbolic links to
+    directories are not followed.
+
+    :param rules: the ignore rules in effect on the directory, from
+                  ignore files in the directories above it
+    :returns: the path and the directory entry of each file
+    :rtype: list of tuple of (str, :class:`os.DirEntry`)
+    """
+    found = []
+    pending = [(path, rules or _IgnoreRules())]
+    while pending:
+        directory, rules = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        if any(entry.name == IGNORE_FILE_NAME for entry in entries):
+            rules = rules.extend(directory)
+        subdirectories = []
+        for entry in entries:
+            entry_path = os.path.join(directory, entry.name)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.is_symlink() or rules.is_ignored(entry_path, True):
+                    continue
+                subdirectories.append((entry_path, rules))
+            elif not entry.name.startswith("."):
+                if not rules.is_ignored(entry_path, False):
+                    found.append((entry_path, entry))
+        pending.extend(reversed(subdirectories))
+    return found
+
+
 def _extend_directory(path):
     if not os.path.isdir(path):
         return [path]
-    paths = []
-    # no error handling so far
-    for dirpath, dirs, filenames in os.walk(path):
-        dirs.sort()
-        for file_name in sorted(filenames):
-            # does it make sense to ignore hidden files here?
-            if file_name.startswith("."):
-                continue
-            pth = os.path.join(dirpath, file_name)
-            paths.append(pth)
+    paths = [entry_path for entry_path, _ in _scan_directory(path)]
     if not paths:
         paths = [path]
     return paths
 
 
+def _init_worker(config):
+    global _WORKER_RESOLVER  # pylint: disable=W0603
+    _WORKER_RESOLVER = Resolver(config)
+
+
+def _resolve_in_worker(references):
+    return [_WORKER_RESOLVER.resolve(reference) for reference in references]
+
+
+def _get_parallel_processes(config):
+    if config is None:
+        return 1
+    processes = config.get("resolver.parallel", 1)
+    if processes == 0:
+        processes = multiprocessing.cpu_count()
+    return processes
+
+
+def _resolve_parallel(references, processes, config):
+    """Resolves references on a pool of processes.
+
+    :returns: the resolutions of each reference, in the same order as
+              the references given, or None if the pool could not be used
+    :rtype: list of list of :class:`ReferenceResolution`
+    """
+    processes = min(processes, len(references))
+    chunk_size = math.ceil(len(references) / (processes * PARALLEL_CHUNKS_PER_PROCESS))
+    chunks = [
+        references[index : index + chunk_size]
+        for index in range(0, len(references), chunk_size)
+    ]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=_init_worker, initargs=(config,)
+        ) as executor:
+            results = []
+            for chunk_results in executor.map(_resolve_in_worker, chunks):
+                results.extend(chunk_results)
+            return results
+    except Exception as details:  # pylint: disable=W0703
+        # besides failing to start processes, or losing them, pickling the
+        # configuration or the resolutions may fail with about any exception
+        LOG.warning(
+            "Failed to resolve references in parallel, falling back to "
+            "resolving them serially: %s",
+            details,
+        )
+        return None
+
+
 def resolve(references, hint=None, ignore_missing=True, config=None):
     resolutions = []
     hint_resolutions = []
@@ -219,39 +601,352 @@ def resolve(references, hint=None, ignore_missing=True, config=None):
     if not references and hint_references:
         references = list(hint_references.keys())
 
+    # the resolutions of each reference that was not expanded
+    index = {}
+    directories = set()
     if references:
-        # should be initialized with args, to define the behavior
-        # of this instance as a whole
-        resolver = Resolver(config)
         extended_references = []
-        for reference in references:
-            # a reference extender is not (yet?) an extensible feature
-            # here it walks directories if one is given, and extends
-            # the original reference into final file paths
-            extended_references.extend(_extend_directory(reference))
-        for reference in extended_references:
-            if reference in hint_references:
-                resolutions.append(hint_references[reference])
-            else:
-                resolutions.extend(resolver.resolve(reference))
+        entries = {}
+        with profiling.measure(profiling.STAGE_EXPAND):
+            for reference in references:
+                # a reference extender is not (yet?) an extensible feature
+                # here it walks directories if one is given, and extends
+                # the original reference into final file paths
+                if os.path.isdir(reference):
+                    directories.add(reference)
+                    found = _scan_directory(reference)
+                else:
+                    found = []
+                if found:
+                    entries.update(found)
+                    extended_references.extend(path for path, _ in found)
+                else:
+                    extended_references.append(reference)
+        pending = [_ for _ in extended_references if _ not in hint_references]
+        with profiling.measure(profiling.STAGE_RESOLVE):
+            resolved = None
+            processes = _get_parallel_processes(config)
+            if processes > 1 and len(pending) > 1:
+                resolved = _resolve_parallel(pending, processes, config)
+            if resolved is None:
+                # should be initialized with args, to define the behavior
+                # of this instance as a whole
+                resolver = Resolver(config)
+                resolved = (
+                    resolver.resolve(reference, entries.get(reference))
+                    for reference in pending
+                )
+            resolved = iter(resolved)
+            for reference in extended_references:
+                if reference in hint_references:
+                    reference_resolutions = [hint_references[reference]]
+                else:
+                    reference_resolutions = next(resolved)
+                resolutions.extend(reference_resolutions)
+                index.setdefault(reference, []).extend(reference_resolutions)
     else:
-        discoverer = Discoverer(config)
-        resolutions.extend(discoverer.discover())
+        with profiling.measure(profiling.STAGE_RESOLVE):
+            discoverer = Discoverer(config)
+            resolutions.extend(discoverer.discover())
 
-    # This came up from a previous method and can be refactored to improve
-    # performance since that we could merge with the loop above.
     if not ignore_missing:
-        missing = []
-        for reference in references:
-            results = [res.result for res in resolutions if res.reference == reference]
-            if ReferenceResolutionResult.SUCCESS not in results:
-                missing.append(reference)
         # directories are automatically expanded, and thus they can
         # not be considered a reference that needs to exist after the
         # resolution process
-        missing = [_ for _ in missing if not os.path.isdir(_)]
-        if missing:
-            msg = f"Could not resolve references: {','.join(missing)}"
-            raise JobTestSuiteReferenceResolutionError(msg)
+        diagnostics = {}
+        for reference in references:
+            if reference in directories or reference in diagnostics:
+                continue
+            reference_resolutions = index.get(reference, [])
+            if not any(
+                res.result == ReferenceResolutionResult.SUCCESS
+                for res in reference_resolutions
+            ):
+                diagnostics[reference] = [
+                    res.get_diagnostics() for res in reference_resolutions
+                ]
+        if diagnostics:
+            msg = f"Could not resolve references: {','.join(diagnostics)}"
+            raise JobTestSuiteReferenceResolutionError(msg, diagnostics)
 
     return resolutions
+
+
+def _directory_sort_key(directory, path):
+    """Sorts files in the same order :func:`_extend_directory` lists them."""
+    components = os.path.relpath(path, directory).split(os.sep)
+    return tuple((1, _) for _ in components[:-1]) + ((0, components[-1]),)
+
+
+def _is_under(path, directory):
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+class IncrementalResolver:
+
+    """
+    Keeps the resolutions of references, updating only what changes.
+
+    Directory references are expanded once, and then kept up to date as
+    files are created or removed in them.  Each file is resolved again
+    only when it, or any of the modules looked at while resolving it
+    (such as the ones containing parent classes), changes.  Changes can
+    be given to :meth:`update`, or waited for with :meth:`wait`, which
+    watches the file system for them.
+    """
+
+    #: The file system events that may change the resolution of files
+    WATCH_MASK = (
+        inotify.IN_ATTRIB
+        | inotify.IN_CLOSE_WRITE
+        | inotify.IN_CREATE
+        | inotify.IN_DELETE
+        | inotify.IN_MOVED_FROM
+        | inotify.IN_MOVED_TO
+    )
+
+    #: How long to wait (in seconds) for further changes, once a change
+    #: is noticed, so that changes done at once are handled together
+    SETTLE_TIME = 0.1
+
+    def __init__(self, references, hint=None, config=None, watch=False):
+        """
+        :param references: the test references
+        :type references: list of str
+        :param hint: the hints to the resolution of some references
+        :type hint: :class:`avocado.core.parser.HintParser`
+        :param config: the configuration given to the resolvers
+        :type config: dict
+        :param watch: whether to watch the file system for changes, which
+                      must be set for :meth:`wait` to be used
+        :type watch: bool
+        """
+        self._references = list(references)
+        self._hint_references = {}
+        if hint:
+            self._hint_references = {r.reference: r for r in hint.get_resolutions()}
+        self._resolver = Resolver(config)
+        self._directories = {}
+        self._resolutions = {}
+        self._dependencies = {}
+        self._inotify = None
+        self._watched = set()
+        if watch:
+            # watching starts before the expansion, so no change is missed
+            self._inotify = inotify.Inotify()
+            self._watch_references()
+        self._expand_directories()
+
+    def _expand_directory(self, reference):
+        self._directories[reference] = [
+            (_directory_sort_key(reference, path), path)
+            for path, _ in _scan_directory(reference)
+        ]
+
+    def _expand_directories(self):
+        self._directories = {}
+        for reference in self._references:
+            if os.path.isdir(reference):
+                self._expand_directory(reference)
+
+    def _iter_references(self):
+        for reference in self._references:
+            files = self._directories.get(reference)
+            if files:
+                for _, path in files:
+                    yield path
+            else:
+                yield reference
+
+    def _resolve_reference(self, reference):
+        with record_dependencies() as dependencies:
+            resolutions = self._resolver.resolve(reference)
+        dependencies.add_path(reference_split(reference)[0])
+        self._resolutions[reference] = resolutions
+        self._dependencies[reference] = {os.path.abspath(_) for _ in dependencies.paths}
+        return resolutions
+
+    def resolve(self):
+        """Returns the resolutions of the references.
+
+        Only the references that were not resolved before, or that were
+        affected by changes since, are actually resolved.
+
+        :rtype: list of :class:`ReferenceResolution`
+        """
+        resolutions = []
+        for reference in self._iter_references():
+            if reference in self._hint_references:
+                resolutions.append(self._hint_references[reference])
+                continue
+            reference_resolutions = self._resolutions.get(reference)
+            if reference_resolutions is None:
+                reference_resolutions = self._resolve_reference(reference)
+            resolutions.extend(reference_resolutions)
+        return resolutions
+
+    def _update_directory(self, reference, path):
+        """Updates the files of a directory reference, given a changed path.
+
+        :returns: whether the files of the directory reference changed
+        """
+        relative_path = os.path.relpath(path, os.path.abspath(reference))
+        local_path = reference
+        if relative_path != os.curdir:
+            local_path = os.path.join(reference, relative_path)
+        files = self._directories.setdefault(reference, [])
+        if os.path.basename(local_path) == IGNORE_FILE_NAME:
+            # the files ignored may have changed anywhere below it
+            self._expand_directory(reference)
+            return self._directories[reference] != files
+        kept = [_ for _ in files if not _is_under(os.path.abspath(_[1]), path)]
+        changed = len(kept) != len(files)
+        added = []
+        if local_path == reference:
+            if os.path.isdir(local_path):
+                added = [found for found, _ in _scan_directory(local_path)]
+        else:
+            rules = _get_ignore_rules(reference, local_path)
+            if os.path.isdir(local_path):
+                if not (
+                    os.path.islink(local_path) or rules.is_ignored(local_path, True)
+                ):
+                    added = [found for found, _ in _scan_directory(local_path, rules)]
+            elif os.path.lexists(local_path):
+                if not (
+                    os.path.basename(local_path).startswith(".")
+                    or rules.is_ignored(local_path, False)
+                ):
+                    added = [local_path]
+        for added_path in added:
+            kept.append((_directory_sort_key(reference, added_path), added_path))
+            changed = True
+        if changed:
+            kept.sort()
+            self._directories[reference] = kept
+        return changed
+
+    def update(self, paths):
+        """Takes into account changes to the given paths.
+
+        :param paths: paths of files or directories that were created,
+                      changed or removed
+        :type paths: list of str
+        :returns: the paths that affect the resolutions
+        :rtype: set of str
+        """
+        relevant = set()
+        changed = {os.path.abspath(_) for _ in paths}
+        if any(not os.path.exists(_) or os.path.isdir(_) for _ in changed):
+            # modules may have been created or removed
+            clear_spec_cache()
+        for path in changed:
+            for reference in self._references:
+                if not os.path.isdir(reference) and reference not in self._directories:
+                    continue
+                if _is_under(path, os.path.abspath(reference)):
+                    if self._update_directory(reference, path):
+                        relevant.add(path)
+        for reference, dependencies in list(self._dependencies.items()):
+            affected = {
+                path
+                for path in changed
+                if any(_is_under(dependency, path) for dependency in dependencies)
+            }
+            if affected:
+                relevant.update(affected)
+                del self._dependencies[reference]
+                del self._resolutions[reference]
+        return relevant
+
+    def _watch(self, path):
+        if path in self._watched:
+            return
+        try:
+            self._inotify.add_watch(path, self.WATCH_MASK)
+        except OSError as details:
+            LOG.debug("Not watching %s for changes: %s", path, details)
+            return
+        self._watched.add(path)
+
+    def _watch_tree(self, path):
+        for dirpath, _, _ in os.walk(path):
+            self._watch(dirpath)
+
+    def _watch_references(self):
+        for reference in self._references:
+            path = reference_split(reference)[0]
+            if os.path.isdir(path):
+                self._watch_tree(path)
+            else:
+                self._watch(os.path.dirname(path) or os.curdir)
+
+    def _watch_dependencies(self):
+        for dependencies in self._dependencies.values():
+            for dependency in dependencies:
+                self._watch(os.path.dirname(dependency))
+
+    def _get_changed_paths(self, events):
+        changed = set()
+        for event in events:
+            if event.mask & inotify.IN_Q_OVERFLOW:
+                # changes were lost, so everything is started over
+                self._watched.clear()
+                self._watch_references()
+                self._expand_directories()
+                self._resolutions.clear()
+                self._dependencies.clear()
+                clear_spec_cache()
+                return None
+            if event.mask & inotify.IN_IGNORED:
+                self._watched.discard(event.path)
+                continue
+            path = os.path.join(event.path, event.name)
+            if event.mask & inotify.IN_ISDIR and event.mask & (
+                inotify.IN_CREATE | inotify.IN_MOVED_TO
+            ):
+                self._watch_tree(path)
+            changed.add(path)
+        return changed
+
+    def wait(self, timeout=None):
+        """Waits for changes that affect the resolutions.
+
+        :param timeout: how long to wait for changes, in seconds, or None
+                        to wait until there are changes
+        :type timeout: float
+        :returns: the paths changed, which may be none if the timeout was
+                  reached, or None if changes may have been lost, and
+                  everything will be resolved again
+        :rtype: list of str
+        """
+        if self._inotify is None:
+            raise RuntimeError("Not watching the file system for changes")
+        self._watch_dependencies()
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        while True:
+            if deadline is not None:
+                timeout = max(0, deadline - time.monotonic())
+            events = self._inotify.read_events(timeout)
+            if not events:
+                return []
+            while True:
+                settling = self._inotify.read_events(self.SETTLE_TIME)
+                if not settling:
+                    break
+                events.extend(settling)
+            changed = self._get_changed_paths(events)
+            if changed is None:
+                return None
+            relevant = self.update(changed)
+            if relevant:
+                return sorted(relevant)
+
+    def close(self):
+        """Stops watching the file system for changes."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watched.clear()
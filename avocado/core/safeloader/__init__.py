@@ -18,5 +18,6 @@ Safe (AST based) test loader module utilities
 """
 
 from avocado.core.safeloader.core import find_avocado_tests, find_python_unittests
+from avocado.core.safeloader.store import get_parsed_module
 
-__all__ = ["find_avocado_tests", "find_python_unittests"]
+__all__ = ["find_avocado_tests", "find_python_unittests", "get_parsed_module"]
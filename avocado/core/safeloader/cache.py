@@ -0,0 +1,317 @@
+"""
+Persistent cache of the tests found on Python source files.
+
+Finding tests means parsing the module given, and every other module
+that a class on it inherits from, no matter how many times those were
+parsed before.  The tests found are thus kept in files under the data
+directory, along with the location, modification time and size of
+every module that was looked at while finding them (the module itself,
+and those containing parent classes), and the modules found when
+looking for the importable modules containing parent classes.  The
+result is reused until any of those modules change, a different module
+is found when looking for any of them, or a different version of
+Avocado is used.
+
+Entries not used for :data:`MAX_AGE` seconds are removed, and so are
+the least recently used ones beyond :data:`MAX_ENTRIES`.
+"""
+
+import collections
+import contextlib
+import hashlib
+import os
+import sys
+import threading
+
+from avocado.core.data_dir import get_datafile_path
+from avocado.core.safeloader.utils import find_importable_spec
+from avocado.core.utils import cache
+
+#: The name of the directory with the cache files, inside the "cache"
+#: data directory
+CACHE_DIR_NAME = "safeloader"
+
+#: The maximum number of modules whose tests are kept in the cache
+MAX_ENTRIES = 4096
+
+#: The maximum time (in seconds) the tests found on a module are kept in
+#: the cache without being used
+MAX_AGE = 30 * 24 * 60 * 60
+
+_RECORDING = threading.local()
+
+#: Whether old entries have already been removed by this process
+_PRUNED = False
+
+
+class Dependencies:
+    """What the tests found on a module depend on."""
+
+    def __init__(self):
+        #: The paths of the modules looked at
+        self.paths = []
+        #: The importable modules looked for, as pairs with the components
+        #: of their name, as given to
+        #: :func:`avocado.core.safeloader.utils.find_importable_spec`,
+        #: and the location of the module looking for them
+        self.lookups = []
+
+    def add_path(self, path):
+        if path not in self.paths:
+            self.paths.append(path)
+
+    def add_lookup(self, components, location):
+        lookup = (components, location)
+        if lookup not in self.lookups:
+            self.lookups.append(lookup)
+
+    def update(self, other):
+        """Adds the dependencies of another instance to this one."""
+        for path in other.paths:
+            self.add_path(path)
+        for components, location in other.lookups:
+            self.add_lookup(components, location)
+
+
+@contextlib.contextmanager
+def record_dependencies():
+    """Records the modules looked at and looked for while finding tests.
+
+    Recordings can be nested, and the dependencies recorded on the inner
+    recording are also added to the outer one.
+
+    :returns: a :class:`Dependencies` instance that gets the paths given
+              to :func:`add_dependency`, and the lookups given to
+              :func:`add_lookup`, while in the context
+    """
+    previous = getattr(_RECORDING, "dependencies", None)
+    dependencies = Dependencies()
+    _RECORDING.dependencies = dependencies
+    try:
+        yield dependencies
+    finally:
+        _RECORDING.dependencies = previous
+        add_dependencies(dependencies)
+
+
+def add_dependency(path):
+    """Adds a module looked at to the ones being recorded, if any."""
+    dependencies = getattr(_RECORDING, "dependencies", None)
+    if dependencies is not None:
+        dependencies.add_path(path)
+
+
+def add_lookup(components, location):
+    """Adds an importable module looked for to the ones being recorded, if any.
+
+    :param components: the components of the module name, as given to
+                       :func:`avocado.core.safeloader.utils.find_importable_spec`
+    :type components: tuple of tuple
+    :param location: the location of the module looking for it, which is
+                     searched before the Python module search path
+    :type location: str
+    """
+    dependencies = getattr(_RECORDING, "dependencies", None)
+    if dependencies is not None:
+        dependencies.add_lookup(components, location)
+
+
+def add_dependencies(dependencies):
+    """Adds all dependencies to the ones being recorded, if any."""
+    recording = getattr(_RECORDING, "dependencies", None)
+    if recording is not None:
+        recording.update(dependencies)
+
+
+def get_cache_dir():
+    """Returns the location of the cache files."""
+    return get_datafile_path("cache", CACHE_DIR_NAME)
+
+
+def get_cache_path(path):
+    """Returns the location of the cache file for a given module."""
+    digest = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_dir(), f"{digest}.json")
+
+
+def _find_origin(components, location):
+    spec = find_importable_spec(components, tuple([location] + sys.path))
+    if spec is None:
+        return None
+    return spec.origin
+
+
+def get_fingerprint(dependencies):
+    """Identifies the state of the given dependencies.
+
+    :type dependencies: :class:`Dependencies`
+    :returns: the path, modification time and size of each module looked
+              at, and the module found for each one looked for, or None if
+              any of the modules looked at could not be found
+    :rtype: dict
+    """
+    modules = []
+    for path in dependencies.paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        modules.append([os.path.abspath(path), stat.st_mtime_ns, stat.st_size])
+    lookups = []
+    for components, location in dependencies.lookups:
+        origin = _find_origin(components, location)
+        lookups.append(
+            [[list(component) for component in components], location, origin]
+        )
+    return {"modules": modules, "lookups": lookups}
+
+
+def _get_dependencies(fingerprint):
+    dependencies = Dependencies()
+    for path, _, _ in fingerprint["modules"]:
+        dependencies.add_path(path)
+    for components, location, _ in fingerprint["lookups"]:
+        components = tuple(tuple(component) for component in components)
+        dependencies.add_lookup(components, location)
+    return dependencies
+
+
+def _encode_tags(tags):
+    return {
+        key: sorted(value) if value is not None else None for key, value in tags.items()
+    }
+
+
+def _decode_tags(tags):
+    return {
+        key: set(value) if value is not None else None for key, value in tags.items()
+    }
+
+
+def _encode(result, disabled):
+    return {
+        "classes": [
+            [klass, [[name, _encode_tags(tags), deps] for name, tags, deps in info]]
+            for klass, info in result.items()
+        ],
+        "disabled": sorted(disabled),
+    }
+
+
+def _decode(data):
+    result = collections.OrderedDict()
+    for klass, info in data["classes"]:
+        result[klass] = [(name, _decode_tags(tags), deps) for name, tags, deps in info]
+    return result, set(data["disabled"])
+
+
+def _load(cache_path):
+    data = cache.load(cache_path)
+    if data is None:
+        return {}
+    targets = data.get("targets")
+    if not isinstance(targets, dict):
+        return {}
+    return targets
+
+
+def get_tests(path, target):
+    """Returns the cached tests found on a module.
+
+    :param path: path to a Python source code file
+    :type path: str
+    :param target: the kind of tests, such as "avocado.Test"
+    :type target: str
+    :returns: the tests found, as returned by
+              :func:`avocado.core.safeloader.core.find_python_tests`, or
+              None if they're not cached or any of their dependencies
+              have changed.  The dependencies are added to the ones
+              being recorded, if any.
+    :rtype: tuple or None
+    """
+    cache_path = get_cache_path(path)
+    entry = _load(cache_path).get(target)
+    if not isinstance(entry, dict):
+        return None
+    fingerprint = entry.get("fingerprint")
+    try:
+        dependencies = _get_dependencies(fingerprint)
+        if not dependencies.paths or get_fingerprint(dependencies) != fingerprint:
+            return None
+        tests = _decode(entry["tests"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    cache.touch(cache_path)
+    add_dependencies(dependencies)
+    return tests
+
+
+def set_tests(path, target, dependencies, result, disabled):
+    """Saves the tests found on a module in the cache.
+
+    Failures to write the cache are not fatal, as it only means the
+    module will be parsed again.  The first time it's called in a
+    process, old entries are removed with :func:`prune`.
+
+    :param path: path to a Python source code file
+    :type path: str
+    :param target: the kind of tests, such as "avocado.Test"
+    :type target: str
+    :param dependencies: the dependencies of the tests, as recorded by
+                         :func:`record_dependencies`
+    :type dependencies: :class:`Dependencies`
+    :param result: the test classes and their methods information
+    :type result: dict
+    :param disabled: the class names that were forcefully disabled
+    :type disabled: set
+    """
+    global _PRUNED  # pylint: disable=W0603
+    fingerprint = get_fingerprint(dependencies)
+    if not fingerprint or not fingerprint["modules"]:
+        return
+    cache_path = get_cache_path(path)
+    targets = _load(cache_path)
+    targets[target] = {
+        "fingerprint": fingerprint,
+        "tests": _encode(result, disabled),
+    }
+    try:
+        cache.save(cache_path, {"path": os.path.abspath(path), "targets": targets})
+    except OSError:
+        return
+    if not _PRUNED:
+        _PRUNED = True
+        prune()
+
+
+def prune(max_entries=MAX_ENTRIES, max_age=MAX_AGE):
+    """Removes the entries not used for a while from the cache.
+
+    :param max_entries: the maximum number of entries kept, the least
+                        recently used ones beyond it being removed
+    :type max_entries: int
+    :param max_age: the maximum time (in seconds) an entry is kept
+                    without being used
+    :type max_age: int
+    """
+    cache.prune(get_cache_dir(), max_entries, max_age)
+
+
+def get_entries():
+    """Returns the modules whose tests are in the cache.
+
+    :returns: the path of each module, and the kinds of tests found on it
+    :rtype: list of tuple
+    """
+    entries = []
+    for data in cache.iter_entries(get_cache_dir()):
+        try:
+            entries.append((data["path"], sorted(data["targets"])))
+        except (KeyError, TypeError):
+            continue
+    return sorted(entries)
+
+
+def clear():
+    """Removes all entries from the cache."""
+    cache.clear(get_cache_dir())
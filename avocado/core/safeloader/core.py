@@ -1,8 +1,13 @@
 import ast
 import collections
+import copy
+import os
 import sys
+import threading
 from importlib.machinery import PathFinder
 
+from avocado.core import profiling
+from avocado.core.safeloader import cache
 from avocado.core.safeloader.docstring import (
     check_docstring_directive,
     get_docstring_directives,
@@ -10,6 +15,13 @@ from avocado.core.safeloader.docstring import (
     get_docstring_directives_tags,
 )
 from avocado.core.safeloader.module import PythonModule
+from avocado.core.safeloader.utils import clear_spec_cache
+
+#: The results of the examination of classes, along with the modules
+#: looked at during the examination, and their state at the time
+_EXAMINED_CLASSES = {}
+
+_EXAMINING = threading.local()
 
 
 def get_methods_info(statement_body, class_tags, class_dependencies):
@@ -182,6 +194,12 @@ def _find_import_match(parent_path, parent_module):
     return found_spec
 
 
+def clear_caches():
+    """Forgets the classes examined and importable modules found so far."""
+    _EXAMINED_CLASSES.clear()
+    clear_spec_cache()
+
+
 def _examine_class(
     target_module, target_class, determine_match, path, class_name, match
 ):
@@ -216,6 +234,50 @@ def _examine_class(
               look like avocado tests but are force-disabled.
     :rtype: tuple
     """
+    # classes are usually inherited by many others, so the result of
+    # their examination is reused while the modules looked at don't change
+    key = (target_module, target_class, os.path.abspath(path), class_name, match)
+    examined = _EXAMINED_CLASSES.get(key)
+    if examined is not None:
+        dependencies, fingerprint, result = examined
+        if cache.get_fingerprint(dependencies) == fingerprint:
+            cache.add_dependencies(dependencies)
+            return copy.deepcopy(result)
+
+    examining = getattr(_EXAMINING, "classes", None)
+    if examining is None:
+        examining = _EXAMINING.classes = {}
+    if key in examining:
+        # a cycle in the inheritance, as seen from the source code alone,
+        # so there's nothing else to find, but the classes being examined
+        # have incomplete results that can not be reused
+        examining.update(dict.fromkeys(examining, False))
+        return [], set(), match
+
+    examining[key] = True
+    try:
+        with profiling.measure(profiling.STAGE_INHERITANCE):
+            with cache.record_dependencies() as dependencies:
+                result = _examine_class_uncached(
+                    target_module,
+                    target_class,
+                    determine_match,
+                    path,
+                    class_name,
+                    match,
+                )
+    finally:
+        reusable = examining.pop(key)
+    if reusable:
+        fingerprint = cache.get_fingerprint(dependencies)
+        if fingerprint is not None:
+            _EXAMINED_CLASSES[key] = (dependencies, fingerprint, copy.deepcopy(result))
+    return result
+
+
+def _examine_class_uncached(
+    target_module, target_class, determine_match, path, class_name, match
+):
     module = PythonModule(path, target_module, target_class)
     info = []
     disabled = set()
@@ -236,7 +298,7 @@ def _examine_class(
         )
 
         # Getting the list of parents of the current class
-        parents = klass.bases
+        parents = list(klass.bases)
 
         match = _examine_same_module(
             parents,
@@ -370,7 +432,7 @@ def find_python_tests(target_module, target_class, determine_match, path):
             get_docstring_directives_dependencies(docstring),
         )
         # Getting the list of parents of the current class
-        parents = klass.bases
+        parents = list(klass.bases)
 
         match = _examine_same_module(
             parents,
@@ -439,10 +501,49 @@ def _determine_match_python(module, klass, docstring):
     return module.is_matching_klass(klass)
 
 
-def find_avocado_tests(path):
-    return find_python_tests("avocado", "Test", _determine_match_python, path)
+def _find_python_tests_cached(target_module, target_class, path, use_cache):
+    """Finds Python tests, reusing the results from previous executions.
 
+    The results are kept in the cache along with all the modules looked
+    at while finding them, so that changes to modules containing parent
+    classes are also noticed.
+    """
+    if not use_cache:
+        return find_python_tests(
+            target_module, target_class, _determine_match_python, path
+        )
+    target = f"{target_module}.{target_class}"
+    found = cache.get_tests(path, target)
+    if found is not None:
+        return found
+    with cache.record_dependencies() as dependencies:
+        result, disabled = find_python_tests(
+            target_module, target_class, _determine_match_python, path
+        )
+    cache.set_tests(path, target, dependencies, result, disabled)
+    return result, disabled
+
+
+def find_avocado_tests(path, use_cache=True):
+    """Finds Avocado instrumented tests.
+
+    :param path: path to a Python source code file
+    :type path: str
+    :param use_cache: whether to use the persistent cache of the tests
+                      found, from :mod:`avocado.core.safeloader.cache`
+    :type use_cache: bool
+    """
+    return _find_python_tests_cached("avocado", "Test", path, use_cache)
+
+
+def find_python_unittests(path, use_cache=True):
+    """Finds Python unittests.
 
-def find_python_unittests(path):
-    found, _ = find_python_tests("unittest", "TestCase", _determine_match_python, path)
+    :param path: path to a Python source code file
+    :type path: str
+    :param use_cache: whether to use the persistent cache of the tests
+                      found, from :mod:`avocado.core.safeloader.cache`
+    :type use_cache: bool
+    """
+    found, _ = _find_python_tests_cached("unittest", "TestCase", path, use_cache)
     return found
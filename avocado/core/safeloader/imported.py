@@ -1,9 +1,12 @@
 import ast
 import os
 import sys
-from importlib.machinery import PathFinder
 
-from avocado.core.safeloader.utils import get_statement_import_as
+from avocado.core.safeloader.cache import add_lookup
+from avocado.core.safeloader.utils import (
+    find_importable_spec,
+    get_statement_import_as,
+)
 
 
 class ImportedSymbol:
@@ -91,18 +94,10 @@ class ImportedSymbol:
                                  an importable spec
         :type symbol_is_module: bool
         """
-        modules_paths = sys.path
-        modules_paths.insert(0, self.get_relative_module_fs_path())
-        spec = None
-        for component, previous in self._walk_importable_components(symbol_is_module):
-            if previous:
-                modules_paths = [
-                    os.path.join(mod, previous) for mod in modules_paths[:]
-                ]
-            spec = PathFinder.find_spec(component, modules_paths)
-            if spec is None:
-                break
-        return spec
+        components = tuple(self._walk_importable_components(symbol_is_module))
+        location = self.get_relative_module_fs_path()
+        add_lookup(components, location)
+        return find_importable_spec(components, tuple([location] + sys.path))
 
     def is_importable(self, symbol_is_module=False):
         """Checks whether this imported symbol seems to be importable.
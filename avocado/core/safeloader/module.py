@@ -1,7 +1,8 @@
 import ast
 import os
 
-from avocado.core.safeloader.imported import ImportedSymbol
+from avocado.core.safeloader.cache import add_dependency
+from avocado.core.safeloader.store import get_parsed_module
 from avocado.core.safeloader.utils import get_statement_import_as
 
 
@@ -23,6 +24,7 @@ class PythonModule:
         "klass",
         "imported_symbols",
         "interesting_klass_found",
+        "_parsed",
     )
 
     def __init__(self, path, module="avocado", klass="Test"):
@@ -46,8 +48,9 @@ class PythonModule:
         self.module = module
         self.klass = klass
         self.imported_symbols = {}
-        with open(self.path, encoding="utf-8") as source_file:
-            self.mod = ast.parse(source_file.read(), self.path)
+        self._parsed = get_parsed_module(self.path)
+        self.mod = self._parsed.tree
+        add_dependency(self.path)
         self.interesting_klass_found = False
 
     def is_matching_klass(self, klass):
@@ -110,18 +113,9 @@ class PythonModule:
         """
         Keeps track of symbol names and importable entities
         """
-        for index, name in enumerate(statement.names):
-            final_name = self._get_name_from_alias_statement(name)
-            imported_symbol = ImportedSymbol.from_statement(
-                statement, os.path.abspath(self.path), index
-            )
+        for final_name, imported_symbol in self._parsed.get_imported_symbols(statement):
             self.imported_symbols[final_name] = imported_symbol
 
-    @staticmethod
-    def _get_name_from_alias_statement(alias):
-        """Returns the aliased name or original one."""
-        return alias.asname if alias.asname else alias.name
-
     def _handle_import_from(self, statement, interesting_klass):
         self.add_imported_symbol(statement)
         if interesting_klass in [name.name for name in statement.names]:
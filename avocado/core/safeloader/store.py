@@ -0,0 +1,126 @@
+"""
+Store of parsed Python modules, shared by everything that looks at them.
+
+The same module is usually looked at many times during a job: by each
+resolver that finds Python based tests, when looking for parent classes
+of tests in other modules, and when looking for assets to be fetched.
+Instead of reading and parsing it every time, the parsed module is kept
+in a store, until the module changes on disk, it's evicted to make room
+for other modules, or the store is cleared at the end of the job.
+"""
+
+import ast
+import collections
+import os
+import threading
+
+from avocado.core import profiling
+from avocado.core.safeloader.imported import ImportedSymbol
+
+#: The maximum number of parsed modules kept in the store
+STORE_SIZE = 256
+
+
+class ParsedModule:
+    """The parsed source code of a Python module."""
+
+    __slots__ = ("path", "tree", "_imported_symbols")
+
+    def __init__(self, path):
+        """
+        :param path: path to a Python source code file
+        :type path: str
+        """
+        self.path = path
+        with open(path, encoding="utf-8") as source_file:
+            self.tree = ast.parse(source_file.read(), path)
+        self._imported_symbols = {}
+
+    def get_imported_symbols(self, statement):
+        """Returns the symbols imported by an import statement.
+
+        :param statement: an import statement
+        :type statement: :class:`ast.Import` or :class:`ast.ImportFrom`
+        :returns: the name given to each symbol, and the imported symbol
+        :rtype: list of tuple of (str,
+                :class:`avocado.core.safeloader.imported.ImportedSymbol`)
+        """
+        cached = self._imported_symbols.get(id(statement))
+        if cached is not None and cached[0] is statement:
+            return cached[1]
+        importer_fs_path = os.path.abspath(self.path)
+        symbols = []
+        for index, alias in enumerate(statement.names):
+            name = alias.asname if alias.asname else alias.name
+            symbols.append(
+                (
+                    name,
+                    ImportedSymbol.from_statement(statement, importer_fs_path, index),
+                )
+            )
+        self._imported_symbols[id(statement)] = (statement, symbols)
+        return symbols
+
+
+class ModuleStore:
+    """A bounded store of parsed modules, validated against their files."""
+
+    def __init__(self, size=STORE_SIZE):
+        self._size = size
+        self._modules = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._modules)
+
+    @staticmethod
+    def _get_state(path):
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path):
+        """Returns a parsed module, parsing it only if needed.
+
+        :param path: path to a Python source code file
+        :type path: str
+        :rtype: :class:`ParsedModule`
+        """
+        key = os.path.abspath(path)
+        state = self._get_state(key)
+        with self._lock:
+            entry = self._modules.get(key)
+            if entry is not None and entry[0] == state:
+                self._modules.move_to_end(key)
+                return entry[1]
+        with profiling.measure(profiling.STAGE_PARSE):
+            module = ParsedModule(path)
+        with self._lock:
+            self._modules[key] = (state, module)
+            self._modules.move_to_end(key)
+            while len(self._modules) > self._size:
+                self._modules.popitem(last=False)
+        return module
+
+    def clear(self):
+        """Drops all the parsed modules."""
+        with self._lock:
+            self._modules.clear()
+
+
+#: The store used by the safeloader and the plugins using it
+STORE = ModuleStore()
+
+
+def get_parsed_module(path):
+    """Returns a parsed module from the store.
+
+    :param path: path to a Python source code file
+    :type path: str
+    :rtype: :class:`ParsedModule`
+    """
+    return STORE.get(path)
+
+
+def clear():
+    """Drops all the parsed modules from the store."""
+    STORE.clear()
@@ -1,5 +1,37 @@
 import ast
 import collections
+import functools
+import os
+from importlib.machinery import PathFinder
+
+#: The maximum number of importable module specifications kept
+SPEC_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=SPEC_CACHE_SIZE)
+def find_importable_spec(components, modules_paths):
+    """Finds the specification of an importable module.
+
+    :param components: the components of the module name, each one in a
+                       pair along with the component before it
+    :type components: tuple of tuple
+    :param modules_paths: the paths where to look for the module
+    :type modules_paths: tuple
+    :rtype: :class:`importlib.machinery.ModuleSpec` or None
+    """
+    spec = None
+    for component, previous in components:
+        if previous:
+            modules_paths = [os.path.join(mod, previous) for mod in modules_paths]
+        spec = PathFinder.find_spec(component, modules_paths)
+        if spec is None:
+            break
+    return spec
+
+
+def clear_spec_cache():
+    """Forgets the importable module specifications found so far."""
+    find_importable_spec.cache_clear()
 
 
 def get_statement_import_as(statement):
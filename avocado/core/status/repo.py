@@ -1,4 +1,4 @@
-import heapq
+import asyncio
 import logging
 
 from avocado.core.status.utils import json_loads
@@ -30,11 +30,30 @@ class StatusRepo:
         #: the status type of message.
         self._status = {}
         #: Contains a global journal of status updates to be picked, each
-        #: entry containing a tuple with (task_id, status, time).  It discards
-        #: status that have been superseded by newer status.
-        self._status_journal_summary = []
+        #: entry containing a tuple with (time, task_id, status, index).
+        #: It's a priority queue, so consumers get the oldest entry
+        #: first, and can wait for new entries without polling.  It's
+        #: created on first use, see :meth:`_get_status_journal_summary`.
+        self._status_journal_summary = None
         #: Contains the task IDs keyed by the result received
         self._by_result = {}
+        #: The same as :attr:`_by_result`, but as sets for fast lookups
+        self._by_result_ids = {}
+        #: Contains the finished message of a task, keyed by the task ID
+        self._finished_data = {}
+        #: Futures for tasks' finished messages, keyed by the task ID
+        self._finished_futures = {}
+
+    def _get_status_journal_summary(self):
+        """Returns the journal of status updates, creating it if needed.
+
+        Before Python 3.10, a queue is bound to the event loop current
+        at its creation, so it's only created when first used, from the
+        event loop that runs the consumers.
+        """
+        if self._status_journal_summary is None:
+            self._status_journal_summary = asyncio.PriorityQueue()
+        return self._status_journal_summary
 
     def _handle_task_finished(self, message):
         task_id = message["id"]
@@ -56,7 +75,11 @@ class StatusRepo:
 
         self._set_by_result(message)
         self._set_task_data(message)
+        self._finished_data[task_id] = message
         LOG.debug('Task "%s" finished message: "%s"', task_id, message)
+        future = self._finished_futures.pop(task_id, None)
+        if future is not None and not future.done():
+            future.set_result(message)
 
     def _handle_task_started(self, message):
         if "output_dir" not in message:
@@ -74,8 +97,10 @@ class StatusRepo:
         result = message.get("result")
         if result not in self._by_result:
             self._by_result[result] = []
-        if message["id"] not in self._by_result[result]:
+            self._by_result_ids[result] = set()
+        if message["id"] not in self._by_result_ids[result]:
             self._by_result[result].append(message["id"])
+            self._by_result_ids[result].add(message["id"])
 
     def _set_task_data(self, message):
         """Appends all data on message to an entry keyed by the task's ID."""
@@ -100,8 +125,47 @@ class StatusRepo:
             return None
         return task_data[-1]
 
+    async def wait_task_finished(self, task_id):
+        """Waits for the finished message of a given task, by its ID.
+
+        :returns: the data on the task's finished message
+        :rtype: dict
+        """
+        finished_data = self._finished_data.get(task_id)
+        if finished_data is not None:
+            return finished_data
+        future = self._finished_futures.get(task_id)
+        if future is None:
+            future = asyncio.get_event_loop().create_future()
+            self._finished_futures[task_id] = future
+        return await future
+
     def status_journal_summary_pop(self):
-        return heapq.heappop(self._status_journal_summary)
+        """Returns the oldest entry in the journal, without waiting.
+
+        :raises IndexError: if there are no entries in the journal
+        """
+        try:
+            return self._get_status_journal_summary().get_nowait()
+        except asyncio.QueueEmpty as details:
+            raise IndexError("status journal summary is empty") from details
+
+    async def status_journal_summary_get(self):
+        """Returns the oldest entry in the journal, waiting for one if needed.
+
+        Consumers should call :meth:`status_journal_summary_done` after
+        processing each entry, so that :meth:`status_journal_summary_join`
+        knows when all entries have been processed.
+        """
+        return await self._get_status_journal_summary().get()
+
+    def status_journal_summary_done(self):
+        """Signals that an entry from the journal has been processed."""
+        self._get_status_journal_summary().task_done()
+
+    async def status_journal_summary_join(self):
+        """Waits until all entries put in the journal have been processed."""
+        await self._get_status_journal_summary().join()
 
     def _update_status(self, message):
         """Update the latest status of a task (by message)."""
@@ -110,9 +174,10 @@ class StatusRepo:
         time = message.get("time")
         if not all((task_id, status, time)):
             return
+        journal = self._get_status_journal_summary()
         if task_id not in self._status:
             self._status[task_id] = (status, time)
-            heapq.heappush(self._status_journal_summary, (time, task_id, status, 0))
+            journal.put_nowait((time, task_id, status, 0))
         else:
             current_status, _ = self._status[task_id]
             if current_status == "finished":
@@ -128,7 +193,7 @@ class StatusRepo:
             else:
                 self._status[task_id] = (status, time)
             index = len(self.get_all_task_data(task_id))
-            heapq.heappush(self._status_journal_summary, (time, task_id, status, index))
+            journal.put_nowait((time, task_id, status, index))
 
     def process_message(self, message):
         for required_field in ("id", "job_id"):
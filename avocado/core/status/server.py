@@ -3,6 +3,11 @@ import os
 import sys
 
 from avocado.core.settings import settings
+from avocado.core.status.utils import (
+    FRAME_HEADER,
+    STATUS_PROTOCOL_FRAMED_PREAMBLE,
+    frame_decode,
+)
 
 
 class StatusServer:
@@ -51,9 +56,25 @@ class StatusServer:
         if os.path.exists(self._uri):
             os.unlink(self._uri)
 
+    async def _process_frames(self, reader):
+        while True:
+            try:
+                header = await reader.readexactly(FRAME_HEADER.size)
+                encoded_size, blobs_size = FRAME_HEADER.unpack(header)
+                frame = await reader.readexactly(encoded_size + blobs_size)
+            except asyncio.IncompleteReadError:
+                return
+            for message in frame_decode(frame[:encoded_size], frame[encoded_size:]):
+                self._repo.process_message(message)
+
     async def cb(self, reader, _):
+        first = True
         while True:
             raw_message = await reader.readline()
             if not raw_message:
                 return
+            if first and raw_message == STATUS_PROTOCOL_FRAMED_PREAMBLE:
+                await self._process_frames(reader)
+                return
+            first = False
             self._repo.process_raw_message(raw_message)
@@ -1,5 +1,6 @@
 import base64
 import json
+import struct
 
 
 class StatusMsgInvalidJSONError(Exception):
@@ -28,3 +29,78 @@ def json_loads(data):
         return json.loads(data, object_hook=json_base64_decode)
     except json.decoder.JSONDecodeError:
         raise StatusMsgInvalidJSONError(data)
+
+
+#: The original status protocol, with one JSON encoded message per line,
+#: and bytes encoded in base64
+STATUS_PROTOCOL_JSON_LINES = "json-lines"
+
+#: A status protocol with length prefixed frames, each one containing a
+#: batch of messages, and bytes sent as they are (not encoded in base64)
+STATUS_PROTOCOL_FRAMED = "framed-v1"
+
+#: The status protocols supported, in order of preference
+STATUS_PROTOCOLS = (STATUS_PROTOCOL_FRAMED, STATUS_PROTOCOL_JSON_LINES)
+
+#: The line a client sends right after connecting, to tell the status
+#: server it's going to use the framed protocol.  Without it, the server
+#: assumes the JSON lines protocol.
+STATUS_PROTOCOL_FRAMED_PREAMBLE = f"avocado-status {STATUS_PROTOCOL_FRAMED}\n".encode(
+    "ascii"
+)
+
+#: The header of a frame: the size of the JSON encoded batch of messages
+#: followed by the size of the raw data the messages point to
+FRAME_HEADER = struct.Struct(">II")
+
+
+def frame_encode(messages):
+    """Encodes a batch of messages into a frame of the framed protocol.
+
+    Bytes found in the messages are not encoded in the JSON part of the
+    frame, but appended raw to the end of it.
+
+    :param messages: the status messages
+    :type messages: list of dict
+    :rtype: bytes
+    """
+    blobs = []
+    blobs_size = 0
+
+    def blob_reference(obj):
+        nonlocal blobs_size
+        if isinstance(obj, bytes):
+            reference = {"__blob__": [blobs_size, len(obj)]}
+            blobs.append(obj)
+            blobs_size += len(obj)
+            return reference
+        raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+    encoded = json.dumps(messages, ensure_ascii=True, default=blob_reference).encode(
+        "ascii"
+    )
+    return FRAME_HEADER.pack(len(encoded), blobs_size) + encoded + b"".join(blobs)
+
+
+def frame_decode(encoded, blobs):
+    """Decodes the contents of a frame of the framed protocol.
+
+    :param encoded: the JSON encoded batch of messages
+    :type encoded: bytes
+    :param blobs: the raw data pointed to by the messages
+    :type blobs: bytes
+    :returns: the status messages
+    :rtype: list of dict
+    """
+
+    def blob_dereference(dct):
+        reference = dct.get("__blob__")
+        if reference is not None and len(dct) == 1:
+            start, size = reference
+            return blobs[start : start + size]
+        return dct
+
+    try:
+        return json.loads(encoded.decode("ascii"), object_hook=blob_dereference)
+    except json.decoder.JSONDecodeError:
+        raise StatusMsgInvalidJSONError(encoded)
@@ -16,6 +16,7 @@ import os
 from enum import Enum
 from uuid import uuid4
 
+from avocado.core import profiling
 from avocado.core.dispatcher import SuiteRunnerDispatcher
 from avocado.core.exceptions import (
     JobTestSuiteReferenceResolutionError,
@@ -63,20 +64,22 @@ def resolutions_to_runnables(resolutions, config):
     :returns: the resolutions converted to runnables
     :rtype: list of :class:`avocado.core.nrunner.Runnable`
     """
-    filter_by_tags = config.get("filter.by_tags.tags")
-    include_empty = config.get("filter.by_tags.include_empty")
-    include_empty_key = config.get("filter.by_tags.include_empty_key")
-    if filter_by_tags:
-        return filter_tags_on_runnables(
-            resolutions, filter_by_tags, include_empty, include_empty_key
-        )
-    result = []
-    for resolution in resolutions:
-        if resolution.result != ReferenceResolutionResult.SUCCESS:
-            continue
-        for runnable in resolution.resolutions:
-            result.append(runnable)
-    return result
+    with profiling.measure(profiling.STAGE_RUNNABLES):
+        filter_by_tags = config.get("filter.by_tags.tags")
+        include_empty = config.get("filter.by_tags.include_empty")
+        include_empty_key = config.get("filter.by_tags.include_empty_key")
+        if filter_by_tags:
+            with profiling.measure(profiling.STAGE_TAGS):
+                return filter_tags_on_runnables(
+                    resolutions, filter_by_tags, include_empty, include_empty_key
+                )
+        result = []
+        for resolution in resolutions:
+            if resolution.result != ReferenceResolutionResult.SUCCESS:
+                continue
+            for runnable in resolution.resolutions:
+                result.append(runnable)
+        return result
 
 
 class TestSuite:
@@ -88,11 +91,15 @@ class TestSuite:
         job_config=None,
         resolutions=None,
         enabled=True,
+        profile=None,
     ):
         self.name = name
         self.tests = tests
         self.resolutions = resolutions
         self.enabled = enabled
+        #: The time spent resolving the tests, as a
+        #: :class:`avocado.core.profiling.Profile`, if known
+        self.profile = profile
 
         # Create a complete config dict with all registered options + custom
         # config
@@ -151,22 +158,30 @@ class TestSuite:
     def _from_config_with_resolver(cls, config, name=None):
         ignore_missing = config.get("run.ignore_missing_references")
         references = config.get("resolver.references")
-        try:
-            hint = None
-            hint_filepath = ".avocado.hint"
-            if os.path.exists(hint_filepath):
-                hint = HintParser(hint_filepath)
-            resolutions = resolve(
-                references, hint=hint, ignore_missing=ignore_missing, config=config
-            )
-        except JobTestSuiteReferenceResolutionError as details:
-            raise TestSuiteError(details)
+        with profiling.record_profile() as profile:
+            try:
+                hint = None
+                hint_filepath = ".avocado.hint"
+                if os.path.exists(hint_filepath):
+                    hint = HintParser(hint_filepath)
+                resolutions = resolve(
+                    references, hint=hint, ignore_missing=ignore_missing, config=config
+                )
+            except JobTestSuiteReferenceResolutionError as details:
+                raise TestSuiteError(details)
 
-        runnables = resolutions_to_runnables(resolutions, config)
+            runnables = resolutions_to_runnables(resolutions, config)
+        profile.add_resolutions(resolutions)
 
         if name is None:
             name = str(uuid4())
-        return cls(name=name, config=config, tests=runnables, resolutions=resolutions)
+        return cls(
+            name=name,
+            config=config,
+            tests=runnables,
+            resolutions=resolutions,
+            profile=profile,
+        )
 
     def _get_stats_from_nrunner(self):
         stats = {}
@@ -270,33 +285,41 @@ class TestSuite:
             self._variants = variants
         return self._variants
 
-    def get_test_variants(self):
-        """Computes test variants based on the parameters"""
+    def iter_test_variants(self):
+        """Yields test variants based on the parameters, one at a time.
 
+        The variants are produced by the varianter only as they are
+        needed, and their number is given by
+        :meth:`avocado.core.varianter.Varianter.get_number_of_tests`.
+
+        :returns: the tests, along with each of their variants
+        :rtype: iterator of tuple of
+                (:class:`avocado.core.nrunner.Runnable`, dict)
+        """
         if self.test_parameters:
             paths = ["/"]
             tree_nodes = TreeNode().get_node(paths[0], True)
             tree_nodes.value = self.test_parameters
             variant = {"variant": tree_nodes, "variant_id": None, "paths": paths}
-            test_variant = [(test, variant) for test in self.tests]
+            for test in self.tests:
+                yield test, variant
 
         else:
             # let's use variants when parameters are not available
             # define execution order
             execution_order = self.config.get("run.execution_order")
             if execution_order == "variants-per-test":
-                test_variant = [
-                    (test, variant)
-                    for test in self.tests
-                    for variant in self.variants.itertests()
-                ]
+                for test in self.tests:
+                    for variant in self.variants.itertests():
+                        yield test, variant
             elif execution_order == "tests-per-variant":
-                test_variant = [
-                    (test, variant)
-                    for variant in self.variants.itertests()
-                    for test in self.tests
-                ]
-        return test_variant
+                for variant in self.variants.itertests():
+                    for test in self.tests:
+                        yield test, variant
+
+    def get_test_variants(self):
+        """Computes test variants based on the parameters"""
+        return list(self.iter_test_variants())
 
     def run(self, job):
         """Run this test suite with the job context in mind.
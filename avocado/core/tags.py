@@ -63,31 +63,85 @@ def _must_split_flat_key_val(must):
     return flat, key_val
 
 
-def _must_key_val_matches(must_key_vals, test_tags, include_empty_key):
+class TagIndex:
+
     """
-    Checks if the required key:vals are fulfilled by the test_tags
+    An index of runnables by their tags, to filter them with set operations.
 
-    :rtype: bool
+    The index is built once, and can then be used to filter the runnables
+    with any number of filters, each costing about the number of runnables
+    having the tags mentioned in the filter, instead of the number of
+    runnables times the number of tags in the filter.
     """
-    key_val_test_tags = {}
-    for k, v in test_tags.items():
-        if v is None:
-            continue
-        key_val_test_tags[k] = v
 
-    for k, v in must_key_vals.items():
-        if k not in test_tags:
-            if include_empty_key:
+    def __init__(self, runnables):
+        """
+        :param runnables: the runnables to be indexed
+        :type runnables: list of :class:`avocado.core.nrunner.Runnable`
+        """
+        self.runnables = list(runnables)
+        #: The positions of the runnables without tags
+        self.empty = set()
+        #: The positions of the runnables with tags
+        self.tagged = set()
+        #: The positions of the runnables with each tag (or key)
+        self.keys = {}
+        #: The positions of the runnables with each key:val tag
+        self.values = {}
+        for position, runnable in enumerate(self.runnables):
+            test_tags = runnable.tags or {}
+            if not test_tags:
+                self.empty.add(position)
                 continue
+            self.tagged.add(position)
+            for key, values in test_tags.items():
+                self.keys.setdefault(key, set()).add(position)
+                if values is None:
+                    continue
+                for value in values:
+                    self.values.setdefault((key, value), set()).add(position)
+
+    def _match_clause(self, must, must_not, include_empty_key):
+        must_flat, must_key_val = _must_split_flat_key_val(must)
+        matches = set(self.tagged)
+        for tag in must_not:
+            matches -= self.keys.get(tag, set())
+        for tag in must_flat:
+            matches &= self.keys.get(tag, set())
+            if not matches:
+                return matches
+        for key, value in must_key_val.items():
+            with_key = self.keys.get(key, set())
+            if value.startswith("-"):
+                matches -= self.values.get((key, value[1:]), set())
+                if not include_empty_key:
+                    matches &= with_key
+            elif include_empty_key:
+                matches -= with_key - self.values.get((key, value), set())
             else:
-                return False
-        if v.startswith("-"):
-            abs_v = v[1:]
-            if abs_v in key_val_test_tags.get(k, set()):
-                return False
-        elif v not in key_val_test_tags.get(k, set()):
-            return False
-    return True
+                matches &= self.values.get((key, value), set())
+        return matches
+
+    def filter(self, filter_by_tags, include_empty=False, include_empty_key=False):
+        """
+        Returns the runnables that match the tags criteria given
+
+        :param filter_by_tags: the list of tag sets to use as filters
+        :type filter_by_tags: list of comma separated tags (['foo,bar', 'fast'])
+        :param include_empty: if true tests without tags will not be filtered out
+        :type include_empty: bool
+        :param include_empty_key: if true tests "keys" on key:val tags will be
+                                  included in the filtered results
+        :type include_empty_key: bool
+        :returns: the runnables matching the criteria, in their original order
+        :rtype: list of :class:`avocado.core.nrunner.Runnable`
+        """
+        matches = set()
+        for must, must_not in _parse_filter_by_tags(filter_by_tags):
+            matches |= self._match_clause(must, must_not, include_empty_key)
+        if include_empty:
+            matches |= self.empty
+        return [self.runnables[position] for position in sorted(matches)]
 
 
 def filter_tags_on_runnables(
@@ -101,6 +155,8 @@ def filter_tags_on_runnables(
     not populate the test tags, it will be considered to have empty
     tags.
 
+    To filter the same runnables many times, use a :class:`TagIndex`.
+
     :param resolutions: possible multiple resolutions for multiple
                         references
     :type resolutions: list of :class:`avocado.core.resolver.ReferenceResolution`
@@ -114,36 +170,10 @@ def filter_tags_on_runnables(
     :returns: the resolutions converted to runnables filtered by tags
     :rtype: list of :class:`avocado.core.nrunner.Runnable`
     """
-    filtered = []
-    must_must_nots = _parse_filter_by_tags(filter_by_tags)
-
+    runnables = []
     for resolution in resolutions:
         if resolution.result != ReferenceResolutionResult.SUCCESS:
             continue
-
-        for runnable in resolution.resolutions:
-            test_tags = runnable.tags or {}
-            if not test_tags:
-                if include_empty:
-                    filtered.append(runnable)
-                continue
-
-            for must, must_not in must_must_nots:
-                if must_not.intersection(test_tags):
-                    continue
-
-                must_flat, must_key_val = _must_split_flat_key_val(must)
-                if must_key_val:
-                    if not _must_key_val_matches(
-                        must_key_val, test_tags, include_empty_key
-                    ):
-                        continue
-
-                if must_flat:
-                    if not must_flat.issubset(test_tags):
-                        continue
-
-                filtered.append(runnable)
-                break
-
-    return filtered
+        runnables.extend(resolution.resolutions)
+    index = TagIndex(runnables)
+    return index.filter(filter_by_tags, include_empty, include_empty_key)
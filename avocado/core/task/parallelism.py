@@ -0,0 +1,198 @@
+"""
+Adaptive control of the number of tasks running in parallel.
+
+Instead of a fixed number of tasks running in parallel, the limit is
+raised while the host seems to have resources to spare, and lowered
+when it seems to be overloaded.  The signals used are:
+
+ * the 1 minute load average, relative to the number of CPUs;
+ * the memory pressure, as reported by the kernel in
+   ``/proc/pressure/memory`` (percentage of time in which some task
+   was stalled waiting for memory in the last 10 seconds);
+ * the time it takes for the spawner to spawn a task, compared to the
+   fastest spawns seen so far.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+
+LOG = logging.getLogger(__name__)
+
+#: The file with the memory pressure information (Linux >= 4.20)
+MEMORY_PRESSURE_PATH = "/proc/pressure/memory"
+
+
+class AdaptiveParallelism:
+    """Keeps a limit of tasks running in parallel between a floor and ceiling."""
+
+    #: Load average, per CPU, above which the host is considered overloaded
+    OVERLOADED_LOAD = 1.0
+    #: Load average, per CPU, below which more tasks can be started
+    UNDERLOADED_LOAD = 0.7
+    #: Memory pressure (percentage) above which the host is overloaded
+    OVERLOADED_MEMORY_PRESSURE = 10.0
+    #: Memory pressure (percentage) below which more tasks can be started
+    UNDERLOADED_MEMORY_PRESSURE = 1.0
+    #: How many times slower than the fastest one a spawn can be
+    SLOW_SPAWN_FACTOR = 4.0
+    #: Spawns faster than this (in seconds) are never considered slow
+    SLOW_SPAWN_MINIMUM = 0.1
+    #: Weight given to the latest spawn latency on the moving average
+    SPAWN_LATENCY_WEIGHT = 0.3
+    #: The time (in seconds) between checks of the host load
+    INTERVAL = 1.0
+    #: The time (in seconds) after lowering the limit in which it's not
+    #: changed again, giving time for the load signals to reflect it
+    COOLDOWN = 5.0
+
+    def __init__(self, floor, ceiling, initial=None):
+        """
+        :param floor: the minimum limit of tasks running in parallel
+        :type floor: int
+        :param ceiling: the maximum limit of tasks running in parallel
+        :type ceiling: int
+        :param initial: the initial limit, defaults to the number of CPUs
+        :type initial: int
+        """
+        if floor < 1 or ceiling < floor:
+            raise ValueError(
+                f"Invalid parallel tasks floor ({floor}) and ceiling ({ceiling})"
+            )
+        self._floor = floor
+        self._ceiling = ceiling
+        if initial is None:
+            initial = multiprocessing.cpu_count()
+        self._limit = self._clamp(initial)
+        self._spawn_latency = None
+        self._spawn_latency_fastest = None
+        self._last_decrease = None
+
+    def __repr__(self):
+        return (
+            f'<AdaptiveParallelism floor="{self._floor}" '
+            f'ceiling="{self._ceiling}" limit="{self._limit}">'
+        )
+
+    def _clamp(self, limit):
+        return max(self._floor, min(self._ceiling, limit))
+
+    @property
+    def limit(self):
+        """The current limit of tasks running in parallel."""
+        return self._limit
+
+    def record_spawn_latency(self, latency):
+        """Records the time, in seconds, it took to spawn a task."""
+        if self._spawn_latency is None:
+            self._spawn_latency = latency
+        else:
+            self._spawn_latency = (
+                self.SPAWN_LATENCY_WEIGHT * latency
+                + (1 - self.SPAWN_LATENCY_WEIGHT) * self._spawn_latency
+            )
+        if self._spawn_latency_fastest is None:
+            self._spawn_latency_fastest = latency
+        else:
+            self._spawn_latency_fastest = min(self._spawn_latency_fastest, latency)
+
+    def _is_spawn_slow(self):
+        if self._spawn_latency is None:
+            return False
+        if self._spawn_latency < self.SLOW_SPAWN_MINIMUM:
+            return False
+        return (
+            self._spawn_latency > self._spawn_latency_fastest * self.SLOW_SPAWN_FACTOR
+        )
+
+    @staticmethod
+    def read_load():
+        """Returns the 1 minute load average per CPU, or None if unknown."""
+        try:
+            return os.getloadavg()[0] / multiprocessing.cpu_count()
+        except OSError:
+            return None
+
+    @staticmethod
+    def read_memory_pressure(path=MEMORY_PRESSURE_PATH):
+        """Returns the recent memory pressure percentage, or None if unknown."""
+        try:
+            with open(path, "r", encoding="utf-8") as pressure:
+                for line in pressure:
+                    fields = line.split()
+                    if not fields or fields[0] != "some":
+                        continue
+                    for field in fields[1:]:
+                        key, _, value = field.partition("=")
+                        if key == "avg10":
+                            return float(value)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def adjust(self, load, memory_pressure, now=None):
+        """Adjusts the limit according to the current host load.
+
+        :param load: the load average per CPU, or None if unknown
+        :type load: float
+        :param memory_pressure: the memory pressure percentage, or None if
+                                unknown
+        :type memory_pressure: float
+        :param now: the current monotonic time
+        :type now: float
+        :returns: whether the limit was changed
+        :rtype: bool
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._last_decrease is not None:
+            if now - self._last_decrease < self.COOLDOWN:
+                return False
+
+        overloaded = self._is_spawn_slow()
+        underloaded = not overloaded
+        if load is not None:
+            overloaded |= load > self.OVERLOADED_LOAD
+            underloaded &= load < self.UNDERLOADED_LOAD
+        if memory_pressure is not None:
+            overloaded |= memory_pressure > self.OVERLOADED_MEMORY_PRESSURE
+            underloaded &= memory_pressure < self.UNDERLOADED_MEMORY_PRESSURE
+        if load is None and memory_pressure is None:
+            # with no information about the host, the limit stays put
+            underloaded = False
+
+        limit = self._limit
+        if overloaded:
+            limit = self._clamp(limit - max(1, limit // 4))
+            self._last_decrease = now
+        elif underloaded:
+            limit = self._clamp(limit + 1)
+        if limit == self._limit:
+            return False
+        LOG.debug(
+            "Parallel tasks limit changed from %s to %s (load per CPU: %s, "
+            "memory pressure: %s, spawn latency: %s)",
+            self._limit,
+            limit,
+            load,
+            memory_pressure,
+            self._spawn_latency,
+        )
+        self._limit = limit
+        return True
+
+    async def run(self, state_machine):
+        """Periodically adjusts the limit, until cancelled.
+
+        :param state_machine: the state machine whose workers are subject
+                              to the limit, and that get woken up when it's
+                              raised
+        :type state_machine: :class:`avocado.core.task.statemachine.TaskStateMachine`
+        """
+        while True:
+            await asyncio.sleep(self.INTERVAL)
+            if self.adjust(self.read_load(), self.read_memory_pressure()):
+                async with state_machine.lock:
+                    state_machine.notify_state_change()
@@ -28,6 +28,10 @@ class RuntimeTaskStatus(Enum):
         ]
 
 
+#: The statuses of a task that reached the end of its life cycle
+FINISHED_STATUSES = frozenset(RuntimeTaskStatus.finished_statuses())
+
+
 class RuntimeTask:
     """Task with extra status information on its life cycle status.
 
@@ -59,7 +63,13 @@ class RuntimeTask:
         self.spawner_handle = None
         #: The result of the spawning of a Task
         self.spawning_result = None
+        #: The tasks that need to finish before this one can run
         self.dependencies = []
+        #: The tasks that depend on this one, that is, the reverse
+        #: edges of :attr:`dependencies`
+        self.dependents = []
+        #: How many of :attr:`dependencies` have not finished yet
+        self.pending_dependencies = 0
 
     def __repr__(self):
         if self.status is None:
@@ -78,19 +88,35 @@ class RuntimeTask:
             return hash(self) == hash(other)
         return False
 
+    def add_dependency(self, dependency):
+        """Makes this task depend on another one, keeping track of both edges.
+
+        :param dependency: the task that needs to finish before this one
+        :type dependency: :class:`RuntimeTask`
+        """
+        self.dependencies.append(dependency)
+        dependency.dependents.append(self)
+        if dependency.status not in FINISHED_STATUSES:
+            self.pending_dependencies += 1
+
+    def dependency_finished(self):
+        """Accounts for one of the dependencies of this task finishing.
+
+        :returns: whether all the dependencies have now finished
+        :rtype: bool
+        """
+        self.pending_dependencies -= 1
+        return self.pending_dependencies == 0
+
     def are_dependencies_finished(self):
         for dependency in self.dependencies:
-            if dependency.status not in RuntimeTaskStatus.finished_statuses():
+            if dependency.status not in FINISHED_STATUSES:
                 return False
         return True
 
     def get_finished_dependencies(self):
         """Returns all dependencies which already finished."""
-        return [
-            dep
-            for dep in self.dependencies
-            if dep.status in RuntimeTaskStatus.finished_statuses()
-        ]
+        return [dep for dep in self.dependencies if dep.status in FINISHED_STATUSES]
 
     def can_run(self):
         if not self.are_dependencies_finished():
@@ -182,7 +208,9 @@ class PreRuntimeTask(RuntimeTask):
         return cls(task)
 
     @classmethod
-    def get_pre_tasks_from_runnable(cls, runnable, status_server_uri=None, job_id=None):
+    def get_pre_tasks_from_runnable(
+        cls, runnable, status_server_uri=None, job_id=None, dispatcher=None
+    ):
         """Creates runtime tasks for preTest task from runnable
 
         :param runnable: the "description" of what the task should run.
@@ -194,15 +222,17 @@ class PreRuntimeTask(RuntimeTask):
                        sent to the destination job's status server and will
                        make into the job's results.
         :type job_id: str
+        :param dispatcher: the dispatcher of the pre test plugins, to be
+                           reused when creating tasks for many runnables
+        :type dispatcher: :class:`avocado.core.dispatcher.TestPreDispatcher`
         :returns: Pre RuntimeTasks of the dependencies from runnable
         :rtype: list
         """
-
+        if dispatcher is None:
+            dispatcher = TestPreDispatcher()
         pre_runnables = list(
             chain.from_iterable(
-                TestPreDispatcher().map_method_with_return(
-                    "pre_test_runnables", runnable
-                )
+                dispatcher.map_method_with_return("pre_test_runnables", runnable)
             )
         )
         pre_test_tasks = []
@@ -212,6 +242,90 @@ class PreRuntimeTask(RuntimeTask):
         return pre_test_tasks
 
 
+def create_test_tasks(
+    runnable,
+    no_digits,
+    index,
+    variant,
+    test_suite_name=None,
+    status_server_uri=None,
+    job_id=None,
+    dispatcher=None,
+):
+    """Creates the runtime task for a test, and the ones it depends on.
+
+    The parameters are the same as the ones given to
+    :meth:`RuntimeTask.from_runnable`, except for the runnable, which is
+    copied before being given to it, and for the dispatcher, given to
+    :meth:`PreRuntimeTask.get_pre_tasks_from_runnable`.
+
+    :returns: the runtime tasks in topological order, that is, the
+              tasks for the pre test plugins, each depending on the
+              previous one, followed by the test task
+    :rtype: list of :class:`RuntimeTask`
+    """
+    runnable = deepcopy(runnable)
+    runtime_test = RuntimeTask.from_runnable(
+        runnable,
+        no_digits,
+        index,
+        variant,
+        test_suite_name,
+        status_server_uri,
+        job_id,
+    )
+    # with --dry-run we don't want to run dependencies
+    if runnable.kind == "dry-run":
+        return [runtime_test]
+    tasks = PreRuntimeTask.get_pre_tasks_from_runnable(
+        runnable, status_server_uri, job_id, dispatcher
+    )
+    tasks.append(runtime_test)
+    for dependency, task in zip(tasks, tasks[1:]):
+        task.add_dependency(dependency)
+    return tasks
+
+
+def iter_runtime_tasks(tests, total, test_suite_name, status_server_uri, job_id):
+    """Creates the runtime tasks for tests, only as they are needed.
+
+    This produces the same tasks, in the same order, as
+    :meth:`RuntimeTaskGraph.get_tasks_in_topological_order`, but without
+    having all the tests, or all their tasks, at once.
+
+    :param tests: variants of runnables from test suite, such as the
+                  ones given by
+                  :meth:`avocado.core.suite.TestSuite.iter_test_variants`
+    :type tests: iterable
+    :param total: the number of variants of runnables in ``tests``
+    :type total: int
+    :param test_suite_name: test suite name which this test is related to
+    :type test_suite_name: str
+    :param status_server_uri: the URIs for the status servers that this
+                              task should send updates to.
+    :type status_server_uri: list
+    :param job_id: the ID of the job, for authenticating messages that get
+                   sent to the destination job's status server and will
+                   make into the job's results.
+    :type job_id: str
+    :returns: the runtime tasks in topological order
+    :rtype: iterator of :class:`RuntimeTask`
+    """
+    no_digits = len(str(total))
+    dispatcher = TestPreDispatcher()
+    for index, (runnable, variant) in enumerate(tests, start=1):
+        yield from create_test_tasks(
+            runnable,
+            no_digits,
+            index,
+            variant,
+            test_suite_name,
+            status_server_uri,
+            job_id,
+            dispatcher,
+        )
+
+
 class RuntimeTaskGraph:
     """Graph representing dependencies between runtime tasks."""
 
@@ -236,9 +350,9 @@ class RuntimeTaskGraph:
         self.graph = {}
         # create graph
         no_digits = len(str(len(tests)))
+        dispatcher = TestPreDispatcher()
         for index, (runnable, variant) in enumerate(tests, start=1):
-            runnable = deepcopy(runnable)
-            runtime_test = RuntimeTask.from_runnable(
+            tasks = create_test_tasks(
                 runnable,
                 no_digits,
                 index,
@@ -246,23 +360,12 @@ class RuntimeTaskGraph:
                 test_suite_name,
                 status_server_uri,
                 job_id,
+                dispatcher,
             )
+            runtime_test = tasks[-1]
             self.graph[runtime_test] = runtime_test
-
-            # with --dry-run we don't want to run dependencies
-            if runnable.kind != "dry-run":
-                pre_tasks = PreRuntimeTask.get_pre_tasks_from_runnable(
-                    runnable, status_server_uri, job_id
-                )
-                if pre_tasks:
-                    pre_tasks.append(runtime_test)
-                    self._connect_tasks(pre_tasks)
-
-    def _connect_tasks(self, tasks):
-        for dependency, task in zip(tasks, tasks[1:]):
-            self.graph[task] = task
-            self.graph[dependency] = dependency
-            task.dependencies.append(dependency)
+            for task in tasks:
+                self.graph[task] = task
 
     def get_tasks_in_topological_order(self):
         """Computes the topological order of runtime tasks in graph
@@ -15,21 +15,67 @@ LOG = logging.getLogger(__name__)
 class TaskStateMachine:
     """Represents all phases that a task can go through its life."""
 
-    def __init__(self, tasks, status_repo):
+    def __init__(self, tasks, status_repo, task_source=None):
+        """
+        :param tasks: the tasks requested to run
+        :type tasks: list of :class:`avocado.core.task.runtime.RuntimeTask`
+        :param status_repo: the repository of the status of the tasks
+        :type status_repo: :class:`avocado.core.status.repo.StatusRepo`
+        :param task_source: further tasks requested to run, after the ones
+                            in ``tasks``, that are only taken from it as
+                            there's room for them to be triaged
+        :type task_source: iterator of
+                           :class:`avocado.core.task.runtime.RuntimeTask`
+        """
         self._requested = collections.deque(tasks)
+        self._task_source = task_source
         self._status_repo = status_repo
-        self._triaging = []
-        self._ready = []
-        self._started = []
-        self._monitored = []
+        self._triaging = collections.deque()
+        self._ready = collections.deque()
+        self._started = collections.deque()
+        # tasks are removed from these from arbitrary positions, so
+        # they're kept as (insertion ordered) dicts with no values
+        self._monitored = {}
+        self._waiting = {}
+        #: Tasks taken from :attr:`ready` that are being spawned, and are
+        #: neither :attr:`started` nor :attr:`finished` yet
+        self._spawning = {}
         self._finished = []
+        #: Identifiers of the tasks in :attr:`finished`, for fast lookups
+        self._finished_ids = set()
         self._lock = asyncio.Lock()
         self._cache_lock = asyncio.Lock()
+        #: Signaled (with :attr:`lock` held) whenever a task changes state
+        self._state_changed = asyncio.Condition(self._lock)
+        #: Counter of state changes, so that waiters don't miss a change
+        #: that happened before they started waiting
+        self._generation = 0
+        #: Pending calls to :meth:`triage_later`, as the event loop only
+        #: keeps weak references to them
+        self._delayed_triages = set()
 
     @property
     def requested(self):
         return self._requested
 
+    def pop_requested(self):
+        """Takes the next requested task, if any.
+
+        This must be called with :attr:`lock` held.
+
+        :rtype: :class:`avocado.core.task.runtime.RuntimeTask` or None
+        """
+        if self._requested:
+            return self._requested.popleft()
+        if self._task_source is not None:
+            try:
+                return next(self._task_source)
+            except StopIteration:
+                # the state machine may have become complete
+                self._task_source = None
+                self.notify_state_change()
+        return None
+
     @property
     def triaging(self):
         return self._triaging
@@ -42,10 +88,18 @@ class TaskStateMachine:
     def started(self):
         return self._started
 
+    @property
+    def spawning(self):
+        return self._spawning
+
     @property
     def monitored(self):
         return self._monitored
 
+    @property
+    def waiting(self):
+        return self._waiting
+
     @property
     def finished(self):
         return self._finished
@@ -58,12 +112,102 @@ class TaskStateMachine:
     def cache_lock(self):
         return self._cache_lock
 
+    @property
+    def generation(self):
+        return self._generation
+
     @property
     async def complete(self):
         async with self._lock:
-            pending = any([self._requested, self._triaging, self._ready, self._started])
+            pending = any(
+                [
+                    self._requested,
+                    self._task_source is not None,
+                    self._triaging,
+                    self._ready,
+                    self._spawning,
+                    self._started,
+                    self._waiting,
+                ]
+            )
         return not pending
 
+    def notify_state_change(self):
+        """Wakes up workers waiting for a task to change its state.
+
+        This must be called with :attr:`lock` held.
+        """
+        self._generation += 1
+        self._state_changed.notify_all()
+
+    async def wait_for_state_change(self, generation):
+        """Waits until a state change happens after a given generation.
+
+        :param generation: the value of :attr:`generation` seen by the
+                           caller before it attempted to make progress.
+        :type generation: int
+        """
+        async with self._state_changed:
+            await self._state_changed.wait_for(lambda: self._generation != generation)
+
+    def _release_dependents(self, runtime_task):
+        """Accounts for a finished task on the tasks that depend on it.
+
+        Dependents that were waiting only on this task are moved back
+        to triaging.  This must be called with :attr:`lock` held.
+
+        :param runtime_task: A task that has just finished.
+        """
+        for dependent in runtime_task.dependents:
+            if not dependent.dependency_finished():
+                continue
+            if dependent in self._waiting:
+                del self._waiting[dependent]
+                self._triaging.append(dependent)
+                LOG.debug(
+                    'Task "%s": waiting -> triaging (dependencies finished)',
+                    dependent.task.identifier,
+                )
+
+    async def triage_later(self, runtime_task, delay):
+        """Moves a waiting task back to triaging after a given delay.
+
+        This is used for conditions that are not signaled by any task
+        changing its state within this state machine, such as a
+        requirement being fulfilled by a different process.
+
+        :param runtime_task: A task on the waiting queue.
+        :param delay: time in seconds to wait before triaging it again.
+        :type delay: float
+        """
+        await asyncio.sleep(delay)
+        async with self._lock:
+            # the task may have been aborted in the meantime
+            if runtime_task not in self._waiting:
+                return
+            del self._waiting[runtime_task]
+            self._triaging.append(runtime_task)
+            self.notify_state_change()
+
+    def schedule_triage_later(self, runtime_task, delay):
+        """Schedules a call to :meth:`triage_later`, without waiting for it.
+
+        The pending calls can be cancelled with
+        :meth:`cancel_delayed_triages`.
+
+        :param runtime_task: A task on the waiting queue.
+        :param delay: time in seconds to wait before triaging it again.
+        :type delay: float
+        """
+        future = asyncio.ensure_future(self.triage_later(runtime_task, delay))
+        self._delayed_triages.add(future)
+        future.add_done_callback(self._delayed_triages.discard)
+
+    def cancel_delayed_triages(self):
+        """Cancels the pending calls to :meth:`triage_later`."""
+        for future in list(self._delayed_triages):
+            future.cancel()
+
     async def abort(self, status_reason=None):
         """Abort all non-started tasks.
 
@@ -72,6 +216,9 @@ class TaskStateMachine:
 
         :param status_reason: string reason. Optional.
         """
+        # waiting goes first, so that finishing the other tasks won't
+        # release their dependents back into an already aborted queue
+        await self.abort_queue("waiting", status_reason)
         await self.abort_queue("requested", status_reason)
         await self.abort_queue("triaging", status_reason)
         await self.abort_queue("ready", status_reason)
@@ -82,15 +229,14 @@ class TaskStateMachine:
         :param queue_name: a string with the queue name.
         :param status_reason: string reason. Optional.
         """
-        to_remove = []
         async with self._lock:
             queue = getattr(self, queue_name)
-            for _ in range(len(queue)):
-                if queue_name == "requested":
-                    runtime_task = queue.popleft()
-                else:
-                    runtime_task = queue.pop(0)
-                to_remove.append(runtime_task)
+            to_remove = list(queue)
+            queue.clear()
+            if queue_name == "requested":
+                # the tasks not yet taken from the source are never
+                # created, and thus need not be finished
+                self._task_source = None
 
         if to_remove:
             if status_reason:
@@ -120,7 +266,7 @@ class TaskStateMachine:
         :param status_reason: string reason. Optional.
         """
         async with self._lock:
-            if runtime_task not in self.finished:
+            if runtime_task.task.identifier not in self._finished_ids:
                 if status_reason:
                     runtime_task.status = status_reason
                     LOG.debug(
@@ -130,7 +276,10 @@ class TaskStateMachine:
                     )
                 else:
                     LOG.debug('Task "%s" finished', runtime_task.task.identifier)
-                self.finished.append(runtime_task)
+                self._finished.append(runtime_task)
+                self._finished_ids.add(runtime_task.task.identifier)
+                self._release_dependents(runtime_task)
+                self.notify_state_change()
 
 
 class Worker:
@@ -142,6 +291,7 @@ class Worker:
         max_running=None,
         task_timeout=None,
         failfast=False,
+        parallelism=None,
     ):
         self._state_machine = state_machine
         self._spawner = spawner
@@ -153,6 +303,8 @@ class Worker:
         self._max_running = max_running
         self._task_timeout = task_timeout
         self._failfast = failfast
+        #: an optional :class:`avocado.core.task.parallelism.AdaptiveParallelism`
+        self._parallelism = parallelism
         LOG.debug("%s has been initialized", self)
 
     def __repr__(self):
@@ -202,28 +354,35 @@ class Worker:
                 self._state_machine._status_repo.process_message(finish_message)
 
     async def bootstrap(self):
-        """Reads from requested, moves into triaging."""
-        try:
-            async with self._state_machine.lock:
-                if len(self._state_machine.triaging) < self._max_triaging:
-                    runtime_task = self._state_machine.requested.popleft()
-                    self._state_machine.triaging.append(runtime_task)
-                    LOG.debug(
-                        'Task "%s": requested -> triaging', runtime_task.task.identifier
-                    )
-                else:
-                    return
-        except IndexError:
-            return
+        """Reads from requested, moves into triaging.
+
+        :returns: whether a task was moved
+        :rtype: bool
+        """
+        async with self._state_machine.lock:
+            if len(self._state_machine.triaging) >= self._max_triaging:
+                return False
+            runtime_task = self._state_machine.pop_requested()
+            if runtime_task is None:
+                return False
+            self._state_machine.triaging.append(runtime_task)
+            self._state_machine.notify_state_change()
+            LOG.debug('Task "%s": requested -> triaging', runtime_task.task.identifier)
+        return True
 
     async def triage(self):
-        """Reads from triaging, moves into either: ready or finished."""
+        """Reads from triaging, moves into either: ready, waiting or finished.
+
+        :returns: whether a task was moved
+        :rtype: bool
+        """
 
         try:
             async with self._state_machine.lock:
-                runtime_task = self._state_machine.triaging.pop(0)
+                runtime_task = self._state_machine.triaging.popleft()
+                self._state_machine.notify_state_change()
         except IndexError:
-            return
+            return False
 
         # a task waiting requirements already checked its requirements
         if runtime_task.status != RuntimeTaskStatus.WAIT_DEPENDENCIES:
@@ -239,17 +398,18 @@ class Worker:
                 await self._state_machine.finish_task(
                     runtime_task, RuntimeTaskStatus.FAIL_TRIAGE
                 )
-                return
+                return True
 
         # handle task dependencies
         if runtime_task.dependencies:
-            # check of all the dependency tasks finished
-            if not runtime_task.are_dependencies_finished():
-                async with self._state_machine.lock:
-                    self._state_machine.triaging.append(runtime_task)
+            # check of all the dependency tasks finished, and if not,
+            # park the task until the state machine releases it
+            async with self._state_machine.lock:
+                if runtime_task.pending_dependencies:
                     runtime_task.status = RuntimeTaskStatus.WAIT_DEPENDENCIES
-                await asyncio.sleep(0.1)
-                return
+                    self._state_machine.waiting[runtime_task] = None
+                    self._state_machine.notify_state_change()
+                    return True
 
             # dependencies finished, let's check if they finished
             # successfully, so we can move on with the parent task
@@ -262,83 +422,118 @@ class Worker:
                 await self._state_machine.finish_task(
                     runtime_task, RuntimeTaskStatus.FAIL_TRIAGE
                 )
-                return
+                return True
         if runtime_task.task.category != "test":
             async with self._state_machine.cache_lock:
                 is_task_in_cache = await self._spawner.is_requirement_in_cache(
                     runtime_task
                 )
                 if is_task_in_cache is None:
+                    # the requirement is being fulfilled by a different
+                    # process, so there's no event to wait for
                     async with self._state_machine.lock:
-                        self._state_machine.triaging.append(runtime_task)
                         runtime_task.status = RuntimeTaskStatus.WAIT
-                        await asyncio.sleep(0.1)
-                    return
+                        self._state_machine.waiting[runtime_task] = None
+                        self._state_machine.notify_state_change()
+                    self._state_machine.schedule_triage_later(runtime_task, 0.1)
+                    return True
 
                 if is_task_in_cache:
+                    runtime_task.result = "pass"
                     await self._state_machine.finish_task(
                         runtime_task, RuntimeTaskStatus.IN_CACHE
                     )
-                    runtime_task.result = "pass"
-                    return
+                    return True
 
                 await self._spawner.save_requirement_in_cache(runtime_task)
 
         # the task is ready to run
         async with self._state_machine.lock:
             self._state_machine.ready.append(runtime_task)
+            self._state_machine.notify_state_change()
+        return True
 
     async def start(self):
-        """Reads from ready, moves into either: started or finished."""
-        try:
-            async with self._state_machine.lock:
-                runtime_task = self._state_machine.ready.pop(0)
-        except IndexError:
-            return
+        """Reads from ready, moves into either: started or finished.
 
-        # enforce a rate limit on the number of started (currently
-        # running) tasks.  this is a global limit, but the spawners
-        # can also be queried with regards to their capacity to handle
-        # new tasks
-        should_wait = False
+        :returns: whether a task was moved
+        :rtype: bool
+        """
         async with self._state_machine.lock:
+            if not self._state_machine.ready:
+                return False
+            # enforce a rate limit on the number of started (currently
+            # running) tasks.  this is a global limit, but the spawners
+            # can also be queried with regards to their capacity to handle
+            # new tasks.  a slot being freed is a state change that will
+            # wake this worker up again.
             if len(self._state_machine.started) >= self._max_running:
-                self._state_machine.ready.insert(0, runtime_task)
-                runtime_task.status = RuntimeTaskStatus.WAIT
-                should_wait = True
-        if should_wait:
-            await asyncio.sleep(0.1)
-            return
+                self._state_machine.ready[0].status = RuntimeTaskStatus.WAIT
+                return False
+            # with an adaptive limit, tasks that are still being spawned
+            # by other workers, or are already being monitored, count as
+            # running too.  the limit being raised is also a state change
+            # that will wake this worker up.
+            if self._parallelism is not None:
+                running = (
+                    len(self._state_machine.spawning)
+                    + len(self._state_machine.started)
+                    + len(self._state_machine.monitored)
+                )
+                if running >= self._parallelism.limit:
+                    self._state_machine.ready[0].status = RuntimeTaskStatus.WAIT
+                    return False
+            runtime_task = self._state_machine.ready.popleft()
+            self._state_machine.spawning[runtime_task] = None
+            self._state_machine.notify_state_change()
 
         LOG.debug(
             'Task "%s": about to be spawned with "%s"',
             runtime_task.task.identifier,
             self._spawner,
         )
-        start_ok = await self._spawner.spawn_task(runtime_task)
+        spawn_start = time.monotonic()
+        start_ok = False
+        try:
+            start_ok = await self._spawner.spawn_task(runtime_task)
+        finally:
+            if not start_ok:
+                async with self._state_machine.lock:
+                    self._state_machine.spawning.pop(runtime_task, None)
+                    self._state_machine.notify_state_change()
+        if self._parallelism is not None:
+            self._parallelism.record_spawn_latency(time.monotonic() - spawn_start)
         if start_ok:
             LOG.debug('Task "%s": spawned successfully', runtime_task.task.identifier)
             runtime_task.status = RuntimeTaskStatus.STARTED
             if self._task_timeout is not None:
                 runtime_task.execution_timeout = time.monotonic() + self._task_timeout
             async with self._state_machine.lock:
+                self._state_machine.spawning.pop(runtime_task, None)
                 self._state_machine.started.append(runtime_task)
+                self._state_machine.notify_state_change()
         else:
             await self._state_machine.finish_task(
                 runtime_task, RuntimeTaskStatus.FAIL_START
             )
+        return True
 
     async def monitor(self):
-        """Reads from started, moves into finished."""
+        """Reads from started, moves into finished.
+
+        :returns: whether a task was moved
+        :rtype: bool
+        """
         try:
             async with self._state_machine.lock:
-                runtime_task = self._state_machine.started.pop(0)
+                runtime_task = self._state_machine.started.popleft()
+                self._state_machine.notify_state_change()
         except IndexError:
-            return
+            return False
 
         if self._spawner.is_task_alive(runtime_task):
             async with self._state_machine.lock:
-                self._state_machine._monitored.append(runtime_task)
+                self._state_machine.monitored[runtime_task] = None
             try:
                 if runtime_task.execution_timeout is None:
                     remaining = None
@@ -350,28 +545,13 @@ class Worker:
                 await self._spawner.terminate_task(runtime_task)
                 await self._send_timeout_message([runtime_task])
             async with self._state_machine.lock:
-                try:
-                    self._state_machine.monitored.remove(runtime_task)
-                except ValueError:
-                    pass
-
-        # from here, this `task` ran, so, let's check
-        # the its latest data in the status repo
-        latest_task_data = (
-            self._state_machine._status_repo.get_latest_task_data(
-                str(runtime_task.task.identifier)
-            )
-            or {}
+                self._state_machine.monitored.pop(runtime_task, None)
+
+        # from here, this `task` ran, so, let's wait for its
+        # results to be available in the status repo
+        latest_task_data = await self._state_machine._status_repo.wait_task_finished(
+            str(runtime_task.task.identifier)
         )
-        # maybe, the results are not available yet
-        while latest_task_data.get("result") is None:
-            await asyncio.sleep(0.1)
-            latest_task_data = (
-                self._state_machine._status_repo.get_latest_task_data(
-                    str(runtime_task.task.identifier)
-                )
-                or {}
-            )
         if runtime_task.task.category != "test":
             async with self._state_machine.cache_lock:
                 await self._spawner.update_requirement_cache(
@@ -386,6 +566,7 @@ class Worker:
             raise TestFailFast("Interrupting job (failfast).")
 
         await self._state_machine.finish_task(runtime_task, RuntimeTaskStatus.FINISHED)
+        return True
 
     async def terminate_tasks_timeout(self):
         """Terminate all running tasks with timeout message."""
@@ -395,8 +576,8 @@ class Worker:
             is_complete = await self._state_machine.complete
             async with self._state_machine.lock:
                 try:
-                    runtime_task = self._state_machine.monitored.pop(0)
-                except IndexError:
+                    runtime_task, _ = self._state_machine.monitored.popitem()
+                except KeyError:
                     if is_complete:
                         break
                 runtime_task.status = RuntimeTaskStatus.TIMEOUT
@@ -405,12 +586,21 @@ class Worker:
         await self._send_timeout_message(terminated)
 
     async def run(self):
-        """Pushes Tasks forward and makes them do something with their lives."""
+        """Pushes Tasks forward and makes them do something with their lives.
+
+        When none of the phases could move a task forward, the worker
+        sleeps until some task changes its state, instead of polling.
+        """
         while True:
+            generation = self._state_machine.generation
             is_complete = await self._state_machine.complete
             if is_complete:
                 break
-            await self.bootstrap()
-            await self.triage()
-            await self.start()
-            await self.monitor()
+            progress = [
+                await self.bootstrap(),
+                await self.triage(),
+                await self.start(),
+                await self.monitor(),
+            ]
+            if not any(progress):
+                await self._state_machine.wait_for_state_change(generation)
@@ -170,12 +170,104 @@ class TreeNodeEnvOnly:
         return self.path
 
 
+class TreeNodeChildren(list):
+
+    """
+    List of the children of a node, which also finds them by name.
+
+    The children are indexed by name as they're appended, any other change
+    to the list drops the index, which is built again when needed.
+    """
+
+    _index = None
+
+    def get_child(self, name):
+        """
+        :param name: name of the child
+        :return: the first child with the given name, or None
+        """
+        if self._index is None:
+            index = {}
+            for child in self:
+                index.setdefault(child.name, child)
+            self._index = index
+        return self._index.get(name)
+
+    def drop_index(self):
+        """Drops the index, after a child was renamed"""
+        self._index = None
+
+    def append(self, node):
+        super().append(node)
+        if self._index is not None:
+            self._index.setdefault(node.name, node)
+
+    def extend(self, nodes):
+        self._index = None
+        super().extend(nodes)
+
+    def insert(self, index, node):
+        self._index = None
+        super().insert(index, node)
+
+    def remove(self, node):
+        self._index = None
+        super().remove(node)
+
+    def pop(self, index=-1):
+        self._index = None
+        return super().pop(index)
+
+    def clear(self):
+        self._index = None
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._index = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._index = None
+        super().reverse()
+
+    def __setitem__(self, index, value):
+        self._index = None
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._index = None
+        super().__delitem__(index)
+
+    def __iadd__(self, nodes):
+        self._index = None
+        return super().__iadd__(nodes)
+
+    def __imul__(self, count):
+        self._index = None
+        return super().__imul__(count)
+
+    def __reduce_ex__(self, protocol):
+        # the index is left out, as restoring it before the children are
+        # themselves restored (when copying or unpickling a tree) fails
+        return (self.__class__, (list(self),))
+
+
 class TreeNode:
 
     """
     Class for bounding nodes into tree-structure.
     """
 
+    __slots__ = (
+        "_name",
+        "value",
+        "filters",
+        "_parent",
+        "_children",
+        "_environment",
+        "_path",
+    )
+
     def __init__(self, name="", value=None, parent=None, children=None):
         """
         :param name: a name for this node that will be used to define its
@@ -195,12 +287,13 @@ class TreeNode:
             value = {}
         if children is None:
             children = []
-        self.name = name
+        self._name = name
         self.value = value
         self.filters = [], []  # This node's filters, full filters are in env
-        self.parent = parent
-        self.children = []
+        self._parent = parent
+        self._children = TreeNodeChildren()
         self._environment = None
+        self._path = None
         for child in children:
             self.add_child(child)
 
@@ -213,7 +306,7 @@ class TreeNode:
 
     def __len__(self):
         """Return number of descended leaf nodes"""
-        return len(tuple(self.iter_leaves()))
+        return sum(1 for _ in self.iter_leaves())
 
     def __iter__(self):
         """Iterate through descended leaf nodes"""
@@ -249,6 +342,65 @@ class TreeNode:
                 children.append(hash(astring.to_text(item)))
         return hash((self.name,) + tuple(values) + tuple(children))
 
+    @property
+    def name(self):
+        """Name of this node"""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        if self._parent is not None:
+            self._parent.children.drop_index()
+        self._drop_path()
+
+    @property
+    def parent(self):
+        """Node directly above this one"""
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        self._parent = parent
+        self._drop_path()
+        self._drop_environment()
+
+    @property
+    def children(self):
+        """Nodes directly beneath this one"""
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        if not isinstance(children, TreeNodeChildren):
+            children = TreeNodeChildren(children)
+        self._children = children
+
+    def _drop_path(self):
+        """
+        Drops the cached path of this node and its descendants. The path of
+        a node is only cached after the path of its parent, so there's no
+        need to look further once a node has none.
+        """
+        queue = collections.deque([self])
+        while queue:
+            node = queue.popleft()
+            if node._path is not None:
+                node._path = None
+                queue.extend(node.children)
+
+    def _drop_environment(self):
+        """
+        Drops the cached environment of this node and its descendants, which
+        were computed from the environments of the old parents.
+        """
+        queue = collections.deque([self])
+        while queue:
+            node = queue.popleft()
+            if node._environment is not None:
+                node._environment = None
+                queue.extend(node.children)
+
     def fingerprint(self):
         """
         Reports string which represents the value of this node.
@@ -261,8 +413,9 @@ class TreeNode:
         existing position.
         """
         if isinstance(node, TreeNode):
-            if node.name in self.children:
-                self.children[self.children.index(node.name)].merge(node)
+            child = self.children.get_child(node.name)
+            if child is not None:
+                child.merge(node)
             else:
                 node.parent = self
                 self.children.append(node)
@@ -325,6 +478,21 @@ class TreeNode:
 
     def get_path(self, sep="/"):
         """Get node path"""
+        if sep == "/":
+            # The path is cached, after the path of the parent
+            if self._path is None:
+                if self._parent is None:
+                    self._path = sep + astring.to_text(self.name)
+                elif self._parent.parent is None:
+                    self._parent.get_path()
+                    self._path = sep.join(
+                        (astring.to_text(self._parent.name), astring.to_text(self.name))
+                    )
+                else:
+                    self._path = sep.join(
+                        (self._parent.get_path(), astring.to_text(self.name))
+                    )
+            return self._path
         if not self.parent:
             return sep + astring.to_text(self.name)
         path = [astring.to_text(self.name)]
@@ -379,9 +547,10 @@ class TreeNode:
         for name in path.split("/"):
             if not name:
                 continue
-            try:
-                node = node.children[node.children.index(name)]
-            except ValueError:
+            child = node.children.get_child(name)
+            if child is not None:
+                node = child
+            else:
                 if create:
                     child = node.__class__(name)
                     node.add_child(child)
@@ -0,0 +1,122 @@
+"""
+Helpers for the caches kept as JSON files under the data directory.
+
+Each cache decides what goes in its files, and when those are still
+valid.  The files are written at once, as other Avocado processes may
+be reading them, and are only taken as valid if written by the same
+version of Avocado.  For caches kept as a directory with one file per
+entry, the modification time of a file tells when its entry was last
+used, so that the entries not used for a while can be removed.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from avocado.core.version import VERSION
+
+
+def load(path):
+    """Reads a cache file.
+
+    :param path: the location of the cache file
+    :type path: str
+    :returns: the data saved with :func:`save`, or None if the file
+              could not be read, or was written by a different version
+              of Avocado
+    :rtype: dict or None
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != VERSION:
+        return None
+    return data
+
+
+def save(path, data):
+    """Writes a cache file, replacing any previous one at once.
+
+    :param path: the location of the cache file
+    :type path: str
+    :param data: the data to be saved, which must be serializable to
+                 JSON, along with the version of Avocado
+    :type data: dict
+    :raises OSError: if the file could not be written
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(dict(data, version=VERSION), cache_file)
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def touch(path):
+    """Records that the entry in a cache file was just used."""
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+
+def prune(directory, max_entries, max_age):
+    """Removes the entries not used for a while from a cache directory.
+
+    :param directory: the location of the cache files
+    :type directory: str
+    :param max_entries: the maximum number of entries kept, the least
+                        recently used ones beyond it being removed
+    :type max_entries: int
+    :param max_age: the maximum time (in seconds) an entry is kept
+                    without being used
+    :type max_age: int
+    """
+    entries = []
+    try:
+        with os.scandir(directory) as cache_dir:
+            for entry in cache_dir:
+                with contextlib.suppress(OSError):
+                    entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    oldest = time.time() - max_age
+    for index, (mtime, path) in enumerate(entries):
+        if index >= max_entries or mtime < oldest:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+
+
+def iter_entries(directory):
+    """Reads all the cache files in a cache directory.
+
+    :param directory: the location of the cache files
+    :type directory: str
+    :returns: the data of each valid cache file, as returned by :func:`load`
+    :rtype: iterator of dict
+    """
+    try:
+        with os.scandir(directory) as cache_dir:
+            paths = [
+                entry.path for entry in cache_dir if not entry.name.startswith(".")
+            ]
+    except OSError:
+        return
+    for path in paths:
+        data = load(path)
+        if data is not None:
+            yield data
+
+
+def clear(directory):
+    """Removes a cache directory, with all its entries."""
+    shutil.rmtree(directory, ignore_errors=True)
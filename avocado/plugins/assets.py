@@ -59,9 +59,9 @@ class FetchAssetHandler(ast.NodeVisitor):  # pylint: disable=R0902
         # discards disabled tests
         self.tests = safeloader.find_avocado_tests(self.file_name)[0]
 
-        # create Abstract Syntax Tree from test source file
-        with open(self.file_name, encoding="utf-8") as source_file:
-            self.tree = ast.parse(source_file.read(), self.file_name)
+        # Abstract Syntax Tree from test source file, shared with the
+        # resolvers that already parsed it
+        self.tree = safeloader.get_parsed_module(self.file_name).tree
 
         # build list of keyword arguments from calls that match pattern
         self.visit(self.tree)
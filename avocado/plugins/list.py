@@ -18,10 +18,11 @@ import os
 
 from avocado.core import exit_codes, parser_common_args
 from avocado.core.output import LOG_UI, TERM_SUPPORT
+from avocado.core.parser import HintParser
 from avocado.core.plugin_interfaces import CLICmd
-from avocado.core.resolver import ReferenceResolutionResult
+from avocado.core.resolver import IncrementalResolver, ReferenceResolutionResult
 from avocado.core.settings import settings
-from avocado.core.suite import TestSuite
+from avocado.core.suite import TestSuite, resolutions_to_runnables
 from avocado.utils.astring import iter_tabular_output
 
 
@@ -36,6 +37,10 @@ def _get_tags_as_string(tags):
     return ",".join(tags_repr)
 
 
+#: The number of the slowest references shown when profiling
+PROFILE_SLOWEST_REFERENCES = 10
+
+
 class List(CLICmd):
 
     """
@@ -125,6 +130,57 @@ class List(CLICmd):
             for key in sorted(suite.tags_stats):
                 LOG_UI.info("%s: %s", key, suite.tags_stats[key])
 
+    @staticmethod
+    def _display_profile(profile):
+        """Display the time spent on each stage, resolver and reference."""
+        LOG_UI.info("")
+        LOG_UI.info("RESOLUTION PROFILE")
+        LOG_UI.info("==================")
+        stage_header = (
+            TERM_SUPPORT.header_str("Stage"),
+            TERM_SUPPORT.header_str("Calls"),
+            TERM_SUPPORT.header_str("Time (s)"),
+        )
+        stage_matrix = [
+            (stage, str(calls), f"{duration:.3f}")
+            for stage, (calls, duration) in profile.stages.items()
+        ]
+        for line in iter_tabular_output(stage_matrix, header=stage_header, strip=True):
+            LOG_UI.info(line)
+
+        if profile.resolvers:
+            LOG_UI.info("")
+            resolver_header = (
+                TERM_SUPPORT.header_str("Resolver"),
+                TERM_SUPPORT.header_str("References"),
+                TERM_SUPPORT.header_str("Time (s)"),
+            )
+            resolver_matrix = [
+                (origin, str(count), f"{duration:.3f}")
+                for origin, (count, duration) in sorted(
+                    profile.resolvers.items(), key=lambda item: -item[1][1]
+                )
+            ]
+            for line in iter_tabular_output(
+                resolver_matrix, header=resolver_header, strip=True
+            ):
+                LOG_UI.info(line)
+
+        slowest = profile.get_slowest_references(PROFILE_SLOWEST_REFERENCES)
+        if slowest:
+            LOG_UI.info("")
+            reference_header = (
+                TERM_SUPPORT.header_str("Slowest reference"),
+                TERM_SUPPORT.header_str("Time (s)"),
+            )
+            reference_matrix = [
+                (reference, f"{duration:.3f}") for reference, duration in slowest
+            ]
+            for line in iter_tabular_output(
+                reference_matrix, header=reference_header, strip=True
+            ):
+                LOG_UI.info(line)
+
     @staticmethod
     def _get_resolution_matrix(suite):
         """Used for resolver."""
@@ -194,6 +250,14 @@ class List(CLICmd):
             allow_multiple=True,
         )
 
+        settings.add_argparser_to_option(
+            namespace="resolver.parallel",
+            parser=parser,
+            long_arg="--resolver-parallel",
+            metavar="PROCESSES",
+            allow_multiple=True,
+        )
+
         help_msg = "Writes runnable recipe files to a directory."
         settings.register_option(
             section="list.recipes",
@@ -216,16 +280,87 @@ class List(CLICmd):
             long_arg="--json",
         )
 
+        help_msg = (
+            "Keeps listing the tests whenever the files given as test "
+            "references (or found in directories given as test "
+            "references) change, resolving again only what changed."
+        )
+        settings.register_option(
+            section="list",
+            key="watch",
+            default=False,
+            key_type=bool,
+            help_msg=help_msg,
+            parser=parser,
+            long_arg="--watch",
+        )
+
+        help_msg = (
+            "Shows the time spent on each stage of the resolution of the "
+            "test references, by each resolver, and on the slowest "
+            "references."
+        )
+        settings.register_option(
+            section="list",
+            key="profile",
+            default=False,
+            key_type=bool,
+            help_msg=help_msg,
+            parser=parser,
+            long_arg="--profile",
+        )
+
         parser_common_args.add_tag_filter_args(parser)
 
+    def _watch(self, config):
+        references = config.get("resolver.references")
+        if not references:
+            LOG_UI.error("Watching for changes requires test references")
+            return exit_codes.AVOCADO_FAIL
+        hint = None
+        hint_filepath = ".avocado.hint"
+        if os.path.exists(hint_filepath):
+            hint = HintParser(hint_filepath)
+        try:
+            resolver = IncrementalResolver(references, hint, config, watch=True)
+        except OSError as details:
+            LOG_UI.error("Unable to watch for changes: %s", details)
+            return exit_codes.AVOCADO_FAIL
+        try:
+            while True:
+                resolutions = resolver.resolve()
+                suite = TestSuite(
+                    name="list",
+                    config=config,
+                    tests=resolutions_to_runnables(resolutions, config),
+                    resolutions=resolutions,
+                )
+                self._display(suite, self._get_resolution_matrix(suite))
+                LOG_UI.info("")
+                LOG_UI.info("Watching for changes, press Ctrl+C to stop...")
+                changed = resolver.wait()
+                LOG_UI.info("")
+                if changed is None:
+                    LOG_UI.info("Changes may have been lost, listing everything again")
+                else:
+                    LOG_UI.info("Changed: %s", ", ".join(changed))
+        except KeyboardInterrupt:
+            return exit_codes.AVOCADO_ALL_OK
+        finally:
+            resolver.close()
+
     def run(self, config):
         verbose = config.get("core.verbose")
         write_to_json_file = config.get("list.write_to_json_file")
         config["run.ignore_missing_references"] = True
+        if config.get("list.watch"):
+            return self._watch(config)
         try:
             suite = TestSuite.from_config(config)
             matrix = self._get_resolution_matrix(suite)
             self._display(suite, matrix)
+            if config.get("list.profile") and suite.profile is not None:
+                self._display_profile(suite.profile)
 
             directory = config.get("list.recipes.write_to_directory")
             if directory is not None:
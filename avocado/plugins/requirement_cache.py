@@ -12,8 +12,6 @@
 # Copyright: Red Hat Inc. 2022
 # Author: Jan Richter <jarichte@redhat.com>
 
-import os
-
 from avocado.core import output
 from avocado.core.dependencies.requirements.cache.backends import sqlite
 from avocado.core.plugin_interfaces import Cache
@@ -53,5 +51,4 @@ class RequirementCache(Cache):
         return requirement_list
 
     def clear(self):
-        if os.path.exists(sqlite.CACHE_DATABASE_PATH):
-            os.remove(sqlite.CACHE_DATABASE_PATH)
+        sqlite.delete_database()
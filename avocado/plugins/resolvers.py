@@ -24,29 +24,32 @@ from avocado.core.nrunner.runnable import Runnable
 from avocado.core.plugin_interfaces import Resolver
 from avocado.core.references import reference_split
 from avocado.core.resolver import (
+    ReferenceFilter,
     ReferenceResolution,
     ReferenceResolutionResult,
-    check_file,
 )
 from avocado.core.safeloader import find_avocado_tests, find_python_unittests
 
+EXECUTABLE_FILTER = ReferenceFilter(
+    suffix=None,
+    type_name="executable file",
+    access_check=os.R_OK | os.X_OK,
+    access_name="executable",
+)
+
+PYTHON_FILTER = ReferenceFilter()
+
 
 class ExecTestResolver(Resolver):
 
     name = "exec-test"
     description = "Test resolver for executable files to be handled as tests"
     priority = PluginPriority.VERY_LOW
+    reference_filter = EXECUTABLE_FILTER
 
     def resolve(self, reference):
 
-        criteria_check = check_file(
-            reference,
-            reference,
-            suffix=None,
-            type_name="executable file",
-            access_check=os.R_OK | os.X_OK,
-            access_name="executable",
-        )
+        criteria_check = self.reference_filter.check_file(reference, reference)
         if criteria_check is not True:
             return criteria_check
 
@@ -61,7 +64,7 @@ def python_resolver(name, reference, find_tests):
     if tests_filter is not None:
         tests_filter = re.compile(tests_filter)
 
-    criteria_check = check_file(module_path, reference)
+    criteria_check = PYTHON_FILTER.check_file(module_path, reference)
     if criteria_check is not True:
         return criteria_check
 
@@ -87,15 +90,16 @@ class PythonUnittestResolver(Resolver):
 
     name = "python-unittest"
     description = "Test resolver for Python Unittests"
+    reference_filter = PYTHON_FILTER
 
-    @staticmethod
-    def _find_compat(module_path):
+    def _find_compat(self, module_path):
         """Used as compatibility for the :func:`python_resolver()` interface."""
-        return find_python_unittests(module_path), None
+        use_cache = self.config.get("resolver.safeloader_cache", True)
+        return find_python_unittests(module_path, use_cache), None
 
     def resolve(self, reference):
         return python_resolver(
-            PythonUnittestResolver.name, reference, PythonUnittestResolver._find_compat
+            PythonUnittestResolver.name, reference, self._find_compat
         )
 
 
@@ -104,11 +108,14 @@ class AvocadoInstrumentedResolver(Resolver):
     name = "avocado-instrumented"
     description = "Test resolver for Avocado Instrumented tests"
     priority = PluginPriority.HIGH
+    reference_filter = PYTHON_FILTER
+
+    def _find(self, module_path):
+        use_cache = self.config.get("resolver.safeloader_cache", True)
+        return find_avocado_tests(module_path, use_cache)
 
     def resolve(self, reference):
-        return python_resolver(
-            AvocadoInstrumentedResolver.name, reference, find_avocado_tests
-        )
+        return python_resolver(AvocadoInstrumentedResolver.name, reference, self._find)
 
 
 class TapResolver(Resolver):
@@ -116,17 +123,11 @@ class TapResolver(Resolver):
     name = "tap"
     description = "Test resolver for executable files to be handled as TAP tests"
     priority = PluginPriority.LAST_RESORT
+    reference_filter = EXECUTABLE_FILTER
 
     def resolve(self, reference):
 
-        criteria_check = check_file(
-            reference,
-            reference,
-            suffix=None,
-            type_name="executable file",
-            access_check=os.R_OK | os.X_OK,
-            access_name="executable",
-        )
+        criteria_check = self.reference_filter.check_file(reference, reference)
         if criteria_check is not True:
             return criteria_check
 
@@ -80,6 +80,14 @@ class Run(CLICmd):
             allow_multiple=True,
         )
 
+        settings.add_argparser_to_option(
+            namespace="resolver.parallel",
+            parser=parser,
+            long_arg="--resolver-parallel",
+            metavar="PROCESSES",
+            allow_multiple=True,
+        )
+
         help_msg = (
             "Parameter name and value to pass to all tests. This is "
             "only applicable when not using a varianter plugin. "
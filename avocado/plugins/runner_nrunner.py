@@ -33,7 +33,8 @@ from avocado.core.plugin_interfaces import CLI, Init, SuiteRunner
 from avocado.core.settings import settings
 from avocado.core.status.repo import StatusRepo
 from avocado.core.status.server import StatusServer
-from avocado.core.task.runtime import RuntimeTaskGraph
+from avocado.core.task.parallelism import AdaptiveParallelism
+from avocado.core.task.runtime import RuntimeTaskGraph, iter_runtime_tasks
 from avocado.core.task.statemachine import TaskStateMachine, Worker
 
 
@@ -121,6 +122,32 @@ class RunnerInit(Init):
             help_msg=help_msg,
         )
 
+        help_msg = (
+            "Adapt the number of tasks running in parallel to the load "
+            "of the host (load average, memory pressure and time taken "
+            "to spawn tasks). The number of tasks will be kept between "
+            "run.min_parallel_tasks and run.max_parallel_tasks."
+        )
+        settings.register_option(
+            section=section,
+            key="adaptive_parallel_tasks",
+            default=False,
+            key_type=bool,
+            help_msg=help_msg,
+        )
+
+        help_msg = (
+            "Minimum number of tasks running in parallel, when the number "
+            "of tasks is adapted to the load of the host."
+        )
+        settings.register_option(
+            section=section,
+            key="min_parallel_tasks",
+            default=1,
+            key_type=int,
+            help_msg=help_msg,
+        )
+
         help_msg = (
             "Spawn tasks in a specific spawner. Available spawners: "
             "'process' and 'podman'"
@@ -186,6 +213,20 @@ class RunnerCLI(CLI):
             metavar="NUMBER_OF_TASKS",
         )
 
+        settings.add_argparser_to_option(
+            namespace="run.adaptive_parallel_tasks",
+            parser=parser,
+            long_arg="--adaptive-parallel-tasks",
+            action="store_true",
+        )
+
+        settings.add_argparser_to_option(
+            namespace="run.min_parallel_tasks",
+            parser=parser,
+            long_arg="--min-parallel-tasks",
+            metavar="NUMBER_OF_TASKS",
+        )
+
         settings.add_argparser_to_option(
             namespace="run.spawner",
             parser=parser,
@@ -236,23 +277,29 @@ class Runner(SuiteRunner):
         # pylint: disable=W0201
         self.status_server = StatusServer(listen, self.status_repo)
 
-    async def _update_status(self, job):
-        tasks_by_id = {
-            str(runtime_task.task.identifier): runtime_task.task
-            for runtime_task in self.runtime_tasks
-        }
-        message_handler = MessageHandler()
-        while True:
-            try:
-                (_, task_id, _, index) = self.status_repo.status_journal_summary_pop()
+    def _register_tasks(self, runtime_tasks, test_ids):
+        """Keeps track of the tasks as they are handed to the state machine.
 
-            except IndexError:
-                await asyncio.sleep(0.05)
-                continue
+        :param runtime_tasks: the tasks to be run
+        :type runtime_tasks: iterable of :class:`RuntimeTask`
+        :param test_ids: a list that gets the identifier of each test task
+        :type test_ids: list
+        """
+        for runtime_task in runtime_tasks:
+            self.tasks_by_id[str(runtime_task.task.identifier)] = runtime_task.task
+            if runtime_task.task.category == "test":
+                test_ids.append(runtime_task.task.identifier)
+            yield runtime_task
 
-            message = self.status_repo.get_task_data(task_id, index)
-            task = tasks_by_id.get(task_id)
-            message_handler.process_message(message, task, job)
+    async def _update_status(self, job, message_handler):
+        while True:
+            (_, task_id, _, index) = await self.status_repo.status_journal_summary_get()
+            try:
+                message = self.status_repo.get_task_data(task_id, index)
+                task = self.tasks_by_id.get(task_id)
+                message_handler.process_message(message, task, job)
+            finally:
+                self.status_repo.status_journal_summary_done()
 
     @staticmethod
     def _abort_if_missing_runners(runnables):
@@ -287,33 +334,53 @@ class Runner(SuiteRunner):
 
         self._create_status_server(test_suite, job)
 
-        graph = RuntimeTaskGraph(
-            test_suite.get_test_variants(),
-            test_suite.name,
-            self._determine_status_server(test_suite, "run.status_server_uri"),
-            job.unique_id,
+        status_server_uri = self._determine_status_server(
+            test_suite, "run.status_server_uri"
         )
-        # pylint: disable=W0201
-        self.runtime_tasks = graph.get_tasks_in_topological_order()
+        if test_suite.config.get("run.shuffle"):
+            # shuffling needs all the tasks at once
+            graph = RuntimeTaskGraph(
+                test_suite.get_test_variants(),
+                test_suite.name,
+                status_server_uri,
+                job.unique_id,
+            )
+            runtime_tasks = graph.get_tasks_in_topological_order()
+            random.shuffle(runtime_tasks)
+        else:
+            # tasks are created only as the state machine takes them
+            runtime_tasks = iter_runtime_tasks(
+                test_suite.iter_test_variants(),
+                job.result.tests_total,
+                test_suite.name,
+                status_server_uri,
+                job.unique_id,
+            )
 
         # Start the status server
         asyncio.ensure_future(self.status_server.serve_forever())
 
-        if test_suite.config.get("run.shuffle"):
-            random.shuffle(self.runtime_tasks)
-        test_ids = [
-            rt.task.identifier
-            for rt in self.runtime_tasks
-            if rt.task.category == "test"
-        ]
-        tsm = TaskStateMachine(self.runtime_tasks, self.status_repo)
+        # pylint: disable=W0201
+        self.tasks_by_id = {}
+        test_ids = []
+        tsm = TaskStateMachine(
+            [], self.status_repo, self._register_tasks(runtime_tasks, test_ids)
+        )
         spawner_name = test_suite.config.get("run.spawner")
         spawner = SpawnerDispatcher(test_suite.config, job)[spawner_name].obj
         max_running = min(
-            test_suite.config.get("run.max_parallel_tasks"), len(self.runtime_tasks)
+            test_suite.config.get("run.max_parallel_tasks"), job.result.tests_total
         )
         timeout = test_suite.config.get("task.timeout.running")
         failfast = test_suite.config.get("run.failfast")
+        parallelism = None
+        parallelism_controller = None
+        if test_suite.config.get("run.adaptive_parallel_tasks") and max_running > 1:
+            floor = test_suite.config.get("run.min_parallel_tasks")
+            parallelism = AdaptiveParallelism(
+                max(1, min(floor, max_running)), max_running
+            )
+            parallelism_controller = asyncio.ensure_future(parallelism.run(tsm))
         workers = [
             Worker(
                 state_machine=tsm,
@@ -321,42 +388,68 @@ class Runner(SuiteRunner):
                 max_running=max_running,
                 task_timeout=timeout,
                 failfast=failfast,
+                parallelism=parallelism,
             ).run()
             for _ in range(max_running)
         ]
-        asyncio.ensure_future(self._update_status(job))
+        message_handler = MessageHandler()
+        status_updater = asyncio.ensure_future(
+            self._update_status(job, message_handler)
+        )
         loop = asyncio.get_event_loop()
         try:
             try:
-                loop.run_until_complete(
-                    asyncio.wait_for(
-                        asyncio.shield(asyncio.gather(*workers)), job.timeout or None
+                try:
+                    loop.run_until_complete(
+                        asyncio.wait_for(
+                            asyncio.shield(asyncio.gather(*workers)),
+                            job.timeout or None,
+                        )
                     )
+                except (KeyboardInterrupt, asyncio.TimeoutError):
+                    terminate_worker = Worker(
+                        state_machine=tsm,
+                        spawner=spawner,
+                        max_running=max_running,
+                        task_timeout=timeout,
+                        failfast=failfast,
+                    )
+                    loop.run_until_complete(
+                        asyncio.wait_for(
+                            terminate_worker.terminate_tasks_timeout(), None
+                        )
+                    )
+                    raise
+            except (KeyboardInterrupt, asyncio.TimeoutError, TestFailFast) as ex:
+                LOG_JOB.info(str(ex))
+                job.interrupted_reason = str(ex)
+                summary.add("INTERRUPTED")
+
+            # Wait until all messages received so far have been processed
+            # by the status updater, otherwise tests whose messages are
+            # still pending would show as SKIP because of result
+            # reconciliation.  If the status updater is gone, nothing
+            # else would process them, so there's no point in waiting.
+            status_drained = asyncio.ensure_future(
+                self.status_repo.status_journal_summary_join()
+            )
+            loop.run_until_complete(
+                asyncio.wait(
+                    [status_drained, status_updater],
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-            except (KeyboardInterrupt, asyncio.TimeoutError):
-                terminate_worker = Worker(
-                    state_machine=tsm,
-                    spawner=spawner,
-                    max_running=max_running,
-                    task_timeout=timeout,
-                    failfast=failfast,
-                )
-                loop.run_until_complete(
-                    asyncio.wait_for(terminate_worker.terminate_tasks_timeout(), None)
-                )
-                raise
-        except (KeyboardInterrupt, asyncio.TimeoutError, TestFailFast) as ex:
-            LOG_JOB.info(str(ex))
-            job.interrupted_reason = str(ex)
-            summary.add("INTERRUPTED")
-
-        # Wait until all messages may have been processed by the
-        # status_updater. This should be replaced by a mechanism
-        # that only waits if there are missing status messages to
-        # be processed, and, only for a given amount of time.
-        # Tests with non received status will always show as SKIP
-        # because of result reconciliation.
-        loop.run_until_complete(asyncio.sleep(0.05))
+            )
+            status_drained.cancel()
+        finally:
+            # the task files must be closed (and flushed) even if running
+            # the tasks failed, once no more messages are processed, and
+            # so must be the processes the spawner may have left behind
+            status_updater.cancel()
+            tsm.cancel_delayed_triages()
+            if parallelism_controller is not None:
+                parallelism_controller.cancel()
+            message_handler.close()
+            loop.run_until_complete(spawner.shutdown())
 
         job.result.end_tests()
         self.status_server.close()
@@ -0,0 +1,36 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright: Red Hat Inc. 2022
+
+from avocado.core import output
+from avocado.core.plugin_interfaces import Cache
+from avocado.core.safeloader import cache
+from avocado.utils import astring
+
+
+class SafeloaderCache(Cache):
+
+    name = "safeloader"
+    description = "Provides the cache of the tests found on Python modules"
+
+    def list(self):
+        entries = [[path, ", ".join(targets)] for path, targets in cache.get_entries()]
+        if not entries:
+            return ""
+        header = (
+            output.TERM_SUPPORT.header_str("Module"),
+            output.TERM_SUPPORT.header_str("Tests"),
+        )
+        return astring.tabular_output(entries, header=header, strip=True) + "\n"
+
+    def clear(self):
+        cache.clear()
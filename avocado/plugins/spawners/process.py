@@ -1,9 +1,14 @@
 import asyncio
 import os
+import shutil
+import signal
 import socket
+import tempfile
 
 from avocado.core.dependencies.requirements import cache
-from avocado.core.plugin_interfaces import Spawner
+from avocado.core.nrunner import zygote
+from avocado.core.plugin_interfaces import CLI, Init, Spawner
+from avocado.core.settings import settings
 from avocado.core.spawners.common import SpawnerMixin, SpawnMethod
 from avocado.core.teststatus import STATUSES_NOT_OK
 from avocado.core.utils.eggenv import get_python_path_env_if_egg
@@ -11,15 +16,155 @@ from avocado.core.utils.eggenv import get_python_path_env_if_egg
 ENVIRONMENT_TYPE = "local"
 ENVIRONMENT = socket.gethostname()
 
+#: The time, in seconds, given to a zygote to exit after being told to
+ZYGOTE_SHUTDOWN_TIMEOUT = 5
+
+
+class ProcessSpawnerInit(Init):
+
+    description = "Process based spawner initialization"
+
+    def initialize(self):
+        section = "spawner.process"
+
+        help_msg = (
+            "Keep a warm runner process (a zygote) for each kind of "
+            "runnable, and fork it to run each task, instead of "
+            "executing a new runner process for every task. This "
+            "saves the runner startup time, which can dominate the "
+            "execution time of suites with many short tests"
+        )
+        settings.register_option(
+            section=section,
+            key="zygote",
+            default=False,
+            key_type=bool,
+            help_msg=help_msg,
+        )
+
+
+class ProcessCLI(CLI):
+
+    name = "process"
+    description = 'process spawner command line options for "run"'
+
+    def configure(self, parser):
+        super().configure(parser)
+        parser = parser.subcommands.choices.get("run", None)
+        if parser is None:
+            return
+
+        parser = parser.add_argument_group("process spawner specific options")
+        settings.add_argparser_to_option(
+            namespace="spawner.process.zygote",
+            parser=parser,
+            long_arg="--spawner-process-zygote",
+        )
+
+    def run(self, config):
+        pass
+
+
+class ForkedProcess:
+    """A task process forked by a zygote.
+
+    It mimics the parts of :class:`asyncio.subprocess.Process` used by
+    the spawner.  As the process is a child of the zygote, and not of
+    this process, its return code is reported by the zygote.
+    """
+
+    def __init__(self, pid, reader, writer):
+        self.pid = pid
+        self.returncode = None
+        self._reader = reader
+        self._writer = writer
+        self._waiter = asyncio.ensure_future(self._wait())
+
+    async def _wait(self):
+        try:
+            self.returncode = zygote.decode(await self._reader.readline())["returncode"]
+        except (OSError, ValueError, KeyError):
+            # the zygote is gone, and so is the means to know the outcome
+            self.returncode = -signal.SIGKILL
+        finally:
+            self._writer.close()
+        return self.returncode
+
+    async def wait(self):
+        return await asyncio.shield(self._waiter)
+
+    def terminate(self):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
 
 class ProcessSpawner(Spawner, SpawnerMixin):
 
     description = "Process based spawner"
     METHODS = [SpawnMethod.STANDALONE_EXECUTABLE]
 
+    def __init__(self, config=None, job=None):  # pylint: disable=W0231
+        SpawnerMixin.__init__(self, config, job)
+        #: futures resolving to the zygote socket path, by runner command
+        self._zygotes = {}
+        self._zygote_processes = []
+        self._zygote_dir = None
+
     async def _collect_task(self, task_handle):
         await task_handle.wait()
 
+    async def _start_zygote(self, runner):
+        if self._zygote_dir is None:
+            self._zygote_dir = tempfile.mkdtemp(prefix="avocado-zygote-")
+        socket_path = os.path.join(
+            self._zygote_dir, f"{len(self._zygote_processes)}.sock"
+        )
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *runner,
+                "zygote",
+                socket_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=get_python_path_env_if_egg(),
+            )
+        except (FileNotFoundError, PermissionError):
+            return None
+        self._zygote_processes.append(process)
+        try:
+            ready = zygote.decode(await process.stdout.readline())
+        except ValueError:
+            return None
+        if ready != zygote.READY_MESSAGE:
+            return None
+        return socket_path
+
+    async def _get_zygote(self, runner):
+        key = " ".join(runner)
+        if key not in self._zygotes:
+            self._zygotes[key] = asyncio.ensure_future(self._start_zygote(runner))
+        return await asyncio.shield(self._zygotes[key])
+
+    async def _spawn_from_zygote(self, runner, args):
+        socket_path = await self._get_zygote(runner)
+        if socket_path is None:
+            return None
+        try:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(zygote.encode({"args": args}))
+            pid = zygote.decode(await reader.readline())["pid"]
+        except (OSError, ValueError, KeyError):
+            # the zygote is not usable, so don't bother with it anymore
+            future = asyncio.get_event_loop().create_future()
+            future.set_result(None)
+            self._zygotes[" ".join(runner)] = future
+            return None
+        return ForkedProcess(pid, reader, writer)
+
     @staticmethod
     def is_task_alive(runtime_task):
         if runtime_task.spawner_handle is None:
@@ -29,9 +174,19 @@ class ProcessSpawner(Spawner, SpawnerMixin):
     async def spawn_task(self, runtime_task):
         self.create_task_output_dir(runtime_task)
         task = runtime_task.task
-        runner = task.runnable.runner_command()
-        args = runner[1:] + ["task-run"] + task.get_command_args()
-        runner = runner[0]
+        runner_command = task.runnable.runner_command()
+        status_protocol = task.runnable.runner_status_protocol()
+        task_args = ["task-run"] + task.get_command_args(status_protocol)
+
+        use_zygote = self.config.get("spawner.process.zygote")
+        if use_zygote and task.runnable.runner_supports_command("zygote"):
+            handle = await self._spawn_from_zygote(runner_command, task_args)
+            if handle is not None:
+                runtime_task.spawner_handle = handle
+                return True
+
+        runner = runner_command[0]
+        args = runner_command[1:] + task_args
 
         # pylint: disable=E1133
         try:
@@ -60,6 +215,22 @@ class ProcessSpawner(Spawner, SpawnerMixin):
     async def terminate_task(runtime_task):  # pylint: disable=W0221
         runtime_task.spawner_handle.terminate()
 
+    async def shutdown(self):
+        # zygotes exit once their standard input is closed
+        for process in self._zygote_processes:
+            process.stdin.close()
+        for process in self._zygote_processes:
+            try:
+                await asyncio.wait_for(process.wait(), ZYGOTE_SHUTDOWN_TIMEOUT)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        self._zygotes = {}
+        self._zygote_processes = []
+        if self._zygote_dir is not None:
+            shutil.rmtree(self._zygote_dir, ignore_errors=True)
+            self._zygote_dir = None
+
     @staticmethod
     async def check_task_requirements(runtime_task):
         """Check the runtime task requirements needed to be able to run"""
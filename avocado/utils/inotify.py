@@ -0,0 +1,191 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright: Red Hat Inc. 2022
+
+"""
+Monitoring of file system events, using the Linux inotify API.
+"""
+
+import collections
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+
+#: File was accessed
+IN_ACCESS = 0x00000001
+#: File was modified
+IN_MODIFY = 0x00000002
+#: Metadata (permissions, timestamps, etc) changed
+IN_ATTRIB = 0x00000004
+#: File opened for writing was closed
+IN_CLOSE_WRITE = 0x00000008
+#: File was moved out of the watched directory
+IN_MOVED_FROM = 0x00000040
+#: File was moved into the watched directory
+IN_MOVED_TO = 0x00000080
+#: File was created in the watched directory
+IN_CREATE = 0x00000100
+#: File was deleted from the watched directory
+IN_DELETE = 0x00000200
+#: The watched file or directory was itself deleted
+IN_DELETE_SELF = 0x00000400
+#: The watched file or directory was itself moved
+IN_MOVE_SELF = 0x00000800
+#: Events were lost, because the event queue overflowed
+IN_Q_OVERFLOW = 0x00004000
+#: The watch was removed
+IN_IGNORED = 0x00008000
+#: The subject of the event is a directory
+IN_ISDIR = 0x40000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+_READ_SIZE = 64 * 1024
+
+#: An event on a watched directory: the path of the directory, the mask
+#: describing the event, the cookie connecting related events, and the
+#: name of the file inside the directory (empty for the directory itself)
+Event = collections.namedtuple("Event", ["path", "mask", "cookie", "name"])
+
+_LIBC = None
+
+
+def _get_libc():
+    global _LIBC  # pylint: disable=W0603
+    if _LIBC is None:
+        name = ctypes.util.find_library("c")
+        if name is None:
+            return None
+        libc = ctypes.CDLL(name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            return None
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        _LIBC = libc
+    return _LIBC
+
+
+def is_supported():
+    """Checks whether the inotify API is available on this system."""
+    return _get_libc() is not None
+
+
+def _raise_from_errno():
+    error = ctypes.get_errno()
+    raise OSError(error, os.strerror(error))
+
+
+class Inotify:
+    """A set of watches on directories, and the events happening on them."""
+
+    def __init__(self):
+        libc = _get_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "The inotify API is not available")
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            _raise_from_errno()
+        self._paths = {}
+        self._descriptors = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        self.close()
+
+    def fileno(self):
+        return self._fd
+
+    @property
+    def paths(self):
+        """The paths being watched."""
+        return set(self._descriptors)
+
+    def add_watch(self, path, mask):
+        """Starts watching a path, or changes the events watched on it.
+
+        :param path: path of a file or directory
+        :type path: str
+        :param mask: the events to watch, such as ``IN_CREATE | IN_DELETE``
+        :type mask: int
+        """
+        descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if descriptor < 0:
+            _raise_from_errno()
+        self._paths[descriptor] = path
+        self._descriptors[path] = descriptor
+
+    def remove_watch(self, path):
+        """Stops watching a path."""
+        descriptor = self._descriptors.pop(path, None)
+        if descriptor is None:
+            return
+        self._paths.pop(descriptor, None)
+        self._libc.inotify_rm_watch(self._fd, descriptor)
+
+    def _parse(self, data):
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            descriptor, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                events.append(Event(None, mask, cookie, ""))
+                continue
+            path = self._paths.get(descriptor)
+            if path is None:
+                continue
+            if mask & IN_IGNORED:
+                self._paths.pop(descriptor, None)
+                if self._descriptors.get(path) == descriptor:
+                    del self._descriptors[path]
+            events.append(Event(path, mask, cookie, os.fsdecode(name)))
+        return events
+
+    def read_events(self, timeout=None):
+        """Waits for, and returns, the events on the watched paths.
+
+        :param timeout: how long to wait for events, in seconds, or None
+                        to wait until there are events
+        :type timeout: float
+        :returns: the events that happened, possibly none if the timeout
+                  was reached.  An event with a path of None and the
+                  :data:`IN_Q_OVERFLOW` mask means that events were lost.
+        :rtype: list of :class:`Event`
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+        return self._parse(data)
+
+    def close(self):
+        """Removes all watches and releases the resources used."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._paths.clear()
+        self._descriptors.clear()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""
+Measures the per-task overhead of the task state machine scheduling.
+
+It runs a number of no-op tasks through the real
+:class:`avocado.core.task.statemachine.TaskStateMachine` and
+:class:`avocado.core.task.statemachine.Worker`, with a spawner that
+finishes tasks instantly, so that all of the time measured is spent
+in scheduling.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.task import Task
+from avocado.core.spawners.mock import MockSpawner
+from avocado.core.status.repo import StatusRepo
+from avocado.core.task.runtime import RuntimeTask
+from avocado.core.task.statemachine import TaskStateMachine, Worker
+
+JOB_ID = "benchmark"
+
+
+class InstantSpawner(MockSpawner):
+    """Spawner whose tasks report themselves as finished right away."""
+
+    def __init__(self, status_repo):
+        super().__init__()
+        self._status_repo = status_repo
+
+    def is_task_alive(self, runtime_task):
+        return False
+
+    async def spawn_task(self, runtime_task):
+        task_id = str(runtime_task.task.identifier)
+        now = time.monotonic()
+        for message in (
+            {"status": "started", "output_dir": "/dev/null", "time": now},
+            {"status": "finished", "result": "pass", "time": now},
+        ):
+            message.update({"id": task_id, "job_id": JOB_ID})
+            self._status_repo.process_message(message)
+        return True
+
+
+async def run(number_of_tasks, number_of_workers):
+    runnable = Runnable("noop", "noop")
+    runtime_tasks = [
+        RuntimeTask(Task(runnable, str(index)))
+        for index in range(1, number_of_tasks + 1)
+    ]
+    status_repo = StatusRepo(JOB_ID)
+    spawner = InstantSpawner(status_repo)
+    state_machine = TaskStateMachine(runtime_tasks, status_repo)
+    workers = [
+        Worker(state_machine, spawner, max_running=number_of_workers).run()
+        for _ in range(number_of_workers)
+    ]
+    start = time.monotonic()
+    await asyncio.gather(*workers)
+    elapsed = time.monotonic() - start
+    assert len(state_machine.finished) == number_of_tasks
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--tasks", type=int, default=10000, help="number of no-op tasks to schedule"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help="number of state machine workers",
+    )
+    args = parser.parse_args()
+    loop = asyncio.get_event_loop()
+    elapsed = loop.run_until_complete(run(args.tasks, args.workers))
+    print(f"tasks: {args.tasks}")
+    print(f"workers: {args.workers}")
+    print(f"total time: {elapsed:.3f}s")
+    print(f"per task overhead: {elapsed / args.tasks * 1000000:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
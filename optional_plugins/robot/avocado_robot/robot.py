@@ -22,9 +22,9 @@ from robot.output.logger import LOGGER
 from avocado.core.nrunner.runnable import Runnable
 from avocado.core.plugin_interfaces import Resolver
 from avocado.core.resolver import (
+    ReferenceFilter,
     ReferenceResolution,
     ReferenceResolutionResult,
-    check_file,
 )
 
 LOGGER.unregister_console_logger()
@@ -52,15 +52,16 @@ class RobotResolver(Resolver):
 
     name = "robot"
     description = "Test resolver for Robot Framework tests"
+    # It may be possible to have Robot Framework tests in other
+    # types of files such as reStructuredText (.rst), but given
+    # that we're not testing that, let's restrict to files ending
+    # in .robot files
+    reference_filter = ReferenceFilter(suffix=".robot")
 
     @staticmethod
     def resolve(reference):  # pylint: disable=W0221
 
-        # It may be possible to have Robot Framework tests in other
-        # types of files such as reStructuredText (.rst), but given
-        # that we're not testing that, let's restrict to files ending
-        # in .robot files
-        criteria_check = check_file(reference, reference, suffix=".robot")
+        criteria_check = RobotResolver.reference_filter.check_file(reference, reference)
         if criteria_check is not True:
             return criteria_check
 
@@ -12,16 +12,19 @@ LOG.setLevel(logging.INFO)
 
 
 class Cit:
-    def __init__(self, input_data, t_value, constraints):
+    def __init__(self, input_data, t_value, constraints, seed=None):
         """
         Creation of CombinationMatrix from user input
 
         :param input_data: parameters from user
         :param t_value: size of one combination
         :param constraints: constraints of combinations
+        :param seed: seed of the random search, the same seed gives the same
+                     solution. If it's None the search is not repeatable
         """
         self.data = input_data
         self.t_value = t_value
+        self.random = random.Random(seed)
         # CombinationMatrix creation
         self.combination_matrix = CombinationMatrix(input_data, t_value)
         # Creation of solver and simplification of constraints
@@ -68,7 +71,7 @@ class Cit:
         deleted_rows = []
         while step_size != 0:
             for i in range(step_size):
-                delete_row = matrix.pop(random.randint(0, len(matrix) - 1))
+                delete_row = matrix.pop(self.random.randint(0, len(matrix) - 1))
                 self.combination_matrix.uncover_solution_row(delete_row)
                 deleted_rows.append(delete_row)
             LOG.debug(
@@ -125,7 +128,7 @@ class Cit:
         :param matrix: matrix to be changed
         :return: new row of matrix, index of row inside matrix and parameters which has been changed
         """
-        switch = random.randint(0, 9)
+        switch = self.random.randint(0, 9)
         if switch == 0:
             solution, row_index, parameters = self.change_one_value(matrix)
         elif switch == 1:
@@ -146,7 +149,7 @@ class Cit:
             row = [-1] * len(self.data)
             while len(possible_parameters) != 0:
                 # finding uncovered combination
-                combination_parameters_index = random.randint(
+                combination_parameters_index = self.random.randint(
                     0, len(possible_parameters) - 1
                 )
                 combination_parameters = possible_parameters[
@@ -159,7 +162,9 @@ class Cit:
                 possible_combinations = list(
                     combination_row.get_all_uncovered_combinations()
                 )
-                combination_index = random.randint(0, len(possible_combinations) - 1)
+                combination_index = self.random.randint(
+                    0, len(possible_combinations) - 1
+                )
                 combination = possible_combinations[combination_index]
                 is_parameter_used = False
                 # Are parameters already used in row?
@@ -180,7 +185,7 @@ class Cit:
                 if r == -1:
                     is_valid = False
                     while not is_valid:
-                        row[index] = random.randint(0, self.data[index] - 1)
+                        row[index] = self.random.randint(0, self.data[index] - 1)
                         is_valid = self.combination_matrix.is_valid_solution(row)
             is_valid_row = self.combination_matrix.is_valid_solution(row)
 
@@ -203,16 +208,13 @@ class Cit:
             for index, item in enumerate(parameters):
                 solution[item] = combination[index]
             if self.combination_matrix.is_valid_combination(solution, parameters):
-                self.combination_matrix.uncover_combination(
-                    matrix[row_index], parameters
+                total_uncovered = self.combination_matrix.evaluate_combination(
+                    matrix[row_index], solution, parameters
                 )
-                self.combination_matrix.cover_combination(solution, parameters)
-                if self.combination_matrix.total_uncovered < best_uncover:
-                    best_uncover = self.combination_matrix.total_uncovered
+                if total_uncovered < best_uncover:
+                    best_uncover = total_uncovered
                     best_solution = solution
                     best_row_index = row_index
-                self.combination_matrix.uncover_combination(solution, parameters)
-                self.combination_matrix.cover_combination(matrix[row_index], parameters)
                 if best_uncover == 0:
                     break
         return best_solution, best_row_index, parameters
@@ -224,11 +226,13 @@ class Cit:
         :return: parameter of combination and values of combination
         """
         possible_parameters = list(self.combination_matrix.uncovered_rows)
-        combination_parameters_index = random.randint(0, len(possible_parameters) - 1)
+        combination_parameters_index = self.random.randint(
+            0, len(possible_parameters) - 1
+        )
         combination_parameters = possible_parameters[combination_parameters_index]
         combination_row = self.combination_matrix.get_row(combination_parameters)
         possible_combinations = list(combination_row.get_all_uncovered_combinations())
-        combination_index = random.randint(0, len(possible_combinations) - 1)
+        combination_index = self.random.randint(0, len(possible_combinations) - 1)
         combination = possible_combinations[combination_index]
         return combination_parameters, combination
 
@@ -240,7 +244,7 @@ class Cit:
         :param matrix: matrix to be changed
         :return: solution, index of solution inside matrix and parameters which has been changed
         """
-        column_index = random.randint(0, len(self.data) - 1)
+        column_index = self.random.randint(0, len(self.data) - 1)
         best_uncover = float("inf")
         best_solution = []
         best_row_index = 0
@@ -251,14 +255,13 @@ class Cit:
                 )
             except ValueError:
                 continue
-            self.combination_matrix.uncover_combination(matrix[row_index], parameters)
-            self.combination_matrix.cover_combination(solution, parameters)
-            if self.combination_matrix.total_uncovered < best_uncover:
-                best_uncover = self.combination_matrix.total_uncovered
+            total_uncovered = self.combination_matrix.evaluate_combination(
+                matrix[row_index], solution, parameters
+            )
+            if total_uncovered < best_uncover:
+                best_uncover = total_uncovered
                 best_solution = solution
                 best_row_index = row_index
-            self.combination_matrix.uncover_combination(solution, parameters)
-            self.combination_matrix.cover_combination(matrix[row_index], parameters)
             if best_uncover == 0:
                 break
         return best_solution, best_row_index, [column_index]
@@ -275,27 +278,27 @@ class Cit:
         is_cell_chosen = True
         if row_index is None:
             is_cell_chosen = False
-            row_index = random.randint(0, len(matrix) - 1)
+            row_index = self.random.randint(0, len(matrix) - 1)
         row = [x for x in matrix[row_index]]
         if column_index is None:
             is_cell_chosen = False
-            column_index = random.randint(0, len(row) - 1)
+            column_index = self.random.randint(0, len(row) - 1)
         possible_numbers = list(range(0, row[column_index])) + list(
             range(row[column_index] + 1, self.data[column_index])
         )
-        row[column_index] = random.choice(possible_numbers)
+        row[column_index] = self.random.choice(possible_numbers)
         while not self.combination_matrix.is_valid_combination(row, [column_index]):
             possible_numbers.remove(row[column_index])
             if len(possible_numbers) == 0:
                 if is_cell_chosen:
                     raise ValueError("Selected cell can't be changed")
-                column_index = random.randint(0, len(row) - 1)
-                row_index = random.randint(0, len(matrix) - 1)
+                column_index = self.random.randint(0, len(row) - 1)
+                row_index = self.random.randint(0, len(matrix) - 1)
                 row = [x for x in matrix[row_index]]
                 possible_numbers = list(range(0, row[column_index])) + list(
                     range(row[column_index] + 1, self.data[column_index])
                 )
-            row[column_index] = random.choice(possible_numbers)
+            row[column_index] = self.random.choice(possible_numbers)
         return row, row_index, [column_index]
 
     def compute_row_using_hamming_distance(self):
@@ -330,8 +333,8 @@ class Cit:
         data_size = len(self.data)
         row = [-1] * data_size
 
-        for parameter in random.sample(range(data_size), data_size):
+        for parameter in self.random.sample(range(data_size), data_size):
             possible_values = self.solver.get_possible_values(row, parameter)
-            value_choice = random.choice(possible_values)
+            value_choice = self.random.choice(possible_values)
             row[parameter] = value_choice
         return row
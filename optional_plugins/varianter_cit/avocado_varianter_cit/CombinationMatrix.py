@@ -21,12 +21,49 @@ class CombinationMatrix:
         self.uncovered_rows = {}
         self.total_uncovered = 0
         self.total_covered_more_than_ones = 0
+        # Keys, Rows and the strides of parameters inside them, for all rows
+        # and for the rows in which each parameter is, in the hash table order
+        self.rows = []
+        self.parameter_rows = {parameter: [] for parameter in range(len(input_data))}
+        self._positions = {}
+        self._last_rows = (None, None)
+        # Rows with disabled combinations, for all rows and for each parameter
+        self._constrained_rows = None
         # Creation of rows
         for c in itertools.combinations(range(len(input_data)), t_value):
             row = Row(input_data, t_value, c)
             self.total_uncovered += row.uncovered
             self.hash_table[c] = row
             self.uncovered_rows[c] = c
+            self._positions[c] = len(self.rows)
+            self.rows.append((c, row, row.solution_strides))
+            for parameter_stride in row.solution_strides:
+                self.parameter_rows[parameter_stride[0]].append(
+                    (c, row, (parameter_stride,))
+                )
+
+    def get_rows(self, parameters):
+        """
+        :param parameters: parameters which has to be in rows
+        :return: keys, Rows with any of the parameters and the strides of the
+                 parameters inside them, in the order of the hash table
+        """
+        if len(parameters) == 1:
+            return self.parameter_rows[parameters[0]]
+        parameters = tuple(parameters)
+        # The same parameters are used for each row of the solution in a row
+        if self._last_rows[0] == parameters:
+            return self._last_rows[1]
+        rows = {}
+        for parameter in parameters:
+            for key, value, strides in self.parameter_rows[parameter]:
+                if key in rows:
+                    rows[key] = (key, value, rows[key][2] + strides)
+                else:
+                    rows[key] = (key, value, strides)
+        rows = sorted(rows.values(), key=lambda item: self._positions[item[0]])
+        self._last_rows = (parameters, rows)
+        return rows
 
     def cover_solution_row(self, row):
         """
@@ -35,22 +72,7 @@ class CombinationMatrix:
         :param row: one row from solution
         :return: number of still uncovered combinations
         """
-        for key, value in self.hash_table.items():
-            val = []
-            # Getting combination from solution
-            for i in key:
-                val.append(row[i])
-
-            uncovered_difference, covered_more_than_ones_difference = value.cover_cell(
-                val
-            )
-            # Deleting covered row from uncovered rows
-            if value.uncovered == 0:
-                self.uncovered_rows.pop(key, None)
-            self.total_uncovered += uncovered_difference
-            self.total_covered_more_than_ones += covered_more_than_ones_difference
-
-        return self.total_uncovered
+        return self._cover_rows(row, self.rows)
 
     def cover_combination(self, row, parameters):
         """
@@ -60,26 +82,19 @@ class CombinationMatrix:
         :param parameters: parameters which has to be covered
         :return: number of still uncovered combinations
         """
-        for key, value in self.hash_table.items():
-            for parameter in parameters:
-                if parameter in key:
-                    val = []
-                    # Getting combination from solution
-                    for i in key:
-                        val.append(row[i])
-
-                    (
-                        uncovered_difference,
-                        covered_more_than_ones_difference,
-                    ) = value.cover_cell(val)
-                    # Deleting covered row from uncovered rows
-                    if value.uncovered == 0:
-                        self.uncovered_rows.pop(key, None)
-                    self.total_uncovered += uncovered_difference
-                    self.total_covered_more_than_ones += (
-                        covered_more_than_ones_difference
-                    )
-                    break
+        return self._cover_rows(row, self.get_rows(parameters))
+
+    def _cover_rows(self, row, rows):
+        for key, value, _ in rows:
+            (
+                uncovered_difference,
+                covered_more_than_ones_difference,
+            ) = value.cover_index(value.get_solution_index(row))
+            # Deleting covered row from uncovered rows
+            if value.uncovered == 0:
+                self.uncovered_rows.pop(key, None)
+            self.total_uncovered += uncovered_difference
+            self.total_covered_more_than_ones += covered_more_than_ones_difference
         return self.total_uncovered
 
     def uncover_solution_row(self, row):
@@ -89,53 +104,68 @@ class CombinationMatrix:
         :param row: one row from solution
         :return: number of uncovered combinations
         """
-        for key, value in self.hash_table.items():
-            val = []
-            # Getting combination from solution
-            for i in key:
-                val.append(row[i])
+        return self._uncover_rows(row, self.rows)
+
+    def uncover_combination(self, row, parameters):
+        """
+        Uncover combination of specific parameters by one row from possible solution
+
+        :param row: one row from solution
+        :param parameters: parameters which has to be covered
+        :return: number of uncovered combinations
+        """
+        return self._uncover_rows(row, self.get_rows(parameters))
 
+    def _uncover_rows(self, row, rows):
+        for key, value, _ in rows:
             (
                 uncovered_difference,
                 covered_more_than_ones_difference,
-            ) = value.uncover_cell(val)
+            ) = value.uncover_index(value.get_solution_index(row))
             # Adding uncovered row to uncovered rows
             if value.uncovered != 0:
                 self.uncovered_rows[key] = key
             self.total_uncovered += uncovered_difference
             self.total_covered_more_than_ones += covered_more_than_ones_difference
-
         return self.total_uncovered
 
-    def uncover_combination(self, row, parameters):
+    def evaluate_combination(self, row, solution, parameters):
         """
-        Uncover combination of specific parameters by one row from possible solution
+        Computes the number of uncovered combinations if the combination of
+        specific parameters was moved from one row to another row, without
+        changing the coverage. It gives the same result as uncovering the
+        combination by the first row, covering it by the second one and
+        restoring it back, which also moves rows whose combinations were all
+        covered during that to the end of uncovered rows.
 
-        :param row: one row from solution
-        :param parameters: parameters which has to be covered
+        :param row: one row from solution, which is covered
+        :param solution: row which differs from row only in the parameters
+        :param parameters: parameters which has to be changed
         :return: number of uncovered combinations
         """
-        for key, value in self.hash_table.items():
-            for parameter in parameters:
-                if parameter in key:
-                    val = []
-                    # Getting combination from solution
-                    for i in key:
-                        val.append(row[i])
-
-                    (
-                        uncovered_difference,
-                        covered_more_than_ones_difference,
-                    ) = value.uncover_cell(val)
-                    # Adding uncovered row to uncovered rows
-                    if value.uncovered != 0:
-                        self.uncovered_rows[key] = key
-                    self.total_uncovered += uncovered_difference
-                    self.total_covered_more_than_ones += (
-                        covered_more_than_ones_difference
-                    )
-                    break
-        return self.total_uncovered
+        total_uncovered = self.total_uncovered
+        moved_rows = []
+        for key, value, strides in self.get_rows(parameters):
+            old_index = 0
+            for parameter, stride in value.solution_strides:
+                old_index += row[parameter] * stride
+            new_index = old_index
+            for parameter, stride in strides:
+                new_index += (solution[parameter] - row[parameter]) * stride
+            if old_index == new_index:
+                continue
+            uncovered = value.uncovered
+            if value.counts[old_index] == 1:
+                uncovered += 1
+            if value.counts[new_index] == 0:
+                uncovered -= 1
+            total_uncovered += uncovered - value.uncovered
+            if uncovered == 0 and value.uncovered != 0:
+                moved_rows.append(key)
+        for key in moved_rows:
+            self.uncovered_rows.pop(key, None)
+            self.uncovered_rows[key] = key
+        return total_uncovered
 
     def uncover(self):
         """
@@ -153,12 +183,8 @@ class CombinationMatrix:
 
         :param row: one row from solution
         """
-        for key, value in self.hash_table.items():
-            val = []
-            for i in key:
-                val.append(row[i])
-
-            if not value.is_valid(val):
+        for value in self.get_constrained_rows(None):
+            if not value.is_valid_solution(row):
                 return False
 
         return True
@@ -170,18 +196,30 @@ class CombinationMatrix:
         :param row: one row from solution
         :param parameters: parameters from row
         """
-        for key, value in self.hash_table.items():
-            for parameter in parameters:
-                if parameter in key:
-                    val = []
-                    for i in key:
-                        val.append(row[i])
-
-                    if not value.is_valid(val):
-                        return False
-                    break
+        for parameter in parameters:
+            for value in self.get_constrained_rows(parameter):
+                if not value.is_valid_solution(row):
+                    return False
         return True
 
+    def get_constrained_rows(self, parameter):
+        """
+        Only rows with disabled combinations can make a solution row invalid,
+        so these are kept aside, once the constraints have been applied.
+
+        :param parameter: parameter which has to be in rows, or None for all
+        :return: Rows with disabled combinations
+        """
+        if self._constrained_rows is None:
+            self._constrained_rows = {
+                None: [value for _, value, _ in self.rows if value.disabled]
+            }
+            for key, rows in self.parameter_rows.items():
+                self._constrained_rows[key] = [
+                    value for _, value, _ in rows if value.disabled
+                ]
+        return self._constrained_rows[parameter]
+
     def del_cell(self, parameters, combination):
         """
         Disable one combination. If combination is disabled it means that
@@ -192,6 +230,7 @@ class CombinationMatrix:
         """
         row = self.hash_table[tuple(parameters)]
         uncovered_difference = row.del_cell(combination)
+        self._constrained_rows = None
         if row.uncovered == 0:
             self.uncovered_rows.pop(tuple(parameters), None)
         self.total_uncovered += uncovered_difference
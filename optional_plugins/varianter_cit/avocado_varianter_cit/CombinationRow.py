@@ -1,13 +1,53 @@
 import itertools
+from collections.abc import MutableMapping
+
+
+class CombinationTable(MutableMapping):
+
+    """
+    Dictionary like view of the coverage of combinations inside Row. Keys are
+    values of combinations and values are information about coverage, stored
+    in the list of counts of the Row object.
+    """
+
+    def __init__(self, row):
+        """
+        :param row: Row object whose coverage is viewed
+        """
+        self.row = row
+
+    def __getitem__(self, key):
+        return self.row.counts[self.row.get_index(key)]
+
+    def __setitem__(self, key, value):
+        index = self.row.get_index(key)
+        if self.row.counts[index] is None:
+            self.row.disabled -= 1
+        if value is None:
+            self.row.disabled += 1
+        self.row.counts[index] = value
+
+    def __delitem__(self, key):
+        raise TypeError("Combinations can't be deleted, only disabled")
+
+    def __iter__(self):
+        return itertools.product(*[range(size) for size in self.row.sizes])
+
+    def __len__(self):
+        return len(self.row.counts)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
 
 
 class CombinationRow:
 
     """
-    Row object store all combinations between two parameters into dictionary.
-    Keys in dictionary are values of combinations and values in dictionary are
-    information about coverage. Row object has information how many combinations
-    are uncovered and how many of them are covered more than ones.
+    Row object store all combinations between two parameters into list.
+    Combinations are indexed by their values, as numbers whose digits are the
+    values of the parameters, and items in list are information about coverage.
+    Row object has information how many combinations are uncovered and how many
+    of them are covered more than ones.
     """
 
     def __init__(self, input_data, t_value, parameters):
@@ -17,16 +57,47 @@ class CombinationRow:
         :param parameters: the tuple of parameters whose combinations Row object represents
         """
 
-        self.hash_table = {}
+        self.parameters = tuple(parameters[:t_value])
+        self.sizes = [input_data[parameter] for parameter in self.parameters]
         self.covered_more_than_ones = 0
-        self.uncovered = 0
-        array = []
+        self.disabled = 0
         "Creation of combinations"
-        for i in range(t_value):
-            array.append(list(range(input_data[parameters[i]])))
-        for i in itertools.product(*array):
-            self.uncovered += 1
-            self.hash_table[i] = 0
+        self.strides = [1] * t_value
+        for i in range(t_value - 1, 0, -1):
+            self.strides[i - 1] = self.strides[i] * self.sizes[i]
+        # Pairs of parameter and stride, to index combinations from solution
+        self.solution_strides = tuple(zip(self.parameters, self.strides))
+        self.counts = [0] * (self.strides[0] * self.sizes[0]) if t_value else [0]
+        self.uncovered = len(self.counts)
+
+    @property
+    def hash_table(self):
+        """
+        :return: the coverage of combinations as a dictionary like object
+        """
+        return CombinationTable(self)
+
+    def get_index(self, key):
+        """
+        :param key: combination of values
+        :return: index of combination inside the list of counts
+        """
+        index = 0
+        for value, size, stride in zip(key, self.sizes, self.strides):
+            if not 0 <= value < size:
+                raise KeyError(tuple(key))
+            index += value * stride
+        return index
+
+    def get_solution_index(self, row):
+        """
+        :param row: one row from solution
+        :return: index of the combination inside the list of counts
+        """
+        index = 0
+        for parameter, stride in self.solution_strides:
+            index += row[parameter] * stride
+        return index
 
     def cover_cell(self, key):
         """
@@ -36,20 +107,27 @@ class CombinationRow:
         :return: number of new covered combinations and number of new covered combinations more than ones
         """
 
-        old_uncovered = self.uncovered
-        old_covered_more_than_ones = self.covered_more_than_ones
-        value = self.hash_table[tuple(key)]
-        if value is not None:
-            if value == 0:
-                self.uncovered -= 1
-            elif value == 1:
-                self.covered_more_than_ones += 1
-            self.hash_table[tuple(key)] += 1
+        return self.cover_index(self.get_index(key))
 
-        return (
-            self.uncovered - old_uncovered,
-            self.covered_more_than_ones - old_covered_more_than_ones,
-        )
+    def cover_index(self, index):
+        """
+        Cover one combination inside Row
+
+        :param index: index of combination to be covered
+        :return: number of new covered combinations and number of new covered combinations more than ones
+        """
+
+        value = self.counts[index]
+        if value is None:
+            return 0, 0
+        self.counts[index] = value + 1
+        if value == 0:
+            self.uncovered -= 1
+            return -1, 0
+        if value == 1:
+            self.covered_more_than_ones += 1
+            return 0, 1
+        return 0, 0
 
     def uncover_cell(self, key):
         """
@@ -59,32 +137,36 @@ class CombinationRow:
         :return: number of new covered combinations and number of new covered combinations more than ones
         """
 
-        old_uncovered = self.uncovered
-        old_covered_more_than_ones = self.covered_more_than_ones
-        value = self.hash_table[tuple(key)]
-        if value is not None and value > 0:
-            if value == 1:
-                self.uncovered += 1
-            elif value == 2:
-                self.covered_more_than_ones -= 1
-            self.hash_table[tuple(key)] -= 1
+        return self.uncover_index(self.get_index(key))
 
-        return (
-            self.uncovered - old_uncovered,
-            self.covered_more_than_ones - old_covered_more_than_ones,
-        )
+    def uncover_index(self, index):
+        """
+        Uncover one combination inside Row
+
+        :param index: index of combination to be uncovered
+        :return: number of new covered combinations and number of new covered combinations more than ones
+        """
+
+        value = self.counts[index]
+        if value is None or value == 0:
+            return 0, 0
+        self.counts[index] = value - 1
+        if value == 1:
+            self.uncovered += 1
+            return 1, 0
+        if value == 2:
+            self.covered_more_than_ones -= 1
+            return 0, -1
+        return 0, 0
 
     def completely_uncover(self):
         """
         Uncover all combinations inside Row
         """
 
-        self.uncovered = 0
         self.covered_more_than_ones = 0
-        for key, value in self.hash_table.items():
-            if value is not None:
-                self.hash_table[key] = 0
-                self.uncovered += 1
+        self.counts = [None if value is None else 0 for value in self.counts]
+        self.uncovered = len(self.counts) - self.disabled
 
     def del_cell(self, key):
         """
@@ -95,9 +177,10 @@ class CombinationRow:
         :return: number of new covered combinations
         """
 
-        key = tuple(key)
-        if self.hash_table[key] is not None:
-            self.hash_table[key] = None
+        index = self.get_index(key)
+        if self.counts[index] is not None:
+            self.counts[index] = None
+            self.disabled += 1
             self.uncovered -= 1
             return -1
         else:
@@ -110,11 +193,27 @@ class CombinationRow:
         :param key: combination to valid
         """
 
-        key = tuple(key)
-        if self.hash_table.get(key, 0) is None:
-            return False
-        else:
+        try:
+            return self.counts[self.get_index(key)] is not None
+        except KeyError:
+            return True
+
+    def is_valid_solution(self, row):
+        """
+        Is the combination from solution row match the constraints.
+
+        :param row: one row from solution, whose values may be unset (-1)
+        """
+
+        if not self.disabled:
             return True
+        index = 0
+        for parameter, stride in self.solution_strides:
+            value = row[parameter]
+            if value < 0:
+                return True
+            index += value * stride
+        return self.counts[index] is not None
 
     def get_all_uncovered_combinations(self):
         """
@@ -122,7 +221,7 @@ class CombinationRow:
         """
 
         combinations = []
-        for key, value in self.hash_table.items():
+        for key, value in zip(self.hash_table, self.counts):
             if value == 0:
                 combinations.append(key)
         return combinations
@@ -131,5 +230,5 @@ class CombinationRow:
         return (
             self.covered_more_than_ones == other.covered_more_than_ones
             and self.uncovered == other.uncovered
-            and self.hash_table == other.hash_table
+            and self.counts == other.counts
         )
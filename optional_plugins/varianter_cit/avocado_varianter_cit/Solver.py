@@ -84,6 +84,7 @@ class Solver:
             self.read_constraints()
             self.compute_constraints()
             self.simplify_constraints()
+        self.compile_constraints()
 
     def read_constraints(self):
         # creates new parameters with their names
@@ -170,6 +171,26 @@ class Solver:
                     for key in itertools.product(*value_array):
                         combination_matrix.del_cell(c, key)
 
+    def compile_constraints(self):
+        """
+        Compile the constraints of parameters into lookup tables.
+
+        For each parameter, the values which are always permitted, and for
+        the others, the parameters whose values decide whether they are.
+        The possible values are then computed once for each assignment of
+        those parameters, and looked up afterwards.
+        """
+        self._deciding_parameters = []
+        self._possible_values = []
+        for parameter in self.parameters:
+            deciding_parameters = set()
+            for one_value_constraints in parameter.constraints:
+                for constraints in one_value_constraints or []:
+                    for constraint in constraints:
+                        deciding_parameters.add(constraint[self.CON_NAME])
+            self._deciding_parameters.append(tuple(sorted(deciding_parameters)))
+            self._possible_values.append({})
+
     def get_possible_values(self, row, parameter):
         """
         Compute all possible values for the given parameter.
@@ -185,7 +206,14 @@ class Solver:
         :return: all possible values for the given parameter
         :rtype: list
         """
-
+        assignment = tuple(row[i] for i in self._deciding_parameters[parameter])
+        possible_values = self._possible_values[parameter].get(assignment)
+        if possible_values is None:
+            possible_values = self._compute_possible_values(row, parameter)
+            self._possible_values[parameter][assignment] = possible_values
+        return list(possible_values)
+
+    def _compute_possible_values(self, row, parameter):
         def is_permitted_value(one_value_constraints):
             if one_value_constraints is None:
                 return True
@@ -0,0 +1,164 @@
+"""
+Persistent cache of the covering arrays computed by the CIT varianter.
+
+Computing a covering array means searching for the smallest one, which
+is done again on every job given the same parameter file.  When a seed
+is given, the search is repeatable, and the arrays computed are thus
+kept in files under the data directory, identified by the content of
+the parameter file, the order of combinations and the seed.  An array
+is reused until any of those change, or a different version of Avocado
+is used.
+
+Arrays not used for :data:`MAX_AGE` seconds are removed, and so are
+the least recently used ones beyond :data:`MAX_ENTRIES`.
+"""
+
+import hashlib
+import os
+
+from avocado.core.data_dir import get_datafile_path
+from avocado.core.utils import cache
+
+#: The name of the directory with the cache files, inside the "cache"
+#: data directory
+CACHE_DIR_NAME = "cit"
+
+#: The maximum number of covering arrays kept in the cache
+MAX_ENTRIES = 256
+
+#: The maximum time (in seconds) a covering array is kept in the cache
+#: without being used
+MAX_AGE = 30 * 24 * 60 * 60
+
+
+def get_cache_dir():
+    """Returns the location of the cache files."""
+    return get_datafile_path("cache", CACHE_DIR_NAME)
+
+
+def get_cache_path(content, order, seed):
+    """Returns the location of the cache file for a given search.
+
+    :param content: the content of the parameter file
+    :type content: bytes
+    :param order: the order of combinations
+    :type order: int
+    :param seed: the seed of the search
+    :type seed: int
+    """
+    digest = hashlib.sha256(content)
+    digest.update(f"\0{order}\0{seed}".encode("utf-8"))
+    return os.path.join(get_cache_dir(), f"{digest.hexdigest()}.json")
+
+
+def _is_valid(covering_array, input_data):
+    if not isinstance(covering_array, list) or not covering_array:
+        return False
+    for row in covering_array:
+        if not isinstance(row, list) or len(row) != len(input_data):
+            return False
+        for value, size in zip(row, input_data):
+            if not isinstance(value, int) or not 0 <= value < size:
+                return False
+    return True
+
+
+def get_covering_array(content, order, seed, input_data):
+    """Returns the cached covering array of a parameter file.
+
+    :param content: the content of the parameter file
+    :type content: bytes
+    :param order: the order of combinations
+    :type order: int
+    :param seed: the seed of the search
+    :type seed: int
+    :param input_data: the number of values of each parameter
+    :type input_data: list of int
+    :returns: the covering array, as returned by
+              :meth:`avocado_varianter_cit.Cit.Cit.compute`, or None if
+              it's not cached
+    :rtype: list or None
+    """
+    cache_path = get_cache_path(content, order, seed)
+    data = cache.load(cache_path)
+    if data is None:
+        return None
+    covering_array = data.get("covering_array")
+    if not _is_valid(covering_array, input_data):
+        return None
+    cache.touch(cache_path)
+    return covering_array
+
+
+def set_covering_array(content, order, seed, parameters, covering_array):
+    """Saves the covering array of a parameter file in the cache.
+
+    Failures to write the cache are not fatal, as it only means the
+    covering array will be computed again.  Old arrays are removed with
+    :func:`prune` afterwards.
+
+    :param content: the content of the parameter file
+    :type content: bytes
+    :param order: the order of combinations
+    :type order: int
+    :param seed: the seed of the search
+    :type seed: int
+    :param parameters: the names of the parameters
+    :type parameters: list of str
+    :param covering_array: the covering array computed
+    :type covering_array: list
+    """
+    try:
+        cache.save(
+            get_cache_path(content, order, seed),
+            {
+                "parameters": parameters,
+                "order": order,
+                "seed": seed,
+                "covering_array": covering_array,
+            },
+        )
+    except OSError:
+        return
+    prune()
+
+
+def prune(max_entries=MAX_ENTRIES, max_age=MAX_AGE):
+    """Removes the covering arrays not used for a while from the cache.
+
+    :param max_entries: the maximum number of arrays kept, the least
+                        recently used ones beyond it being removed
+    :type max_entries: int
+    :param max_age: the maximum time (in seconds) an array is kept
+                    without being used
+    :type max_age: int
+    """
+    cache.prune(get_cache_dir(), max_entries, max_age)
+
+
+def get_entries():
+    """Returns the covering arrays in the cache.
+
+    :returns: the names of the parameters, the order of combinations,
+              the seed and the number of combinations of each array
+    :rtype: list of tuple
+    """
+    entries = []
+    for data in cache.iter_entries(get_cache_dir()):
+        try:
+            entries.append(
+                (
+                    list(data["parameters"]),
+                    data["order"],
+                    data["seed"],
+                    len(data["covering_array"]),
+                )
+            )
+        except (KeyError, TypeError):
+            continue
+    return sorted(entries)
+
+
+def clear():
+    """Removes all covering arrays from the cache."""
+    cache.clear(get_cache_dir())
@@ -16,14 +16,16 @@ import logging
 import os
 import sys
 
+from avocado_varianter_cit import cache
 from avocado_varianter_cit.Cit import LOG, Cit
 from avocado_varianter_cit.Parser import Parser
 
-from avocado.core import exit_codes, varianter
+from avocado.core import exit_codes, output, varianter
 from avocado.core.output import LOG_UI
-from avocado.core.plugin_interfaces import CLI, Varianter
+from avocado.core.plugin_interfaces import CLI, Cache, Varianter
 from avocado.core.settings import settings
 from avocado.core.tree import TreeNode
+from avocado.utils import astring
 
 #: The default order of combinations
 DEFAULT_ORDER_OF_COMBINATIONS = 2
@@ -67,6 +69,21 @@ class VarianterCitCLI(CLI):
                 long_arg="--cit-order-of-combinations",
             )
 
+            help_msg = (
+                "Seed of the search for combinations. The same seed "
+                "gives the same variants"
+            )
+            settings.register_option(
+                section=f"{name}.cit",
+                key="seed",
+                key_type=int,
+                parser=subparser,
+                help_msg=help_msg,
+                metavar="SEED",
+                default=None,
+                long_arg="--cit-seed",
+            )
+
     def run(self, config):
         if config.get("variants.debug"):
             LOG.setLevel(logging.DEBUG)
@@ -102,21 +119,29 @@ class VarianterCit(Varianter):
                 )
                 self.error_exit(config)
 
+        with open(cit_parameter_file, "rb") as parameter_file:
+            content = parameter_file.read()
         try:
-            parameters, constraints = Parser.parse(
-                open(cit_parameter_file, encoding="utf-8")
-            )
+            parameters, constraints = Parser.parse(content.decode("utf-8").splitlines())
         except ValueError as details:
             LOG_UI.error("Cannot parse parameter file: %s", details)
             self.error_exit(config)
 
         input_data = [len(parameter[1]) for parameter in parameters]
 
-        cit = Cit(input_data, order, constraints)
-        final_list = cit.compute()
         self.headers = [  # pylint: disable=W0201
             parameter[0] for parameter in parameters
         ]
+        seed = config.get(f"{subcommand}.cit.seed")
+        final_list = None
+        # without a seed, the search is not meant to be repeatable
+        if seed is not None:
+            final_list = cache.get_covering_array(content, order, seed, input_data)
+        if final_list is None:
+            cit = Cit(input_data, order, constraints, seed)
+            final_list = cit.compute()
+            if seed is not None:
+                cache.set_covering_array(content, order, seed, self.headers, final_list)
         results = [
             [parameters[j][1][final_list[i][j]] for j in range(len(final_list[i]))]
             for i in range(len(final_list))
@@ -174,3 +199,27 @@ class VarianterCit(Varianter):
                     varianter.variant_to_str(variant, variants - 1, kwargs, False)
                 )
         return "\n".join(out)
+
+
+class VarianterCitCache(Cache):
+
+    name = "cit"
+    description = "Provides the cache of the CIT covering arrays"
+
+    def list(self):
+        entries = [
+            [", ".join(parameters), str(order), str(seed), str(variants)]
+            for parameters, order, seed, variants in cache.get_entries()
+        ]
+        if not entries:
+            return ""
+        header = (
+            output.TERM_SUPPORT.header_str("Parameters"),
+            output.TERM_SUPPORT.header_str("Order"),
+            output.TERM_SUPPORT.header_str("Seed"),
+            output.TERM_SUPPORT.header_str("Variants"),
+        )
+        return astring.tabular_output(entries, header=header, strip=True) + "\n"
+
+    def clear(self):
+        cache.clear()
@@ -44,5 +44,8 @@ setup(
         "avocado.plugins.varianter": [
             "varianter_cit = avocado_varianter_cit.varianter_cit:VarianterCit",
         ],
+        "avocado.plugins.cache": [
+            "cit = avocado_varianter_cit.varianter_cit:VarianterCitCache",
+        ],
     },
 )
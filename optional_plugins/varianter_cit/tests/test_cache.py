@@ -0,0 +1,101 @@
+import os
+import time
+import unittest.mock
+
+from avocado_varianter_cit import cache
+from avocado_varianter_cit.varianter_cit import VarianterCit, VarianterCitCache
+
+from selftests.utils import TestCaseTmpDir
+
+CONTENT = b"""PARAMETERS
+color[red, green]
+shape[circle, square, triangle]
+"""
+
+
+PARAMETERS = ["color", "shape"]
+
+
+class Cache(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = os.path.join(self.tmpdir.name, "cache")
+        patcher = unittest.mock.patch(
+            "avocado_varianter_cit.cache.get_cache_dir", return_value=self.cache_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _initialize(self, seed):
+        parameter_file = os.path.join(self.tmpdir.name, "params.cit")
+        with open(parameter_file, "wb") as params:
+            params.write(CONTENT)
+        varianter = VarianterCit()
+        varianter.initialize(
+            {
+                "subcommand": "variants",
+                "variants.cit.combination_order": 2,
+                "variants.cit.parameter_file": parameter_file,
+                "variants.cit.seed": seed,
+            }
+        )
+        return varianter
+
+    def test_cached(self):
+        covering_array = [[0, 0], [0, 1], [1, 2]]
+        self.assertIsNone(cache.get_covering_array(CONTENT, 2, 1, [2, 3]))
+        cache.set_covering_array(CONTENT, 2, 1, PARAMETERS, covering_array)
+        self.assertEqual(
+            cache.get_covering_array(CONTENT, 2, 1, [2, 3]), covering_array
+        )
+
+    def test_key(self):
+        cache.set_covering_array(CONTENT, 2, 1, PARAMETERS, [[0, 0]])
+        self.assertIsNone(cache.get_covering_array(CONTENT, 1, 1, [2, 3]))
+        self.assertIsNone(cache.get_covering_array(CONTENT, 2, None, [2, 3]))
+        self.assertIsNone(cache.get_covering_array(CONTENT + b"#", 2, 1, [2, 3]))
+
+    def test_invalid(self):
+        cache.set_covering_array(CONTENT, 2, 1, PARAMETERS, [[0, 3]])
+        self.assertIsNone(cache.get_covering_array(CONTENT, 2, 1, [2, 3]))
+        with open(cache.get_cache_path(CONTENT, 2, 1), "w", encoding="utf-8") as f:
+            f.write("{")
+        self.assertIsNone(cache.get_covering_array(CONTENT, 2, 1, [2, 3]))
+
+    def test_prune(self):
+        cache.set_covering_array(CONTENT, 2, 1, PARAMETERS, [[0, 0]])
+        cache.set_covering_array(CONTENT, 2, 2, PARAMETERS, [[0, 1]])
+        old = time.time() - cache.MAX_AGE - 60
+        os.utime(cache.get_cache_path(CONTENT, 2, 1), (old, old))
+        cache.prune()
+        self.assertIsNone(cache.get_covering_array(CONTENT, 2, 1, [2, 3]))
+        self.assertEqual(cache.get_covering_array(CONTENT, 2, 2, [2, 3]), [[0, 1]])
+        cache.prune(max_entries=0)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_list_clear(self):
+        cache.set_covering_array(CONTENT, 2, 1, PARAMETERS, [[0, 0], [1, 2]])
+        self.assertEqual(cache.get_entries(), [(PARAMETERS, 2, 1, 2)])
+        plugin = VarianterCitCache()
+        self.assertIn("color, shape", plugin.list())
+        plugin.clear()
+        self.assertFalse(os.path.exists(self.cache_dir))
+        self.assertEqual(plugin.list(), "")
+
+    def test_seed(self):
+        variants = self._initialize(1).variants
+        self.assertEqual(len(cache.get_entries()), 1)
+        with unittest.mock.patch(
+            "avocado_varianter_cit.varianter_cit.Cit.compute"
+        ) as compute:
+            self.assertEqual(self._initialize(1).variants, variants)
+            compute.assert_not_called()
+
+    def test_no_seed(self):
+        self._initialize(None)
+        self.assertEqual(cache.get_entries(), [])
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
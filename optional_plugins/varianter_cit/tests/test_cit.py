@@ -22,6 +22,15 @@ class CitInitialization(unittest.TestCase):
             "The initialization of cit algorithm is wrong",
         )
 
+    def test_seed(self):
+        parameters = [3, 3, 3, 3]
+        constraints = {((0, 0), (2, 0)), ((0, 1), (1, 1), (2, 0)), ((0, 2), (3, 2))}
+        self.assertEqual(
+            Cit(parameters, 2, set(constraints), 42).compute(),
+            Cit(parameters, 2, set(constraints), 42).compute(),
+            "The same seed gives different solutions",
+        )
+
 
 class CitTests(unittest.TestCase):
     def setUp(self):
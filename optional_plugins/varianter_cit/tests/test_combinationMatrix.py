@@ -1,3 +1,4 @@
+import copy
 import unittest
 
 from avocado_varianter_cit.CombinationMatrix import CombinationMatrix
@@ -303,3 +304,37 @@ class CombinationMatrixTest(unittest.TestCase):
                 self.assertTrue(
                     combination_row_equals(value, self.excepted_hash_table[key])
                 )
+
+    def test_evaluate_combination(self):
+        # All combinations of first two parameters are covered, except (0, 2)
+        rows = [[0, 0, 0, 0]] + [
+            [first, second, 1, 3]
+            for first in range(3)
+            for second in range(3)
+            if (first, second) != (0, 2)
+        ]
+        for row in rows:
+            self.matrix.cover_solution_row(row)
+        for parameters, combination in (([1], [2]), ([0, 3], [1, 0])):
+            with self.subTest(parameters=parameters):
+                solution = rows[0][:]
+                for index, parameter in enumerate(parameters):
+                    solution[parameter] = combination[index]
+                excepted_matrix = copy.deepcopy(self.matrix)
+                excepted_matrix.uncover_combination(rows[0], parameters)
+                excepted_uncovered = excepted_matrix.cover_combination(
+                    solution, parameters
+                )
+                excepted_matrix.uncover_combination(solution, parameters)
+                excepted_matrix.cover_combination(rows[0], parameters)
+                self.assertEqual(
+                    excepted_uncovered,
+                    self.matrix.evaluate_combination(rows[0], solution, parameters),
+                    "Total uncovered number is wrong.",
+                )
+                self.assertEqual(excepted_matrix, self.matrix, "Coverage was change")
+                self.assertEqual(
+                    list(excepted_matrix.uncovered_rows),
+                    list(self.matrix.uncovered_rows),
+                    "Uncovered rows are in wrong order",
+                )
@@ -1,3 +1,4 @@
+import itertools
 import unittest
 
 from avocado_varianter_cit.Solver import Solver
@@ -170,6 +171,22 @@ class SolverTest(unittest.TestCase):
             "solver can not compute and simplify constraints",
         )
 
+    def test_get_possible_values(self):
+        """
+        Test that, the possible values looked up are the ones computed
+        """
+        parameters = [2, 3, 2]
+        constraints = {((0, 0), (1, 0)), ((0, 1), (2, 1)), ((1, 2), (2, 0)), ((2, 1),)}
+        solver = Solver(parameters, constraints)
+        rows = itertools.product(*[range(-1, size) for size in parameters])
+        for row in list(rows) * 2:
+            for parameter in range(len(parameters)):
+                with self.subTest(row=row, parameter=parameter):
+                    self.assertEqual(
+                        solver.get_possible_values(row, parameter),
+                        solver._compute_possible_values(row, parameter),
+                    )
+
 
 if __name__ == "__main__":
     unittest.main()
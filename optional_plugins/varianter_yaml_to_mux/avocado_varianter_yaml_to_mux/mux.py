@@ -71,11 +71,13 @@ class MuxTree:
         """
         Iterates through variants and process the internal filters
 
+        The filters are applied while the variants are being built, so the
+        variants which can't be valid are dropped as soon as they contain
+        the nodes which make them invalid.
+
         :yield valid variants
         """
-        for variant in self.iter_variants():
-            if self._valid_variant(variant):
-                yield variant
+        return _VariantBuilder(self).iter_variants()
 
     def iter_variants(self):
         """
@@ -139,6 +141,154 @@ class MuxTree:
         return True
 
 
+class _VariantBuilder:
+
+    """
+    Builds the valid variants of a MuxTree node by node, in the same order
+    as the product of its pools. Each node is checked against the internal
+    filters when it's added, so all the variants which would contain the
+    nodes chosen so far are skipped when those can't be a valid variant.
+    """
+
+    def __init__(self, mux_tree):
+        """
+        :param mux_tree: tree whose variants are built
+        """
+        self.mux_tree = mux_tree
+        # Path, parent path, filters and the deepest filter-only of the whole
+        # tree which may keep the node, by the id of the nodes
+        self._nodes = {}
+        # Parent path and level of the filters
+        self._filters = {}
+        self._all_filter_only = set()
+        self._has_filter_out = False
+        self._add_filters(mux_tree)
+
+    def _add_filters(self, mux_tree):
+        for pool in mux_tree.pools:
+            if isinstance(pool, list):
+                for child in pool:
+                    self._add_filters(child)
+            else:
+                self._all_filter_only.update(pool.environment.filter_only)
+                if pool.environment.filter_out:
+                    self._has_filter_out = True
+
+    def _get_filter(self, item):
+        info = self._filters.get(item)
+        if info is None:
+            info = self._filters[item] = (item.rsplit("/", 2)[0] + "/", item.count("/"))
+        return info
+
+    def _get_node(self, node):
+        info = self._nodes.get(id(node))
+        if info is None:
+            path = node.path + "/"
+            environment = node.environment
+            info = (
+                path,
+                path.rsplit("/", 2)[0] + "/",
+                frozenset(environment.filter_only),
+                frozenset(environment.filter_out),
+            )
+            info += (self._get_levels(info, self._all_filter_only)[0],)
+            self._nodes[id(node)] = info
+        return info
+
+    def _get_levels(self, info, filter_only):
+        """
+        :return: levels of the deepest filter-only which keeps the node and of
+                 the deepest one which removes it (0 when there's none)
+        """
+        keep = 0
+        remove = 0
+        for item in filter_only:
+            parent, level = self._get_filter(item)
+            if info[1].startswith(parent):
+                if info[0].startswith(item):
+                    keep = max(keep, level)
+                else:
+                    remove = max(remove, level)
+        return keep, remove
+
+    @staticmethod
+    def _is_filtered_out(info, filter_out):
+        for out in filter_out:
+            if info[0].startswith(out):
+                return True
+        return False
+
+    def iter_variants(self):
+        """
+        :yield valid variants of the tree
+        """
+        if not (self._all_filter_only or self._has_filter_out):
+            return self.mux_tree.iter_variants()
+        return self._iter_variants(
+            self._add_pools(self.mux_tree.pools, None), [], [], frozenset(), frozenset()
+        )
+
+    @staticmethod
+    def _add_pools(pools, pending):
+        """
+        :return: pending pools (as nested pairs of pool and the other pending
+                 pools) starting with the given pools
+        """
+        for pool in reversed(pools):
+            pending = (pool, pending)
+        return pending
+
+    def _iter_variants(self, pending, variant, infos, filter_only, filter_out):
+        if pending is None:
+            if filter_only:
+                for info in infos:
+                    keep, remove = self._get_levels(info, filter_only)
+                    if remove > keep:
+                        return
+            yield list(variant)
+            return
+        pool, pending = pending
+        if isinstance(pool, list):
+            for child in pool:
+                yield from self._iter_variants(
+                    self._add_pools(child.pools, pending),
+                    variant,
+                    infos,
+                    filter_only,
+                    filter_out,
+                )
+            return
+        info = self._get_node(pool)
+        new_filter_out = info[3] - filter_out
+        if new_filter_out:
+            filter_out = filter_out | new_filter_out
+            for other in infos:
+                if self._is_filtered_out(other, new_filter_out):
+                    return
+        if self._is_filtered_out(info, filter_out):
+            return
+        # Nodes removed by the filter-only of the nodes chosen so far, which
+        # can't be kept by any filter-only of the tree, make all variants
+        # invalid
+        new_filter_only = info[2] - filter_only
+        if new_filter_only:
+            filter_only = filter_only | new_filter_only
+            for other in infos:
+                if self._get_levels(other, new_filter_only)[1] > other[4]:
+                    return
+        if self._get_levels(info, filter_only)[1] > info[4]:
+            return
+        infos.append(info)
+        variant.append(pool)
+        try:
+            yield from self._iter_variants(
+                pending, variant, infos, filter_only, filter_out
+            )
+        finally:
+            variant.pop()
+            infos.pop()
+
+
 class MuxPlugin:
     """
     Base implementation of Mux-like Varianter plugin. It should be used as
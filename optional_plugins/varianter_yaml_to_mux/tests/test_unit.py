@@ -631,6 +631,28 @@ class TestInternalFilters(unittest.TestCase):
         # First we evaluate filter-out and then filter-only
         self.assertFalse(self.check_scenario(("foo", ["/foo"], ["/foo"])))
 
+    def test_variants(self):
+        # The filters are applied while the variants are built, which has to
+        # give the same variants as filtering all of them
+        root = mux.MuxTreeNode()
+        for name in ("1", "2", "3"):
+            domain = root.get_node(name, True)
+            domain.multiplex = True
+            for child in ("foo", "bar", "baz"):
+                domain.add_child(mux.MuxTreeNode(child))
+        root.get_node("/1/foo").filters = [["/2/foo", "/2/bar"], ["/3/baz"]]
+        root.get_node("/1/bar").filters = [["/3/foo"], []]
+        root.get_node("/2/baz").filters = [["/3"], ["/1/baz"]]
+        root.get_node("/3/bar").filters = [["/2/foo"], []]
+        tree = mux.MuxTree(root)
+        exp = [
+            variant
+            for variant in tree.iter_variants()
+            if mux.MuxTree._valid_variant(variant)  # pylint: disable=W0212
+        ]
+        self.assertEqual(len(exp), 11)
+        self.assertEqual(list(tree), exp)
+
 
 class TestPathParent(unittest.TestCase):
     def test_empty_string(self):
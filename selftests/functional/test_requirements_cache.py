@@ -1,7 +1,9 @@
 import os
+import sqlite3
 import unittest.mock
 
 from avocado.core.dependencies.requirements import cache
+from avocado.core.dependencies.requirements.cache.backends import sqlite
 from selftests.utils import TestCaseTmpDir
 
 ENTRIES = [
@@ -106,3 +108,65 @@ class Cache(TestCaseTmpDir):
                 ],
             }
             self.assertEqual(all_requirements, expected_data)
+
+    def test_update_requirement_status(self):
+        with unittest.mock.patch(
+            "avocado.core.dependencies.requirements.cache.backends.sqlite.CACHE_DATABASE_PATH",
+            os.path.join(self.tmpdir.name, "requirements.sqlite"),
+        ):
+            entry = ENTRIES[-1][:4]
+            cache.set_requirement(*entry, False)
+            self.assertIsNone(cache.is_requirement_in_cache(*entry))
+            cache.update_requirement_status(*entry, True)
+            self.assertTrue(cache.is_requirement_in_cache(*entry))
+            cache.delete_requirement(*entry)
+            self.assertFalse(cache.is_requirement_in_cache(*entry))
+
+    def test_changes_by_other_process(self):
+        path = os.path.join(self.tmpdir.name, "requirements.sqlite")
+        with unittest.mock.patch(
+            "avocado.core.dependencies.requirements.cache.backends.sqlite.CACHE_DATABASE_PATH",
+            path,
+        ):
+            entry = ENTRIES[-1][:4]
+            cache.set_requirement(*entry, False)
+            self.assertIsNone(cache.is_requirement_in_cache(*entry))
+            # requirements that are not saved are never taken from memory
+            with sqlite3.connect(path) as conn:
+                conn.execute("UPDATE requirement SET saved = 1")
+            self.assertTrue(cache.is_requirement_in_cache(*entry))
+            with sqlite3.connect(path) as conn:
+                mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            self.assertEqual(mode, "wal")
+
+    def test_saved_requirements_loaded_at_once(self):
+        path = os.path.join(self.tmpdir.name, "requirements.sqlite")
+        with unittest.mock.patch(
+            "avocado.core.dependencies.requirements.cache.backends.sqlite.CACHE_DATABASE_PATH",
+            path,
+        ):
+            for entry in ENTRIES:
+                cache.set_requirement(*entry)
+            sqlite.close()
+            self.assertTrue(cache.is_requirement_in_cache(*ENTRIES[0]))
+            database = sqlite._get_database()  # pylint: disable=W0212
+            self.assertEqual(
+                database.saved,
+                {ENTRIES[0], ENTRIES[1], ENTRIES[3]},
+            )
+
+    def test_delete_database(self):
+        path = os.path.join(self.tmpdir.name, "requirements.sqlite")
+        with unittest.mock.patch(
+            "avocado.core.dependencies.requirements.cache.backends.sqlite.CACHE_DATABASE_PATH",
+            path,
+        ):
+            cache.set_requirement(*ENTRIES[0])
+            sqlite.delete_database()
+            self.assertEqual(os.listdir(self.tmpdir.name), [])
+            self.assertFalse(cache.is_requirement_in_cache(*ENTRIES[0]))
+            self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+    def tearDown(self):
+        sqlite.close()
+        super().tearDown()
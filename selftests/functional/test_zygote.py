@@ -0,0 +1,102 @@
+import os
+import socket
+import subprocess
+import sys
+
+from avocado.core.job import Job
+from avocado.core.nrunner import zygote
+from avocado.utils import script
+from selftests.utils import BASEDIR, TestCaseTmpDir, skipUnlessPathExists
+
+SCRIPT_CONTENT = """#!/bin/bash
+/bin/sleep 30
+"""
+
+
+class Zygote(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.socket_path = os.path.join(self.tmpdir.name, "zygote.sock")
+        # pylint: disable=R1732
+        self.zygote = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "avocado.plugins.runners.noop",
+                "zygote",
+                self.socket_path,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        ready = zygote.decode(self.zygote.stdout.readline())
+        self.assertEqual(ready, zygote.READY_MESSAGE)
+
+    def _request(self, args):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.socket_path)
+            connection.sendall(zygote.encode({"args": args}))
+            with connection.makefile("rb") as replies:
+                return [zygote.decode(line) for line in replies]
+
+    def test_requests(self):
+        replies = self._request(["runnable-run", "-k", "noop"])
+        self.assertEqual(len(replies), 2)
+        self.assertNotEqual(replies[0]["pid"], self.zygote.pid)
+        self.assertEqual(replies[1], {"returncode": 0})
+        # an invalid command line makes the child exit like argparse does
+        replies = self._request(["no-such-command"])
+        self.assertEqual(replies[1], {"returncode": 2})
+
+    def tearDown(self):
+        self.zygote.stdin.close()
+        self.assertEqual(self.zygote.wait(10), 0)
+        self.zygote.stdout.close()
+        self.assertFalse(os.path.exists(self.socket_path))
+        super().tearDown()
+
+
+class ZygoteSpawner(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.script = script.TemporaryScript(
+            "sleep.sh", SCRIPT_CONTENT, "avocado_zygote_functional"
+        )
+        self.script.save()
+
+    def test_job(self):
+        config = {
+            "resolver.references": [
+                os.path.join(BASEDIR, "examples", "tests", "passtest.py"),
+                os.path.join(BASEDIR, "examples", "tests", "failtest.py"),
+            ],
+            "run.results_dir": self.tmpdir.name,
+            "spawner.process.zygote": True,
+        }
+
+        with Job.from_config(job_config=config) as job:
+            job.run()
+
+        self.assertEqual(1, job.result.passed)
+        self.assertEqual(1, job.result.failed)
+
+    @skipUnlessPathExists("/bin/sleep")
+    def test_timeout(self):
+        config = {
+            "resolver.references": [self.script.path],
+            "run.results_dir": self.tmpdir.name,
+            "task.timeout.running": 2,
+            "spawner.process.zygote": True,
+        }
+
+        with Job.from_config(job_config=config) as job:
+            job.run()
+
+        self.assertEqual(1, job.result.interrupted)
+        self.assertEqual(
+            "Test interrupted: Timeout reached", job.result.tests[0]["fail_reason"]
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        self.script.remove()
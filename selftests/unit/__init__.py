@@ -0,0 +1,8 @@
+import tempfile
+
+from avocado.core.settings import settings
+
+# keep the data written by the code under test, such as the tests found
+# on Python modules, out of the user's data directory
+DATA_DIR = tempfile.TemporaryDirectory(prefix="avocado_selftests_unit_data_")
+settings.update_option("datadir.paths.data_dir", DATA_DIR.name)
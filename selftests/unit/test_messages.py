@@ -0,0 +1,82 @@
+import os
+import unittest
+from unittest import mock
+
+from avocado.core import messages
+from avocado.utils import path as utils_path
+from selftests.utils import TestCaseTmpDir
+
+
+class FileHandlePool(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.task_paths = []
+        for name in ("task1", "task2"):
+            task_path = os.path.join(self.tmpdir.name, name)
+            os.mkdir(task_path)
+            self.task_paths.append(task_path)
+
+    def _read(self, task_path, filename):
+        with open(os.path.join(task_path, filename), "rb") as fp:
+            return fp.read()
+
+    def test_append(self):
+        pool = messages.FileHandlePool()
+        pool.write(self.task_paths[0], "stdout", b"foo\n")
+        pool.write(self.task_paths[0], "stdout", b"bar\n")
+        pool.close()
+        self.assertEqual(self._read(self.task_paths[0], "stdout"), b"foo\nbar\n")
+
+    def test_reuse_handle(self):
+        pool = messages.FileHandlePool()
+        with mock.patch("builtins.open", wraps=open) as mocked_open:
+            for _ in range(10):
+                pool.write(self.task_paths[0], "debug.log", b"line\n")
+        self.assertEqual(mocked_open.call_count, 1)
+        pool.close()
+        self.assertEqual(self._read(self.task_paths[0], "debug.log"), b"line\n" * 10)
+
+    def test_eviction(self):
+        pool = messages.FileHandlePool(max_size=2)
+        pool.write(self.task_paths[0], "a", b"1")
+        pool.write(self.task_paths[0], "b", b"1")
+        pool.write(self.task_paths[0], "a", b"2")
+        # "b" is the least recently used, so it gets evicted and flushed
+        pool.write(self.task_paths[0], "c", b"1")
+        self.assertEqual(self._read(self.task_paths[0], "b"), b"1")
+        pool.write(self.task_paths[0], "b", b"2")
+        pool.close()
+        self.assertEqual(self._read(self.task_paths[0], "a"), b"12")
+        self.assertEqual(self._read(self.task_paths[0], "b"), b"12")
+        self.assertEqual(self._read(self.task_paths[0], "c"), b"1")
+
+    def test_close_task(self):
+        pool = messages.FileHandlePool()
+        pool.write(self.task_paths[0], "stdout", b"foo")
+        pool.write(self.task_paths[1], "stdout", b"bar")
+        pool.close_task(self.task_paths[0])
+        self.assertEqual(self._read(self.task_paths[0], "stdout"), b"foo")
+        pool.write(self.task_paths[0], "stdout", b"baz")
+        pool.close()
+        self.assertEqual(self._read(self.task_paths[0], "stdout"), b"foobaz")
+        self.assertEqual(self._read(self.task_paths[1], "stdout"), b"bar")
+
+
+class RunningMessageHandler(TestCaseTmpDir):
+    def test_stdout(self):
+        task_path = os.path.join(self.tmpdir.name, "task")
+        utils_path.init_dir(task_path)
+        task = mock.Mock(metadata={"task_path": task_path})
+        pool = messages.FileHandlePool()
+        handler = messages.RunningMessageHandler(pool)
+        for line in (b"foo\n", b"bar"):
+            handler.process_message(
+                {"type": "stdout", "log": line, "encoding": "utf-8"}, task, None
+            )
+        pool.close()
+        with open(os.path.join(task_path, "stdout"), "rb") as fp:
+            self.assertEqual(fp.read(), b"foo\nbar\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,17 @@
 import os
+import socket
 import sys
 import tempfile
 import unittest.mock
 
 from avocado.core.nrunner.runnable import Runnable
-from avocado.core.nrunner.task import Task
+from avocado.core.nrunner.task import Task, TaskStatusService
+from avocado.core.status.utils import (
+    STATUS_PROTOCOL_FRAMED,
+    STATUS_PROTOCOL_FRAMED_PREAMBLE,
+    STATUS_PROTOCOL_JSON_LINES,
+    frame_encode,
+)
 from avocado.plugins.runners import tap as runner_tap
 from selftests.utils import skipUnlessPathExists, temp_dir_prefix
 
@@ -503,6 +510,23 @@ class PickRunner(unittest.TestCase):
     def test_pick_runner_command_empty(self):
         self.assertFalse(Runnable.pick_runner_command(self.kind, {}))
 
+    @skipUnlessPathExists("/bin/sh")
+    def test_runner_supports_command(self):
+        runner = [
+            "sh",
+            "-c",
+            'test $0 = capabilities && echo -n {\\"commands\\": [\\"zygote\\"]}',
+        ]
+        self.assertEqual(
+            Runnable.get_capabilities_from_runner_command(runner),
+            {"commands": ["zygote"]},
+        )
+        runnable = Runnable(self.kind, None)
+        known = {self.kind: runner}
+        self.assertTrue(runnable.runner_supports_command("zygote", known))
+        self.assertFalse(runnable.runner_supports_command("task-run", known))
+        self.assertFalse(runnable.runner_supports_command("zygote", {}))
+
 
 class TaskTest(unittest.TestCase):
     def test_default_category(self):
@@ -515,6 +539,48 @@ class TaskTest(unittest.TestCase):
         task = Task(runnable, "task_id", category="new_category")
         self.assertEqual(task.category, "new_category")
 
+    def test_command_args_status_protocol(self):
+        runnable = Runnable("noop", "noop_uri")
+        task = Task(runnable, "task_id", status_uris=["/tmp/sock"])
+        args = task.get_command_args()
+        self.assertNotIn("--status-protocol", args)
+        args = task.get_command_args(STATUS_PROTOCOL_JSON_LINES)
+        self.assertNotIn("--status-protocol", args)
+        args = task.get_command_args(STATUS_PROTOCOL_FRAMED)
+        self.assertEqual(args[-2:], ["--status-protocol", STATUS_PROTOCOL_FRAMED])
+
+    def test_status_service_protocol(self):
+        runnable = Runnable("noop", "noop_uri")
+        task = Task(
+            runnable,
+            "task_id",
+            status_uris=["/tmp/sock"],
+            status_protocol=STATUS_PROTOCOL_FRAMED,
+        )
+        self.assertEqual(task.status_services[0].protocol, STATUS_PROTOCOL_FRAMED)
+
+    def test_status_service_batch_timeout(self):
+        # a batched message is sent after a while, even if no other
+        # message is posted after it
+        message = {"status": "running", "type": "log", "log": b"foo", "time": 1.0}
+        expected = STATUS_PROTOCOL_FRAMED_PREAMBLE + frame_encode([message])
+        with tempfile.TemporaryDirectory(prefix=temp_dir_prefix(self)) as tmpdir:
+            path = os.path.join(tmpdir, "status.sock")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+                server.bind(path)
+                server.listen(1)
+                server.settimeout(5)
+                service = TaskStatusService(path, STATUS_PROTOCOL_FRAMED)
+                service.post(message)
+                connection, _ = server.accept()
+                with connection:
+                    connection.settimeout(5)
+                    data = b""
+                    while len(data) < len(expected):
+                        data += connection.recv(len(expected) - len(data))
+                    service.close()
+        self.assertEqual(data, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
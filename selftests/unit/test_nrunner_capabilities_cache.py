@@ -0,0 +1,80 @@
+import os
+import unittest.mock
+
+from avocado.core.nrunner import capabilities_cache
+from avocado.core.nrunner.runnable import Runnable
+from avocado.utils import script
+from selftests.utils import TestCaseTmpDir, skipUnlessPathExists
+
+RUNNER_CONTENT = """#!/bin/sh
+test "$1" = capabilities && echo '{"runnables": ["mykind"], "commands": []}'
+"""
+
+
+@skipUnlessPathExists("/bin/sh")
+class CapabilitiesCache(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.cache_path = os.path.join(self.tmpdir.name, "cache", "capabilities")
+        patcher = unittest.mock.patch(
+            "avocado.core.nrunner.capabilities_cache.get_cache_path",
+            return_value=self.cache_path,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.runner = script.make_script(
+            os.path.join(self.tmpdir.name, "avocado-runner-mykind"), RUNNER_CONTENT
+        )
+        self.capabilities = {"runnables": ["mykind"], "commands": []}
+
+    def test_set_get(self):
+        self.assertIsNone(capabilities_cache.get_capabilities([self.runner]))
+        capabilities_cache.set_capabilities([self.runner], self.capabilities)
+        self.assertEqual(
+            capabilities_cache.get_capabilities([self.runner]), self.capabilities
+        )
+
+    def test_invalidate_mtime(self):
+        capabilities_cache.set_capabilities([self.runner], self.capabilities)
+        stat = os.stat(self.runner)
+        os.utime(self.runner, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertIsNone(capabilities_cache.get_capabilities([self.runner]))
+
+    def test_invalidate_version(self):
+        capabilities_cache.set_capabilities([self.runner], self.capabilities)
+        with unittest.mock.patch("avocado.core.utils.cache.VERSION", "0.0"):
+            self.assertIsNone(capabilities_cache.get_capabilities([self.runner]))
+
+    def test_missing_executable(self):
+        runner = [os.path.join(self.tmpdir.name, "avocado-runner-missing")]
+        capabilities_cache.set_capabilities(runner, self.capabilities)
+        self.assertIsNone(capabilities_cache.get_capabilities(runner))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_probe_once(self):
+        self.assertEqual(
+            Runnable.get_capabilities_from_runner_command([self.runner]),
+            self.capabilities,
+        )
+        with unittest.mock.patch("subprocess.Popen") as popen:
+            self.assertEqual(
+                Runnable.get_capabilities_from_runner_command([self.runner]),
+                self.capabilities,
+            )
+        popen.assert_not_called()
+
+    def test_pick_runner_commands(self):
+        registry = {"otherkind": False}
+        runners = Runnable.pick_runner_commands(
+            ["mykind", "mykind", "yetanotherkind", "otherkind"], registry
+        )
+        self.assertEqual(
+            runners, {"mykind": None, "yetanotherkind": None, "otherkind": None}
+        )
+        self.assertEqual(
+            registry, {"mykind": False, "yetanotherkind": False, "otherkind": False}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -42,6 +42,32 @@ class Parameters(unittest.TestCase):
         # Note: Different origin of the same value, which should produce
         # a crash, are tested in yaml2mux selftest
 
+    def test_equal_leaves(self):
+        # leaves of different paths may compare equal (same name, value
+        # and children), but each one belongs to the path it matches
+        root = tree.TreeNode()
+        foo = root.get_node("/run/foo/leaf", True)
+        foo.parent.value = {"timeout": 1}
+        bar = root.get_node("/run/bar/leaf", True)
+        bar.parent.value = {"timeout": 2}
+        params = parameters.AvocadoParams([foo, bar], ["/run/bar/*", "/run/*"])
+        self.assertEqual(params.get("timeout"), 2)
+        self.assertEqual(params.get("timeout", "/run/foo/*"), 1)
+        self.assertEqual(params.get("timeout", "/run/bar/*"), 2)
+
+    def test_iteritems(self):
+        root = tree.TreeNode()
+        root.value = {"timeout": 1}
+        foo = root.get_node("/foo", True)
+        foo.value = {"foo": "yes"}
+        bar = root.get_node("/bar", True)
+        bar.value = {"timeout": 2}
+        params = parameters.AvocadoParams([foo, bar], ["/*"])
+        self.assertEqual(
+            list(params.iteritems()),
+            [("/", "timeout", 1), ("/foo", "foo", "yes"), ("/bar", "timeout", 2)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
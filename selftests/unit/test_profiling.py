@@ -0,0 +1,76 @@
+import unittest
+
+from avocado.core import profiling
+from avocado.core.resolver import ReferenceResolution, ReferenceResolutionResult
+
+
+class Profiling(unittest.TestCase):
+    def test_not_recording(self):
+        with profiling.measure(profiling.STAGE_PARSE):
+            pass
+        with profiling.record_profile() as profile:
+            pass
+        self.assertEqual(profile.stages, {})
+
+    def test_measure(self):
+        with profiling.record_profile() as profile:
+            for _ in range(3):
+                with profiling.measure(profiling.STAGE_PARSE):
+                    pass
+        self.assertEqual(list(profile.stages), [profiling.STAGE_PARSE])
+        self.assertEqual(profile.stages[profiling.STAGE_PARSE][0], 3)
+        self.assertGreaterEqual(profile.stages[profiling.STAGE_PARSE][1], 0)
+
+    def test_measure_recursive(self):
+        with profiling.record_profile() as profile:
+            with profiling.measure(profiling.STAGE_INHERITANCE):
+                with profiling.measure(profiling.STAGE_INHERITANCE):
+                    with profiling.measure(profiling.STAGE_PARSE):
+                        pass
+        self.assertEqual(profile.stages[profiling.STAGE_INHERITANCE][0], 1)
+        self.assertEqual(profile.stages[profiling.STAGE_PARSE][0], 1)
+
+    def test_nested(self):
+        with profiling.record_profile() as outer:
+            with profiling.record_profile() as inner:
+                with profiling.measure(profiling.STAGE_PARSE):
+                    pass
+        self.assertEqual(inner.stages[profiling.STAGE_PARSE][0], 1)
+        self.assertEqual(outer.stages[profiling.STAGE_PARSE][0], 1)
+
+    def test_resolutions(self):
+        resolutions = [
+            ReferenceResolution(
+                "a", ReferenceResolutionResult.NOTFOUND, origin="x", duration=1.0
+            ),
+            ReferenceResolution(
+                "a", ReferenceResolutionResult.SUCCESS, origin="y", duration=2.0
+            ),
+            ReferenceResolution(
+                "b", ReferenceResolutionResult.NOTFOUND, origin="x", duration=0.5
+            ),
+            ReferenceResolution("c", ReferenceResolutionResult.SUCCESS, origin="z"),
+        ]
+        profile = profiling.Profile()
+        profile.add_resolutions(resolutions)
+        self.assertEqual(profile.resolvers, {"x": [2, 1.5], "y": [1, 2.0]})
+        self.assertEqual(profile.get_slowest_references(), [("a", 3.0), ("b", 0.5)])
+        self.assertEqual(profile.get_slowest_references(1), [("a", 3.0)])
+        self.assertEqual(
+            profile.to_dict(),
+            {
+                "stages": [],
+                "resolvers": [
+                    {"resolver": "x", "references": 2, "duration": 1.5},
+                    {"resolver": "y", "references": 1, "duration": 2.0},
+                ],
+                "references": [
+                    {"reference": "a", "duration": 3.0},
+                    {"reference": "b", "duration": 0.5},
+                ],
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
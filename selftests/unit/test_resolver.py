@@ -1,9 +1,12 @@
 import os
 import stat
 import unittest.mock
+from concurrent.futures import ProcessPoolExecutor
 
-from avocado.core import resolver
-from avocado.utils import script
+from avocado.core import exceptions, resolver
+from avocado.plugins import resolvers
+from avocado.utils import inotify, script
+from selftests.utils import TestCaseTmpDir
 
 #: What is commonly known as "0664" or "u=rw,g=rw,o=r"
 DEFAULT_NON_EXEC_MODE = (
@@ -309,3 +312,288 @@ class Resolver(unittest.TestCase):
             "selftests/.data/safeloader/data/double_import.py:Test4.test4",
         ]
         self._check(exps, result[0].resolutions)
+
+    def test_parallel(self):
+        references = [
+            os.path.join("selftests", ".data", "safeloader", "data", name)
+            for name in ("dont_crash.py", "imports.py", "double_import.py")
+        ]
+        references.extend(["/bin/true", "/does/not/exist", references[0]])
+        serial = resolver.resolve(references)
+        with unittest.mock.patch(
+            "avocado.core.resolver.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as executor:
+            parallel = resolver.resolve(references, config={"resolver.parallel": 2})
+        executor.assert_called_once()
+        self.assertEqual(len(serial), len(parallel))
+        for expected, result in zip(serial, parallel):
+            self.assertEqual(expected.reference, result.reference)
+            self.assertIs(expected.result, result.result)
+            self.assertEqual(expected.origin, result.origin)
+            self.assertEqual(
+                [_.uri for _ in expected.resolutions],
+                [_.uri for _ in result.resolutions],
+            )
+
+    def test_parallel_fallback(self):
+        references = [
+            os.path.join("selftests", ".data", "safeloader", "data", "imports.py"),
+            "/does/not/exist",
+        ]
+        serial = resolver.resolve(references)
+        for error in (
+            AttributeError("Can't pickle local object"),
+            TypeError("cannot pickle '_thread.lock' object"),
+        ):
+            with self.subTest(error=error):
+                with unittest.mock.patch(
+                    "avocado.core.resolver.ProcessPoolExecutor"
+                ) as executor:
+                    pool = executor.return_value.__enter__.return_value
+                    pool.map.side_effect = error
+                    with self.assertLogs("avocado.core.resolver", "WARNING"):
+                        parallel = resolver.resolve(
+                            references, config={"resolver.parallel": 2}
+                        )
+                self.assertEqual(
+                    [(_.reference, _.result) for _ in serial],
+                    [(_.reference, _.result) for _ in parallel],
+                )
+
+    def test_missing(self):
+        directory = os.path.join("selftests", ".data", "safeloader", "data")
+        found = os.path.join(directory, "imports.py")
+        missing = "/does/not/exist"
+        with self.assertRaises(
+            exceptions.JobTestSuiteReferenceResolutionError
+        ) as context:
+            resolver.resolve([found, missing, directory], ignore_missing=False)
+        self.assertEqual(
+            str(context.exception), f"Could not resolve references: {missing}"
+        )
+        self.assertEqual(list(context.exception.diagnostics), [missing])
+        diagnostics = context.exception.diagnostics[missing]
+        self.assertTrue(diagnostics)
+        for diagnostic in diagnostics:
+            self.assertEqual(diagnostic["reference"], missing)
+            self.assertEqual(diagnostic["result"], "NOTFOUND")
+            self.assertIsInstance(diagnostic["origin"], str)
+            self.assertIsInstance(diagnostic["info"], str)
+            self.assertGreaterEqual(diagnostic["duration"], 0)
+
+
+BASE_TEST = """from avocado import Test
+class BaseTest(Test):
+    def test_base(self):
+        pass
+"""
+
+CHILD_TEST = """from base_test import BaseTest
+class ChildTest(BaseTest):
+    def test_child(self):
+        pass
+"""
+
+
+class DirectoryExpansion(TestCaseTmpDir):
+    def _touch(self, name, content="", mode=None):
+        path = os.path.join(self.tmpdir.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as new_file:
+            new_file.write(content)
+        if mode is not None:
+            os.chmod(path, mode)
+        return path
+
+    def _expanded(self):
+        return [
+            os.path.relpath(path, self.tmpdir.name)
+            for path in resolver._extend_directory(self.tmpdir.name)
+        ]
+
+    def test_order(self):
+        for name in ("b/z.py", "b/a.py", "a/b/c.py", "z.py", "a.py", ".hidden.py"):
+            self._touch(name)
+        os.symlink(os.path.join(self.tmpdir.name, "a"), self._touch("c") + "-link")
+        expected = []
+        for dirpath, dirs, filenames in os.walk(self.tmpdir.name):
+            dirs.sort()
+            expected.extend(
+                os.path.relpath(os.path.join(dirpath, name), self.tmpdir.name)
+                for name in sorted(filenames)
+                if not name.startswith(".")
+            )
+        self.assertEqual(self._expanded(), expected)
+
+    def test_ignore(self):
+        for name in (
+            "test.py",
+            "test.pyc",
+            "build/test.py",
+            "src/build/test.py",
+            "src/data/test.py",
+            "src/keep.pyc",
+            "src/sub/data/test.py",
+            "deep/a/b/generated.py",
+        ):
+            self._touch(name)
+        self._touch(
+            resolver.IGNORE_FILE_NAME,
+            "# comment\n*.pyc\nbuild/\n/src/data\ndeep/**/generated.py\n",
+        )
+        self._touch(os.path.join("src", resolver.IGNORE_FILE_NAME), "!keep.pyc\n")
+        self.assertEqual(
+            self._expanded(),
+            ["test.py", "src/keep.pyc", "src/sub/data/test.py"],
+        )
+
+    def test_precheck(self):
+        filters = [
+            resolver.ReferenceFilter(),
+            resolver.ReferenceFilter(
+                suffix=None, access_check=os.R_OK | os.X_OK, access_name="executable"
+            ),
+            resolver.ReferenceFilter(suffix=None, shebang="#!/bin/sh"),
+        ]
+        self._touch("test.py", "#!/bin/sh\n")
+        self._touch("test.sh", "#!/bin/bash\n", mode=0o755)
+        os.mkdir(os.path.join(self.tmpdir.name, "dir.py"))
+        with os.scandir(self.tmpdir.name) as iterator:
+            entries = list(iterator)
+        for entry in entries:
+            for reference_filter in filters:
+                expected = reference_filter.check_file(entry.path, entry.path)
+                result = reference_filter.precheck(entry.path, entry)
+                if expected is True:
+                    self.assertIs(result, True)
+                elif result is not True:
+                    self.assertIs(result.result, expected.result)
+                    self.assertEqual(result.info, expected.info)
+
+    def test_resolve(self):
+        self._touch("test.txt")
+        test = self._touch("test.py", BASE_TEST)
+        with unittest.mock.patch(
+            "avocado.plugins.resolvers.python_resolver",
+            wraps=resolvers.python_resolver,
+        ) as python_resolver:
+            resolutions = resolver.resolve([self.tmpdir.name])
+        # only on the Python file, found by the first Python resolver
+        self.assertEqual(
+            [call.args[1] for call in python_resolver.call_args_list], [test]
+        )
+        self.assertEqual(
+            [(_.reference, _.result) for _ in resolutions if _.reference == test],
+            [(test, resolver.ReferenceResolutionResult.SUCCESS)],
+        )
+        self.assertEqual(
+            {_.info for _ in resolutions if _.reference != test},
+            {
+                f'File "{self.tmpdir.name}/test.txt" does not end with ".py"',
+                f'File "{self.tmpdir.name}/test.txt" does not exist or is not '
+                "executable",
+            },
+        )
+
+
+class IncrementalResolver(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.directory = os.path.join(self.tmpdir.name, "tests")
+        os.mkdir(self.directory)
+        self.base = self._write("base_test.py", BASE_TEST)
+        self.child = self._write("child_test.py", CHILD_TEST)
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as test_file:
+            test_file.write(content)
+        return path
+
+    @staticmethod
+    def _uris(resolutions):
+        return [
+            runnable.uri
+            for resolution in resolutions
+            if resolution.result == resolver.ReferenceResolutionResult.SUCCESS
+            for runnable in resolution.resolutions
+        ]
+
+    def test_same_as_resolve(self):
+        self._write("sub/test.py", BASE_TEST)
+        self._write("sub/.hidden.py", BASE_TEST)
+        self._write("a/test.py", BASE_TEST)
+        self._write("z_test.py", BASE_TEST)
+        references = [self.directory, "/bin/true"]
+        incremental = resolver.IncrementalResolver(references)
+        self.assertEqual(
+            [_.reference for _ in incremental.resolve()],
+            [_.reference for _ in resolver.resolve(references)],
+        )
+
+    def test_update(self):
+        incremental = resolver.IncrementalResolver([self.directory])
+        self.assertEqual(
+            self._uris(incremental.resolve()),
+            [
+                f"{self.base}:BaseTest.test_base",
+                f"{self.child}:ChildTest.test_child",
+                f"{self.child}:ChildTest.test_base",
+            ],
+        )
+        with unittest.mock.patch.object(
+            incremental._resolver, "resolve", wraps=incremental._resolver.resolve
+        ) as resolve:
+            self.assertEqual(incremental.update([self.child + ".orig"]), set())
+            incremental.resolve()
+            resolve.assert_not_called()
+
+            # the parent class module changing affects its child
+            self._write("base_test.py", BASE_TEST.replace("test_base", "test_new"))
+            self.assertEqual(incremental.update([self.base]), {self.base})
+            self.assertEqual(
+                self._uris(incremental.resolve()),
+                [
+                    f"{self.base}:BaseTest.test_new",
+                    f"{self.child}:ChildTest.test_child",
+                    f"{self.child}:ChildTest.test_new",
+                ],
+            )
+            self.assertEqual(resolve.call_count, 2)
+
+        other = self._write("other/test.py", BASE_TEST)
+        os.unlink(self.child)
+        incremental.update([os.path.dirname(other), self.child])
+        self.assertEqual(
+            self._uris(incremental.resolve()),
+            [f"{self.base}:BaseTest.test_new", f"{other}:BaseTest.test_base"],
+        )
+
+    def test_update_ignored(self):
+        incremental = resolver.IncrementalResolver([self.directory])
+        incremental.resolve()
+        ignore_file = self._write(resolver.IGNORE_FILE_NAME, "other/\n")
+        self.assertEqual(incremental.update([ignore_file]), set())
+        other = self._write("other/test.py", BASE_TEST)
+        self.assertEqual(incremental.update([os.path.dirname(other)]), set())
+        self._write(resolver.IGNORE_FILE_NAME, "child_test.py\n")
+        self.assertEqual(incremental.update([ignore_file]), {ignore_file})
+        self.assertEqual(
+            self._uris(incremental.resolve()),
+            [f"{self.base}:BaseTest.test_base", f"{other}:BaseTest.test_base"],
+        )
+
+    @unittest.skipUnless(inotify.is_supported(), "inotify is not supported")
+    def test_wait(self):
+        incremental = resolver.IncrementalResolver([self.directory], watch=True)
+        self.addCleanup(incremental.close)
+        incremental.resolve()
+        self.assertEqual(incremental.wait(0), [])
+        other = self._write("other/test.py", BASE_TEST)
+        self.assertEqual(incremental.wait(5), [os.path.dirname(other)])
+        self._write("other/.test.py.swp", "")
+        self.assertEqual(incremental.wait(0.5), [])
+        os.unlink(other)
+        self.assertEqual(incremental.wait(5), [other])
+        self.assertEqual(len(self._uris(incremental.resolve())), 3)
@@ -0,0 +1,179 @@
+import os
+import sys
+import time
+import unittest.mock
+
+from avocado.core.safeloader import cache, find_avocado_tests, find_python_unittests
+from avocado.core.safeloader.core import clear_caches
+from avocado.plugins import safeloader_cache
+from selftests.utils import TestCaseTmpDir
+
+BASE = """from avocado import Test
+
+class Base(Test):
+    def test_base(self):
+        pass
+"""
+
+BASE_CHANGED = """from avocado import Test
+
+class Base(Test):
+    def test_base(self):
+        pass
+
+    def test_base_changed(self):
+        pass
+"""
+
+CHILD = """from base import Base
+
+class Child(Base):
+    '''
+    :avocado: tags=fast,arch:x86_64
+    '''
+    def test_child(self):
+        pass
+
+class Disabled(Base):
+    '''
+    :avocado: disable
+    '''
+"""
+
+
+class SafeloaderCache(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = os.path.join(self.tmpdir.name, "cache")
+        patcher = unittest.mock.patch(
+            "avocado.core.safeloader.cache.get_cache_dir", return_value=self.cache_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # as if on a new process
+        clear_caches()
+        self.addCleanup(clear_caches)
+        self.base = self._write("base.py", BASE)
+        self.child = self._write("child.py", CHILD)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as module:
+            module.write(content)
+        return path
+
+    def test_cached(self):
+        found = find_avocado_tests(self.child)
+        self.assertEqual(
+            found[0]["Child"],
+            [
+                ("test_child", {"fast": None, "arch": {"x86_64"}}, []),
+                ("test_base", {}, []),
+            ],
+        )
+        self.assertEqual(found[1], {"Disabled"})
+        with unittest.mock.patch(
+            "avocado.core.safeloader.core.PythonModule", side_effect=AssertionError
+        ):
+            self.assertEqual(find_avocado_tests(self.child), found)
+
+    def test_parent_changed(self):
+        find_avocado_tests(self.child)
+        self._write("base.py", BASE_CHANGED)
+        found, _ = find_avocado_tests(self.child)
+        self.assertEqual(
+            [name for name, _, _ in found["Child"]],
+            ["test_child", "test_base", "test_base_changed"],
+        )
+
+    def test_targets(self):
+        find_avocado_tests(self.child)
+        find_python_unittests(self.child)
+        self.assertIsNotNone(cache.get_tests(self.child, "avocado.Test"))
+        self.assertIsNotNone(cache.get_tests(self.child, "unittest.TestCase"))
+
+    def test_invalidate_version(self):
+        find_avocado_tests(self.child)
+        self.assertIsNotNone(cache.get_tests(self.child, "avocado.Test"))
+        with unittest.mock.patch("avocado.core.utils.cache.VERSION", "0.0"):
+            self.assertIsNone(cache.get_tests(self.child, "avocado.Test"))
+
+    def test_sys_path(self):
+        find_avocado_tests(self.child)
+        # the same modules are still found
+        with unittest.mock.patch("sys.path", sys.path + [self.tmpdir.name]):
+            self.assertIsNotNone(cache.get_tests(self.child, "avocado.Test"))
+
+    def test_invalidate_lookup(self):
+        lib1 = os.path.join(self.tmpdir.name, "lib1")
+        lib2 = os.path.join(self.tmpdir.name, "lib2")
+        child = self._write(os.path.join("tests", "child.py"), CHILD)
+        self._write(os.path.join("lib2", "base.py"), BASE)
+        with unittest.mock.patch("sys.path", [lib1, lib2] + sys.path):
+            find_avocado_tests(child)
+            self.assertIsNotNone(cache.get_tests(child, "avocado.Test"))
+            # a parent module that shadows the one found before
+            self._write(os.path.join("lib1", "base.py"), BASE_CHANGED)
+            # as if on a new process, that doesn't know lib1 didn't exist
+            clear_caches()
+            sys.path_importer_cache.pop(lib1, None)
+            self.assertIsNone(cache.get_tests(child, "avocado.Test"))
+            found, _ = find_avocado_tests(child)
+        self.assertEqual(
+            [name for name, _, _ in found["Child"]],
+            ["test_child", "test_base", "test_base_changed"],
+        )
+
+    def test_no_cache(self):
+        found = find_avocado_tests(self.child, use_cache=False)
+        self.assertIn("Child", found[0])
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_prune(self):
+        find_avocado_tests(self.child)
+        find_avocado_tests(self.base)
+        entries = sorted(os.listdir(self.cache_dir))
+        self.assertEqual(len(entries), 2)
+        old = time.time() - cache.MAX_AGE - 60
+        os.utime(cache.get_cache_path(self.base), (old, old))
+        cache.prune()
+        self.assertEqual(
+            os.listdir(self.cache_dir),
+            [os.path.basename(cache.get_cache_path(self.child))],
+        )
+        cache.prune(max_entries=0)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_list_clear(self):
+        find_avocado_tests(self.child)
+        find_python_unittests(self.child)
+        find_avocado_tests(self.base)
+        self.assertEqual(
+            cache.get_entries(),
+            [
+                (self.base, ["avocado.Test"]),
+                (self.child, ["avocado.Test", "unittest.TestCase"]),
+            ],
+        )
+        plugin = safeloader_cache.SafeloaderCache()
+        self.assertIn(self.child, plugin.list())
+        plugin.clear()
+        self.assertFalse(os.path.exists(self.cache_dir))
+        self.assertEqual(plugin.list(), "")
+
+    def test_dependencies(self):
+        find_avocado_tests(self.child)
+        with cache.record_dependencies() as dependencies:
+            # one from the cache, and one found now
+            find_avocado_tests(self.child)
+            find_python_unittests(self.child)
+        self.assertEqual(dependencies.paths[:2], [self.child, self.base])
+        self.assertIn(
+            ((("base", ""),), os.path.dirname(self.child)), dependencies.lookups
+        )
+        with cache.record_dependencies() as dependencies:
+            cache.add_dependency(self.child)
+            cache.add_dependency(self.base)
+            cache.add_dependency(self.child)
+        self.assertEqual(dependencies.paths, [self.child, self.base])
@@ -4,6 +4,7 @@ import unittest
 import unittest.mock
 from collections import OrderedDict
 
+from avocado.core.safeloader import core
 from avocado.core.safeloader.core import find_avocado_tests, find_python_unittests
 from avocado.utils import script
 from selftests.utils import TestCaseTmpDir, setup_avocado_loggers
@@ -153,6 +154,31 @@ class BaseL2(BaseL0):
 """
 
 
+SHARED_BASE = """from avocado import Test
+class SharedBase(Test):
+    def test_shared(self):
+        pass
+"""
+
+SHARED_BASE_CHILD = """from shared_base import SharedBase
+class CHILD_NAME(SharedBase):
+    def test_child(self):
+        pass
+"""
+
+CYCLE_A = """import cycle_b
+class A(cycle_b.B):
+    def test_a(self):
+        pass
+"""
+
+CYCLE_B = """import cycle_a
+class B(cycle_a.A):
+    def test_b(self):
+        pass
+"""
+
+
 def get_this_file():
     this_file = __file__
     if this_file.endswith(".py"):
@@ -196,6 +222,12 @@ class FindClassAndMethods(UnlimitedDiff):
                     ("test_relative_level0_from_level2", {}, []),
                     ("test_non_relative_level0_from_level2", {}, []),
                 ],
+                "ExaminedClasses": [
+                    ("test_shared_base_examined_once", {}, []),
+                    ("test_shared_base_changed", {}, []),
+                    ("test_results_not_shared", {}, []),
+                    ("test_cycle", {}, []),
+                ],
             }
         )
         found = find_python_unittests(get_this_file())
@@ -358,5 +390,84 @@ class MultiLevel(TestCaseTmpDir):
             )
 
 
+class ExaminedClasses(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        core.clear_caches()
+        self.addCleanup(core.clear_caches)
+        patcher = unittest.mock.patch("sys.path", sys.path + [self.tmpdir.name])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8") as module:
+            module.write(content)
+        return path
+
+    @staticmethod
+    def _find(path):
+        return core.find_python_tests(
+            "avocado", "Test", core._determine_match_python, path
+        )[0]
+
+    def test_shared_base_examined_once(self):
+        base = self._write("shared_base.py", SHARED_BASE)
+        children = [
+            self._write(
+                f"child{index}.py",
+                SHARED_BASE_CHILD.replace("CHILD_NAME", f"Child{index}"),
+            )
+            for index in range(3)
+        ]
+        with unittest.mock.patch(
+            "avocado.core.safeloader.core.PythonModule", wraps=core.PythonModule
+        ) as python_module:
+            examined = []
+            for index, child in enumerate(children):
+                self.assertEqual(
+                    self._find(child),
+                    {
+                        f"Child{index}": [
+                            ("test_child", {}, []),
+                            ("test_shared", {}, []),
+                        ]
+                    },
+                )
+                paths = [call.args[0] for call in python_module.call_args_list]
+                examined.append(paths.count(base))
+        # only examined for the first child
+        self.assertGreater(examined[0], 0)
+        self.assertEqual(examined, examined[:1] * 3)
+
+    def test_shared_base_changed(self):
+        self._write("shared_base.py", SHARED_BASE)
+        child = self._write(
+            "child.py", SHARED_BASE_CHILD.replace("CHILD_NAME", "Child")
+        )
+        self._find(child)
+        self._write(
+            "shared_base.py", SHARED_BASE + "    def test_new(self):\n        pass\n"
+        )
+        self.assertEqual(
+            [name for name, _, _ in self._find(child)["Child"]],
+            ["test_child", "test_shared", "test_new"],
+        )
+
+    def test_results_not_shared(self):
+        self._write("shared_base.py", SHARED_BASE)
+        child = self._write(
+            "child.py", SHARED_BASE_CHILD.replace("CHILD_NAME", "Child")
+        )
+        self._find(child)["Child"][1][1]["changed"] = None
+        self.assertEqual(self._find(child)["Child"][1], ("test_shared", {}, []))
+
+    def test_cycle(self):
+        path = self._write("cycle_a.py", CYCLE_A)
+        self._write("cycle_b.py", CYCLE_B)
+        self.assertEqual(self._find(path), {})
+        self.assertEqual(core._EXAMINED_CLASSES, {})
+
+
 if __name__ == "__main__":
     unittest.main()
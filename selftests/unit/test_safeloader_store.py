@@ -0,0 +1,82 @@
+import os
+import unittest.mock
+
+from avocado.core.safeloader import core, store
+from avocado.core.safeloader.module import PythonModule
+from selftests.utils import TestCaseTmpDir
+
+MODULE = """import os
+from avocado import Test as AvocadoTest
+
+class Base(AvocadoTest):
+    def test_base(self):
+        pass
+
+class Child(Base):
+    def test_child(self):
+        pass
+"""
+
+
+class ModuleStore(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.store = store.ModuleStore(size=2)
+        patcher = unittest.mock.patch("avocado.core.safeloader.store.STORE", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = self._write("module.py", MODULE)
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8") as module:
+            module.write(content)
+        return path
+
+    def test_parsed_once(self):
+        parsed = store.get_parsed_module(self.path)
+        self.assertIs(PythonModule(self.path).mod, parsed.tree)
+        self.assertIs(PythonModule(self.path, "unittest", "TestCase").mod, parsed.tree)
+        self.assertEqual(len(self.store), 1)
+
+    def test_changed(self):
+        parsed = store.get_parsed_module(self.path)
+        self._write("module.py", MODULE + "\n# changed\n")
+        self.assertIsNot(store.get_parsed_module(self.path), parsed)
+
+    def test_evicted(self):
+        parsed = store.get_parsed_module(self.path)
+        store.get_parsed_module(self._write("other1.py", ""))
+        self.assertIs(store.get_parsed_module(self.path), parsed)
+        store.get_parsed_module(self._write("other2.py", ""))
+        store.get_parsed_module(self._write("other3.py", ""))
+        self.assertEqual(len(self.store), 2)
+        self.assertIsNot(store.get_parsed_module(self.path), parsed)
+        store.clear()
+        self.assertEqual(len(self.store), 0)
+
+    def test_imported_symbols(self):
+        first = PythonModule(self.path)
+        list(first.iter_classes())
+        second = PythonModule(self.path, "unittest", "TestCase")
+        list(second.iter_classes())
+        self.assertIs(first.imported_symbols["os"], second.imported_symbols["os"])
+        self.assertEqual(first.imported_symbols["AvocadoTest"].symbol, "Test")
+        self.assertEqual(first.klass_imports, {"AvocadoTest"})
+        self.assertEqual(second.klass_imports, set())
+
+    def test_find_tests_reuses_tree(self):
+        expected = {
+            "Base": [("test_base", {}, [])],
+            "Child": [("test_child", {}, []), ("test_base", {}, [])],
+        }
+        with unittest.mock.patch(
+            "avocado.core.safeloader.store.ParsedModule", wraps=store.ParsedModule
+        ) as parsed_module:
+            for _ in range(2):
+                found, _ = core.find_python_tests(
+                    "avocado", "Test", core._determine_match_python, self.path
+                )
+                self.assertEqual(found, expected)
+        parsed_paths = [call.args[0] for call in parsed_module.call_args_list]
+        self.assertEqual(parsed_paths.count(self.path), 1)
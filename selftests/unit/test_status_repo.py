@@ -1,3 +1,4 @@
+import asyncio
 from unittest import TestCase
 
 from avocado.core.status import repo, utils
@@ -211,3 +212,53 @@ class StatusRepo(TestCase):
         )
         with self.assertRaises(IndexError):
             self.status_repo.status_journal_summary_pop()
+
+    def test_wait_task_finished(self):
+        async def wait_and_finish():
+            waiter = asyncio.ensure_future(self.status_repo.wait_task_finished("1-foo"))
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+            self.status_repo.process_message(
+                {
+                    "id": "1-foo",
+                    "status": "finished",
+                    "time": 1000000004.0,
+                    "result": "pass",
+                    "job_id": "0000000000000000000000000000000000000000",
+                }
+            )
+            return await asyncio.wait_for(waiter, 1)
+
+        loop = asyncio.new_event_loop()
+        try:
+            data = loop.run_until_complete(wait_and_finish())
+            self.assertEqual(data["result"], "pass")
+            # once finished, there's no waiting at all
+            data = loop.run_until_complete(self.status_repo.wait_task_finished("1-foo"))
+            self.assertEqual(data["result"], "pass")
+        finally:
+            loop.close()
+
+    def test_journal_summary_get(self):
+        async def get_and_join():
+            self.status_repo.process_message(
+                {
+                    "id": "1-foo",
+                    "status": "running",
+                    "time": 1000000003.0,
+                    "job_id": "0000000000000000000000000000000000000000",
+                }
+            )
+            entry = await self.status_repo.status_journal_summary_get()
+            self.status_repo.status_journal_summary_done()
+            await asyncio.wait_for(self.status_repo.status_journal_summary_join(), 1)
+            return entry
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(
+                loop.run_until_complete(get_and_join()),
+                (1000000003.0, "1-foo", "running", 0),
+            )
+        finally:
+            loop.close()
@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+
+from avocado.core.nrunner.task import json_dumps
+from avocado.core.status import repo, server, utils
+
+JOB_ID = "0000000000000000000000000000000000000000"
+
+
+class StatusServer(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.status_repo = repo.StatusRepo(JOB_ID)
+        self.status_server = server.StatusServer("/dev/null", self.status_repo)
+        self.messages = [
+            {
+                "id": "1-foo",
+                "job_id": JOB_ID,
+                "status": "started",
+                "output_dir": "/fake/path",
+                "time": 1.0,
+            },
+            {
+                "id": "1-foo",
+                "job_id": JOB_ID,
+                "status": "running",
+                "type": "log",
+                "log": b"\x00binary\xff",
+                "time": 2.0,
+            },
+            {
+                "id": "1-foo",
+                "job_id": JOB_ID,
+                "status": "finished",
+                "result": "pass",
+                "time": 3.0,
+            },
+        ]
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _feed(self, data):
+        async def feed():
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            await self.status_server.cb(reader, None)
+
+        self.loop.run_until_complete(feed())
+
+    def _check_repo(self):
+        self.assertEqual(self.status_repo.get_task_status("1-foo"), "finished")
+        self.assertEqual(
+            self.status_repo.get_task_data("1-foo", 1)["log"], b"\x00binary\xff"
+        )
+        self.assertEqual(self.status_repo.result_stats, {"pass": 1})
+
+    def test_json_lines(self):
+        data = b"".join(
+            json_dumps(message).encode("ascii") + b"\n" for message in self.messages
+        )
+        self._feed(data)
+        self._check_repo()
+
+    def test_framed(self):
+        data = (
+            utils.STATUS_PROTOCOL_FRAMED_PREAMBLE
+            + utils.frame_encode(self.messages[:2])
+            + utils.frame_encode(self.messages[2:])
+        )
+        self._feed(data)
+        self._check_repo()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,3 +17,25 @@ class JSON(TestCase):
     def test_loads_base64(self):
         data = '{"__base64_encoded__": "dGhpcyBpcyBob3cgd2UgZW5jb2RlIGJ5dGVz"}'
         self.assertEqual(utils.json_loads(data), b"this is how we encode bytes")
+
+
+class Frame(TestCase):
+    def test_encode_decode(self):
+        messages = [
+            {"status": "running", "type": "log", "log": b"first\n"},
+            {"status": "running", "type": "stdout", "log": b"\x00\xffsecond"},
+            {"status": "finished", "result": "pass"},
+        ]
+        frame = utils.frame_encode(messages)
+        encoded_size, blobs_size = utils.FRAME_HEADER.unpack(
+            frame[: utils.FRAME_HEADER.size]
+        )
+        self.assertEqual(blobs_size, len(b"first\n\x00\xffsecond"))
+        body = frame[utils.FRAME_HEADER.size :]
+        self.assertEqual(len(body), encoded_size + blobs_size)
+        decoded = utils.frame_decode(body[:encoded_size], body[encoded_size:])
+        self.assertEqual(decoded, messages)
+
+    def test_decode_invalid(self):
+        with self.assertRaises(utils.StatusMsgInvalidJSONError):
+            utils.frame_decode(b"+-+-InvalidJSON-AFAICT-+-+", b"")
@@ -1,6 +1,7 @@
 import tempfile
 import unittest.mock
 
+from avocado.core import profiling
 from avocado.core.suite import TestSuite
 from avocado.utils import path as utils_path
 from selftests.utils import setup_avocado_loggers, temp_dir_prefix
@@ -57,6 +58,10 @@ class TestSuiteTest(unittest.TestCase):
 
         self.suite = TestSuite.from_config(config=config)
         self.assertEqual(1, self.suite.size)
+        self.assertIn(profiling.STAGE_RESOLVE, self.suite.profile.stages)
+        self.assertEqual(
+            [_[0] for _ in self.suite.profile.get_slowest_references()], tests
+        )
 
     def test_config_extend_manual(self):
         """Test extends config from job when using manual method."""
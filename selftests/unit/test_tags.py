@@ -302,6 +302,49 @@ class TagFilter(unittest.TestCase):
         )
         self.assertEqual(len(filtered), 0)
 
+    def test_index_reused(self):
+        fast = ["FastTest.test_fast", "FastTest.test_fast_other"]
+        slow = ["SlowTest.test_slow", "SlowUnsafeTest.test_slow_unsafe"]
+        safe = "SafeTest.test_safe"
+        x86 = "SafeX86Test.test_safe_x86"
+        empty = "NoTagsTest.test_no_tags"
+        aarch64 = "SafeAarch64Test.test_safe_aarch64"
+        # expected tests without and with include_empty_key, while
+        # include_empty adds the test with no tags in both cases
+        expected = (
+            (["fast,net"], fast, fast),
+            (["arch"], [x86, aarch64], [x86, aarch64]),
+            (["fast,net", "slow,disk"], fast + slow, fast + slow),
+            (["-fast,-slow"], [safe, x86, aarch64], [safe, x86, aarch64]),
+            (["safe,arch:-x86_64"], [aarch64], [safe, aarch64]),
+            (["arch:x86_64"], [x86], fast + slow + [safe, x86]),
+            (
+                ["-safe", "arch:aarch64"],
+                fast + slow + [aarch64],
+                fast + slow + [safe, aarch64],
+            ),
+            (["-fast,-slow,-safe"], [], []),
+        )
+        order = fast + slow + [safe, x86, empty, aarch64]
+        index = tags.TagIndex(self.result[0].resolutions)
+        for filter_by_tags, without_key, with_key in expected:
+            for include_empty_key, names in ((False, without_key), (True, with_key)):
+                for include_empty in (False, True):
+                    if include_empty:
+                        names = sorted(names + [empty], key=order.index)
+                    with self.subTest(
+                        filter_by_tags=filter_by_tags,
+                        include_empty=include_empty,
+                        include_empty_key=include_empty_key,
+                    ):
+                        filtered = index.filter(
+                            filter_by_tags, include_empty, include_empty_key
+                        )
+                        self.assertEqual(
+                            [runnable.uri for runnable in filtered],
+                            [f"{self.input_file_path}:{name}" for name in names],
+                        )
+
     def test_load_tags(self):
         tags_map = {
             "FastTest.test_fast": {"fast": None, "net": None},
@@ -0,0 +1,78 @@
+import os
+import unittest
+
+from avocado.core.task.parallelism import AdaptiveParallelism
+from selftests.utils import TestCaseTmpDir
+
+PRESSURE = """some avg10=12.50 avg60=3.00 avg300=1.00 total=123456
+full avg10=2.00 avg60=1.00 avg300=0.50 total=23456
+"""
+
+
+class Adjust(unittest.TestCase):
+    def setUp(self):
+        self.parallelism = AdaptiveParallelism(2, 8, initial=4)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            AdaptiveParallelism(0, 8)
+        with self.assertRaises(ValueError):
+            AdaptiveParallelism(4, 2)
+
+    def test_initial_clamped(self):
+        self.assertEqual(AdaptiveParallelism(2, 8, initial=16).limit, 8)
+        self.assertEqual(AdaptiveParallelism(2, 8, initial=1).limit, 2)
+
+    def test_underloaded(self):
+        for now in range(10):
+            self.parallelism.adjust(0.1, 0.0, now)
+        self.assertEqual(self.parallelism.limit, 8)
+
+    def test_overloaded_load(self):
+        self.assertTrue(self.parallelism.adjust(1.5, 0.0, 0))
+        self.assertEqual(self.parallelism.limit, 3)
+        # during the cooldown, the limit stays put
+        self.assertFalse(self.parallelism.adjust(1.5, 0.0, 1))
+        self.assertEqual(self.parallelism.limit, 3)
+        self.assertTrue(self.parallelism.adjust(1.5, 0.0, 10))
+        self.assertFalse(self.parallelism.adjust(1.5, 0.0, 20))
+        self.assertEqual(self.parallelism.limit, 2)
+
+    def test_overloaded_memory_pressure(self):
+        self.assertTrue(self.parallelism.adjust(0.1, 50.0, 0))
+        self.assertEqual(self.parallelism.limit, 3)
+
+    def test_between_thresholds(self):
+        self.assertFalse(self.parallelism.adjust(0.8, 0.0, 0))
+        self.assertFalse(self.parallelism.adjust(0.1, 5.0, 0))
+        self.assertEqual(self.parallelism.limit, 4)
+
+    def test_unknown(self):
+        self.assertFalse(self.parallelism.adjust(None, None, 0))
+        self.assertTrue(self.parallelism.adjust(None, 0.0, 0))
+        self.assertEqual(self.parallelism.limit, 5)
+
+    def test_slow_spawn(self):
+        self.parallelism.record_spawn_latency(0.05)
+        self.assertTrue(self.parallelism.adjust(0.1, 0.0, 0))
+        self.assertEqual(self.parallelism.limit, 5)
+        for _ in range(5):
+            self.parallelism.record_spawn_latency(1.0)
+        self.assertTrue(self.parallelism.adjust(0.1, 0.0, 10))
+        self.assertEqual(self.parallelism.limit, 4)
+
+
+class ReadMemoryPressure(TestCaseTmpDir):
+    def test_read(self):
+        path = os.path.join(self.tmpdir.name, "memory")
+        with open(path, "w", encoding="utf-8") as pressure:
+            pressure.write(PRESSURE)
+        self.assertEqual(AdaptiveParallelism.read_memory_pressure(path), 12.5)
+
+    def test_missing(self):
+        path = os.path.join(self.tmpdir.name, "missing")
+        self.assertIsNone(AdaptiveParallelism.read_memory_pressure(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,11 @@ from unittest import TestCase
 from avocado.core.nrunner.runnable import Runnable
 from avocado.core.nrunner.task import Task
 from avocado.core.suite import TestSuite
-from avocado.core.task.runtime import RuntimeTask, RuntimeTaskGraph
+from avocado.core.task.runtime import (
+    RuntimeTask,
+    RuntimeTaskGraph,
+    iter_runtime_tasks,
+)
 from avocado.utils import script
 from selftests.utils import TestCaseTmpDir
 
@@ -90,3 +94,32 @@ class DependencyGraph(TestCaseTmpDir):
             self.assertTrue(runtime_tests[3].task.identifier.name.endswith("hello"))
             self.assertTrue(runtime_tests[4].task.identifier.name.endswith("-foo-bar-"))
             self.assertTrue(runtime_tests[5].task.identifier.name.endswith("test_c"))
+            # the requirements are chained, so each task waits on one
+            self.assertEqual(runtime_tests[5].pending_dependencies, 1)
+            self.assertEqual(runtime_tests[4].pending_dependencies, 1)
+            self.assertEqual(runtime_tests[3].pending_dependencies, 0)
+            self.assertEqual(runtime_tests[3].dependents, [runtime_tests[4]])
+            self.assertEqual(runtime_tests[4].dependents, [runtime_tests[5]])
+
+    def test_lazy_tasks(self):
+        with script.Script(
+            os.path.join(self.tmpdir.name, "test_multiple_dependencies.py"),
+            MULTIPLE_REQUIREMENT,
+        ) as test:
+            config = {"resolver.references": [test.path]}
+            suite = TestSuite.from_config(config=config)
+            graph = RuntimeTaskGraph(suite.get_test_variants(), suite.name, 1, "")
+            expected = graph.get_tasks_in_topological_order()
+            total = suite.variants.get_number_of_tests(suite.tests)
+            self.assertEqual(total, len(suite.get_test_variants()))
+            runtime_tasks = list(
+                iter_runtime_tasks(suite.iter_test_variants(), total, suite.name, 1, "")
+            )
+            self.assertEqual(
+                [str(rt.task.identifier) for rt in runtime_tasks],
+                [str(rt.task.identifier) for rt in expected],
+            )
+            self.assertEqual(
+                [len(rt.dependencies) for rt in runtime_tasks],
+                [len(rt.dependencies) for rt in expected],
+            )
@@ -0,0 +1,245 @@
+import asyncio
+import time
+import unittest
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.task import Task
+from avocado.core.spawners.mock import MockSpawner
+from avocado.core.status.repo import StatusRepo
+from avocado.core.task.parallelism import AdaptiveParallelism
+from avocado.core.task.runtime import RuntimeTask, RuntimeTaskStatus
+from avocado.core.task.statemachine import TaskStateMachine, Worker
+
+
+class InstantSpawner(MockSpawner):
+    """Spawner whose tasks report themselves as finished right away."""
+
+    def __init__(self, status_repo):
+        super().__init__()
+        self._status_repo = status_repo
+
+    def is_task_alive(self, runtime_task):
+        return False
+
+    async def spawn_task(self, runtime_task):
+        task_id = str(runtime_task.task.identifier)
+        for message in (
+            {"status": "started", "output_dir": "/dev/null"},
+            {"status": "finished", "result": "pass"},
+        ):
+            message.update({"id": task_id, "job_id": "job", "time": time.monotonic()})
+            self._status_repo.process_message(message)
+        return True
+
+
+class SleepingSpawner(InstantSpawner):
+    """Spawner whose tasks run for a while, keeping track of parallelism."""
+
+    def __init__(self, status_repo):
+        super().__init__(status_repo)
+        self.running = 0
+        self.max_running = 0
+
+    def is_task_alive(self, runtime_task):
+        return True
+
+    async def spawn_task(self, runtime_task):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # other workers get to start tasks while this one is spawned
+        await asyncio.sleep(0)
+        return True
+
+    async def wait_task(self, runtime_task):
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        await super().spawn_task(runtime_task)
+
+
+class StateMachine(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    @staticmethod
+    def _create_tasks(number_of_tasks):
+        runnable = Runnable("noop", "noop")
+        return [
+            RuntimeTask(Task(runnable, str(index)))
+            for index in range(1, number_of_tasks + 1)
+        ]
+
+    @staticmethod
+    async def _run_workers(runtime_tasks, number_of_workers, task_source=None):
+        status_repo = StatusRepo("job")
+        spawner = InstantSpawner(status_repo)
+        state_machine = TaskStateMachine(runtime_tasks, status_repo, task_source)
+        workers = [
+            Worker(state_machine, spawner, max_running=number_of_workers).run()
+            for _ in range(number_of_workers)
+        ]
+        await asyncio.gather(*workers)
+        return state_machine
+
+    def test_all_finished(self):
+        runtime_tasks = self._create_tasks(50)
+        state_machine = self.loop.run_until_complete(
+            self._run_workers(runtime_tasks, 4)
+        )
+        self.assertEqual(len(state_machine.finished), 50)
+        for runtime_task in state_machine.finished:
+            self.assertEqual(runtime_task.status, RuntimeTaskStatus.FINISHED)
+            self.assertEqual(runtime_task.result, "pass")
+
+    def test_dependency_chain(self):
+        runtime_tasks = self._create_tasks(30)
+        for dependency, runtime_task in zip(runtime_tasks, runtime_tasks[1:]):
+            runtime_task.add_dependency(dependency)
+        # the dependents come first, so they have to wait on the
+        # dependencies being finished
+        runtime_tasks.reverse()
+        start = time.monotonic()
+        state_machine = self.loop.run_until_complete(
+            self._run_workers(runtime_tasks, 2)
+        )
+        # a polling scheduler would take at least 0.1s per level
+        self.assertLess(time.monotonic() - start, 3)
+        finished = [rt.task.identifier for rt in state_machine.finished]
+        self.assertEqual(finished, [str(index) for index in range(1, 31)])
+        self.assertFalse(state_machine.waiting)
+
+    def test_failed_dependency(self):
+        runtime_tasks = self._create_tasks(2)
+        runtime_tasks[1].status = RuntimeTaskStatus.FAIL_START
+        runtime_tasks[1].result = "fail"
+        runtime_tasks[0].add_dependency(runtime_tasks[1])
+        state_machine = self.loop.run_until_complete(
+            self._run_workers(runtime_tasks[:1], 1)
+        )
+        self.assertEqual(
+            state_machine.finished[0].status, RuntimeTaskStatus.FAIL_TRIAGE
+        )
+
+    def test_fan_out(self):
+        runtime_tasks = self._create_tasks(21)
+        dependency = runtime_tasks[-1]
+        for runtime_task in runtime_tasks[:-1]:
+            runtime_task.add_dependency(dependency)
+        self.assertEqual(len(dependency.dependents), 20)
+        state_machine = self.loop.run_until_complete(
+            self._run_workers(runtime_tasks, 4)
+        )
+        self.assertIs(state_machine.finished[0], dependency)
+        self.assertEqual(len(state_machine.finished), 21)
+        for runtime_task in runtime_tasks:
+            self.assertEqual(runtime_task.pending_dependencies, 0)
+
+    def test_adaptive_parallelism(self):
+        async def run():
+            runtime_tasks = self._create_tasks(12)
+            status_repo = StatusRepo("job")
+            spawner = SleepingSpawner(status_repo)
+            state_machine = TaskStateMachine(runtime_tasks, status_repo)
+            parallelism = AdaptiveParallelism(2, 6, initial=2)
+            workers = [
+                Worker(
+                    state_machine, spawner, max_running=6, parallelism=parallelism
+                ).run()
+                for _ in range(6)
+            ]
+            await asyncio.gather(*workers)
+            return state_machine, spawner
+
+        state_machine, spawner = self.loop.run_until_complete(run())
+        self.assertEqual(len(state_machine.finished), 12)
+        self.assertEqual(spawner.max_running, 2)
+
+    def test_task_source(self):
+        async def run():
+            runtime_tasks = self._create_tasks(20)
+            taken = []
+
+            def source():
+                for runtime_task in runtime_tasks[2:]:
+                    # tasks are taken only as there's room to triage them
+                    self.assertLessEqual(len(taken) - len(state_machine.finished), 3)
+                    taken.append(runtime_task)
+                    yield runtime_task
+
+            status_repo = StatusRepo("job")
+            state_machine = TaskStateMachine(runtime_tasks[:2], status_repo, source())
+            spawner = InstantSpawner(status_repo)
+            workers = [
+                Worker(state_machine, spawner, max_triaging=1, max_running=2).run()
+                for _ in range(2)
+            ]
+            await asyncio.gather(*workers)
+            return state_machine
+
+        state_machine = self.loop.run_until_complete(run())
+        self.assertEqual(
+            [rt.task.identifier for rt in state_machine.finished],
+            [str(index) for index in range(1, 21)],
+        )
+
+    def test_task_source_empty(self):
+        state_machine = self.loop.run_until_complete(self._run_workers([], 2, iter([])))
+        self.assertEqual(state_machine.finished, [])
+
+    def test_abort_task_source(self):
+        async def abort():
+            runtime_tasks = self._create_tasks(4)
+            state_machine = TaskStateMachine(
+                runtime_tasks[:1], StatusRepo("job"), iter(runtime_tasks[1:])
+            )
+            self.assertFalse(await state_machine.complete)
+            await state_machine.abort(RuntimeTaskStatus.FAILFAST)
+            self.assertTrue(await state_machine.complete)
+            return state_machine
+
+        state_machine = self.loop.run_until_complete(abort())
+        self.assertEqual(len(state_machine.finished), 1)
+
+    def test_abort(self):
+        async def abort():
+            runtime_tasks = self._create_tasks(4)
+            state_machine = TaskStateMachine(runtime_tasks, StatusRepo("job"))
+            state_machine.triaging.append(state_machine.requested.popleft())
+            state_machine.ready.append(state_machine.requested.popleft())
+            state_machine.waiting[state_machine.requested.popleft()] = None
+            await state_machine.abort(RuntimeTaskStatus.FAILFAST)
+            # finishing a task twice is a no-op
+            await state_machine.finish_task(runtime_tasks[0])
+            self.assertTrue(await state_machine.complete)
+            return state_machine
+
+        state_machine = self.loop.run_until_complete(abort())
+        self.assertEqual(len(state_machine.finished), 4)
+        for runtime_task in state_machine.finished:
+            self.assertEqual(runtime_task.status, RuntimeTaskStatus.FAILFAST)
+
+    def test_triage_later(self):
+        async def triage_later():
+            runtime_tasks = self._create_tasks(2)
+            state_machine = TaskStateMachine([], StatusRepo("job"))
+            for runtime_task in runtime_tasks:
+                state_machine.waiting[runtime_task] = None
+            state_machine.schedule_triage_later(runtime_tasks[0], 0)
+            state_machine.schedule_triage_later(runtime_tasks[1], 60)
+            await asyncio.sleep(0.01)
+            self.assertEqual(list(state_machine.triaging), runtime_tasks[:1])
+            self.assertEqual(list(state_machine.waiting), runtime_tasks[1:])
+            self.assertEqual(len(state_machine._delayed_triages), 1)
+            state_machine.cancel_delayed_triages()
+            await asyncio.sleep(0.01)
+            self.assertEqual(len(state_machine._delayed_triages), 0)
+            self.assertEqual(list(state_machine.waiting), runtime_tasks[1:])
+
+        self.loop.run_until_complete(triage_later())
+
+
+if __name__ == "__main__":
+    unittest.main()
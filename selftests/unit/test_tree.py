@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from avocado.core import tree
@@ -71,3 +73,57 @@ class TreeNode(unittest.TestCase):
         self.assertTrue(tree.TreeNode().is_leaf)
         self.assertTrue(tree.TreeNode(value={"foo": "bar"}).is_leaf)
         self.assertFalse(tree.TreeNode(children=[tree.TreeNode()]).is_leaf)
+
+    def test_path_renamed(self):
+        root = tree.TreeNode()
+        leaf = root.get_node("/foo/bar/baz", True)
+        self.assertEqual(leaf.path, "/foo/bar/baz")
+        root.get_node("/foo/bar").name = "qux"
+        self.assertEqual(leaf.path, "/foo/qux/baz")
+        self.assertIs(root.get_node("/foo/qux/baz"), leaf)
+        self.assertRaises(ValueError, root.get_node, "/foo/bar")
+
+    def test_path_reparented(self):
+        root = tree.TreeNode()
+        leaf = root.get_node("/foo/bar", True)
+        self.assertEqual(leaf.path, "/foo/bar")
+        other = tree.TreeNode()
+        other.get_node("/baz", True).add_child(root.get_node("/foo").detach())
+        self.assertEqual(leaf.path, "/baz/foo/bar")
+        self.assertEqual(leaf.get_path(":"), ":baz:foo:bar")
+        self.assertRaises(ValueError, root.get_node, "/foo")
+
+    def test_environment_reparented(self):
+        leaf = tree.TreeNode("bar")
+        tree.TreeNode("foo", value={"key": "foo"}, children=[leaf])
+        self.assertEqual(leaf.environment["key"], "foo")
+        tree.TreeNode("baz", value={"key": "baz"}).add_child(leaf.detach())
+        self.assertEqual(leaf.environment["key"], "baz")
+
+    def test_children_changed(self):
+        huey = tree.TreeNode(name="Huey")
+        dewey = tree.TreeNode(name="Dewey")
+        scrooge = tree.TreeNode(name="Scrooge", children=[huey, dewey])
+        scrooge.children.remove(huey)
+        scrooge.add_child(tree.TreeNode(name="Huey", value={"hat": "red"}))
+        self.assertEqual(len(scrooge.children), 2)
+        self.assertEqual(scrooge.get_node("Huey").value, {"hat": "red"})
+        scrooge.add_child(tree.TreeNode(name="Dewey", value={"hat": "blue"}))
+        self.assertEqual(len(scrooge.children), 2)
+        self.assertEqual(dewey.value, {"hat": "blue"})
+
+    def test_copy_leaf(self):
+        root = tree.TreeNode(value={"key": "root"})
+        leaf = root.get_node("/run/foo/leaf", True)
+        leaf.parent.value = {"key": "foo"}
+        root.get_node("/run/bar/leaf", True)
+        # the children of the nodes are indexed by name
+        self.assertIs(root.get_node("/run/foo/leaf"), leaf)
+        for other in (copy.deepcopy(leaf), pickle.loads(pickle.dumps(leaf))):
+            self.assertIsNot(other, leaf)
+            self.assertEqual(other.path, "/run/foo/leaf")
+            self.assertEqual(other.environment["key"], "foo")
+            other_root = other.root
+            self.assertEqual(other_root.value, {"key": "root"})
+            self.assertIs(other_root.get_node("/run/foo/leaf"), other)
+            self.assertEqual(other_root.get_node("/run/bar/leaf").path, "/run/bar/leaf")
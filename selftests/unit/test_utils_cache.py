@@ -0,0 +1,68 @@
+import os
+import time
+import unittest.mock
+
+from avocado.core.utils import cache
+from selftests.utils import TestCaseTmpDir
+
+
+class Cache(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = os.path.join(self.tmpdir.name, "cache")
+
+    def _path(self, name):
+        return os.path.join(self.cache_dir, name)
+
+    def test_save_load(self):
+        self.assertIsNone(cache.load(self._path("entry")))
+        cache.save(self._path("entry"), {"key": [1, 2]})
+        self.assertEqual(cache.load(self._path("entry"))["key"], [1, 2])
+        self.assertEqual(os.listdir(self.cache_dir), ["entry"])
+
+    def test_invalid(self):
+        cache.save(self._path("entry"), {"key": "value"})
+        with unittest.mock.patch("avocado.core.utils.cache.VERSION", "0.0"):
+            self.assertIsNone(cache.load(self._path("entry")))
+        with open(self._path("entry"), "w", encoding="utf-8") as cache_file:
+            cache_file.write("[")
+        self.assertIsNone(cache.load(self._path("entry")))
+
+    def test_save_failure(self):
+        cache.save(self._path("entry"), {"key": "old"})
+        with unittest.mock.patch(
+            "os.replace", side_effect=OSError("replace")
+        ), unittest.mock.patch("os.unlink", side_effect=OSError("unlink")):
+            with self.assertRaisesRegex(OSError, "replace"):
+                cache.save(self._path("entry"), {"key": "new"})
+        self.assertEqual(cache.load(self._path("entry"))["key"], "old")
+
+    def test_prune(self):
+        for name in ("old", "used", "recent"):
+            cache.save(self._path(name), {})
+        now = time.time()
+        os.utime(self._path("old"), (now - 120, now - 120))
+        os.utime(self._path("used"), (now - 30, now - 30))
+        cache.touch(self._path("used"))
+        os.utime(self._path("recent"), (now - 10, now - 10))
+        cache.prune(self.cache_dir, max_entries=10, max_age=60)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["recent", "used"])
+        cache.prune(self.cache_dir, max_entries=1, max_age=60)
+        self.assertEqual(os.listdir(self.cache_dir), ["used"])
+        cache.prune(os.path.join(self.tmpdir.name, "missing"), 1, 60)
+
+    def test_iter_entries_clear(self):
+        self.assertEqual(list(cache.iter_entries(self.cache_dir)), [])
+        cache.save(self._path("first"), {"key": 1})
+        cache.save(self._path("second"), {"key": 2})
+        with open(self._path(".partial"), "w", encoding="utf-8") as cache_file:
+            cache_file.write("{")
+        self.assertEqual(
+            sorted(data["key"] for data in cache.iter_entries(self.cache_dir)), [1, 2]
+        )
+        cache.clear(self.cache_dir)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import unittest
+
+from avocado.utils import inotify
+from selftests.utils import TestCaseTmpDir
+
+
+@unittest.skipUnless(inotify.is_supported(), "inotify is not supported")
+class Inotify(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.inotify = inotify.Inotify()
+        self.addCleanup(self.inotify.close)
+        self.inotify.add_watch(
+            self.tmpdir.name,
+            inotify.IN_CREATE | inotify.IN_DELETE | inotify.IN_CLOSE_WRITE,
+        )
+
+    def test_events(self):
+        path = os.path.join(self.tmpdir.name, "file")
+        with open(path, "w", encoding="utf-8") as new_file:
+            new_file.write("content")
+        os.mkdir(os.path.join(self.tmpdir.name, "dir"))
+        os.unlink(path)
+        events = self.inotify.read_events(1)
+        self.assertEqual(
+            [(event.path, event.mask, event.name) for event in events],
+            [
+                (self.tmpdir.name, inotify.IN_CREATE, "file"),
+                (self.tmpdir.name, inotify.IN_CLOSE_WRITE, "file"),
+                (self.tmpdir.name, inotify.IN_CREATE | inotify.IN_ISDIR, "dir"),
+                (self.tmpdir.name, inotify.IN_DELETE, "file"),
+            ],
+        )
+
+    def test_timeout(self):
+        self.assertEqual(self.inotify.read_events(0), [])
+
+    def test_watch_removed(self):
+        self.assertEqual(self.inotify.paths, {self.tmpdir.name})
+        subdir = os.path.join(self.tmpdir.name, "subdir")
+        os.mkdir(subdir)
+        self.inotify.add_watch(subdir, inotify.IN_CREATE)
+        os.rmdir(subdir)
+        events = self.inotify.read_events(1)
+        self.assertIn(inotify.IN_IGNORED, [event.mask for event in events])
+        self.assertEqual(self.inotify.paths, {self.tmpdir.name})
+        self.inotify.remove_watch(self.tmpdir.name)
+        self.assertEqual(self.inotify.paths, set())
+
+    def test_watch_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            self.inotify.add_watch(os.path.join(self.tmpdir.name, "missing"), 0xFFF)
+
+
+if __name__ == "__main__":
+    unittest.main()
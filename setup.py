@@ -366,6 +366,7 @@ if __name__ == "__main__":
                 "json_variants = avocado.plugins.json_variants:JsonVariantsInit",
                 "run = avocado.plugins.run:RunInit",
                 "podman = avocado.plugins.spawners.podman:PodmanSpawnerInit",
+                "process = avocado.plugins.spawners.process:ProcessSpawnerInit",
                 "nrunner = avocado.plugins.runner_nrunner:RunnerInit",
                 "testlogsui = avocado.plugins.testlogs:TestLogsUIInit",
                 "human = avocado.plugins.human:HumanInit",
@@ -379,6 +380,7 @@ if __name__ == "__main__":
                 "json_variants = avocado.plugins.json_variants:JsonVariantsCLI",
                 "nrunner = avocado.plugins.runner_nrunner:RunnerCLI",
                 "podman = avocado.plugins.spawners.podman:PodmanCLI",
+                "process = avocado.plugins.spawners.process:ProcessCLI",
             ],
             "avocado.plugins.cli.cmd": [
                 "config = avocado.plugins.config:Config",
@@ -454,6 +456,7 @@ if __name__ == "__main__":
             ],
             "avocado.plugins.cache": [
                 "requirement = avocado.plugins.requirement_cache:RequirementCache",
+                "safeloader = avocado.plugins.safeloader_cache:SafeloaderCache",
             ],
         },
         zip_safe=False,